@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import networkx as nx
+
+from build_graph import build_graph, build_table_graph
+from column_retriever import load_retriever
+from column_stats import refresh_column_stats
+from csr_graph import CSRGraph, node_id
+from cost_gate import LocalDryRun
+from executors import StaticExecutor, make_executor
+from find_shortest_path import (
+    _k_shortest_paths,
+    find_k_shortest_paths,
+    find_shortest_path,
+    find_shortest_paths,
+    load_graph,
+)
+from join_costs import CostWeightedPaths, load_table_stats
+from path_cache import PathCache
+from path_table import all_pairs_predecessors, batch_shortest_paths, save_predecessors
+from prompts import (
+    column_selection_messages,
+    count_tokens,
+    full_schema_sql_messages,
+    path_sql_messages,
+)
+from result_cache import CachedExecutor, ResultCache, fingerprint
+from schema_catalog import SCHEMA_PATH, SchemaCatalog, load_catalog
+from schema_model import as_tables
+from schema_parser import iter_schema, parse_schema
+from schema_snapshot import load_snapshot, write_snapshot
+from sql_cache import VolumeSync
+from sql_compiler import compile_path
+from table_graph import TableGraph
+
+SAMPLE_QUESTIONS = [
+    ("What is the correlation between ALogP and black box warning?", "ALOGP", "BLACK_BOX_WARNING"),
+    ("Which target types do the molecules act on?", "MOLREGNO", "TARGET_TYPE"),
+    ("List the preferred names of compounds with a standard value", "STANDARD_VALUE", "PREF_NAME"),
+    ("How does the organism relate to pChEMBL value?", "ORGANISM", "PCHEMBL_VALUE"),
+    ("Do withdrawn drugs have a higher molecular weight?", "WITHDRAWN_FLAG", "FULL_MWT"),
+]
+
+
+def report(name, seconds, number):
+    print(f"{name:<40} {seconds / number * 1e6:10.2f} us/call")
+
+
+def bench_catalog(number=200):
+    with open(SCHEMA_PATH, "r") as f:
+        schema = json.load(f)
+
+    # The old answer() re-executed the schema as a list literal on every call;
+    # compiling its repr reproduces that allocation pattern.
+    literal = compile(repr(schema), "<json_objects>", "eval")
+    column_names = sorted({c["ColumnName"] for t in schema for c in t["Columns"]})
+    tables = ["ACTIVITIES", "COMPOUND_PROPERTIES", "DRUG_WARNING", "VERSION"]
+
+    def old_call():
+        json_objects = eval(literal)
+        columns = ",".join(column_names)
+        for node in tables:
+            next(t for t in json_objects if t["TableName"].upper() == node)
+        return columns
+
+    def new_call():
+        catalog = load_catalog()
+        columns = catalog.columns_csv
+        for node in tables:
+            catalog.table(node)
+        return columns
+
+    load_catalog()
+    old = timeit.timeit(old_call, number=number)
+    new = timeit.timeit(new_call, number=number)
+    report("inline literal + linear scan", old, number)
+    report("SchemaCatalog (loaded once)", new, number)
+    print(f"per-call saving: {(old - new) / number * 1e6:.2f} us ({old / new:.0f}x)")
+
+
+def bench_prompt_tokens(hops=(0, 1)):
+    catalog = load_catalog()
+    graph = load_graph()
+    header = f"{'question':<62} {'full':>7}" + "".join(f" {f'hops={k}':>7}" for k in hops)
+    print(header)
+    for question, start, end in SAMPLE_QUESTIONS:
+        full = count_tokens(full_schema_sql_messages([start, end], catalog.schema))
+        path = find_shortest_path(graph, start, end, catalog)
+        pruned = [
+            count_tokens(path_sql_messages(start, end, path, catalog, k)) if path else full
+            for k in hops
+        ]
+        print(f"{question[:62]:<62} {full:>7}" + "".join(f" {n:>7}" for n in pruned))
+
+
+def bench_retriever(number=1000, k=20):
+    catalog = load_catalog()
+    retriever = load_retriever(catalog=catalog)
+    full = count_tokens(column_selection_messages("", catalog.columns_csv))
+    print(f"{'question':<62} {'us':>7} {'skip':>5} {'tokens':>7}")
+    for question, start, end in SAMPLE_QUESTIONS:
+        seconds = timeit.timeit(lambda: retriever.select(question, k), number=number)
+        columns, candidates = retriever.select(question, k)
+        if columns:
+            tokens = 0
+            hit = columns[:2] == [start, end]
+        else:
+            tokens = count_tokens(column_selection_messages(question, catalog.columns_csv, candidates))
+            hit = start in candidates and end in candidates
+        print(
+            f"{question[:62]:<62} {seconds / number * 1e6:>7.1f} {'yes' if columns else 'no':>5} "
+            f"{tokens:>7}{'' if hit else '  (miss)'}"
+        )
+    print(f"full column list prompt: {full} tokens")
+
+
+def column_pairs(names, count, seed=0):
+    import random
+
+    rng = random.Random(seed)
+    return [tuple(rng.sample(names, 2)) for _ in range(count)]
+
+
+def bench_graph(number=50, queries=2000):
+    catalog = load_catalog()
+    graph = build_graph(catalog.schema)
+    with tempfile.TemporaryDirectory() as tmp:
+        pkl_path = os.path.join(tmp, "schema_graph.pkl")
+        csr_path = os.path.join(tmp, "schema_graph")
+        with open(pkl_path, "wb") as f:
+            pickle.dump(graph, f)
+        CSRGraph.from_networkx(graph).save(csr_path)
+
+        def load_pickle():
+            with open(pkl_path, "rb") as f:
+                return pickle.load(f)
+
+        report("load: pickle.load(nx.Graph)", timeit.timeit(load_pickle, number=number), number)
+        report("load: CSRGraph (mmap)", timeit.timeit(lambda: CSRGraph.load(csr_path), number=number), number)
+
+        nx_graph, csr = load_pickle(), CSRGraph.load(csr_path)
+        pairs = column_pairs(catalog.column_names, queries)
+
+        def nx_queries():
+            for start, end in pairs:
+                try:
+                    nx.shortest_path(nx_graph, node_id(start), node_id(end))
+                except nx.NetworkXNoPath:
+                    pass
+
+        def csr_queries():
+            for start, end in pairs:
+                csr.shortest_path(start, end)
+
+        report("query: nx.shortest_path", timeit.timeit(nx_queries, number=1), queries)
+        report("query: CSR bidirectional BFS", timeit.timeit(csr_queries, number=1), queries)
+
+        save_predecessors(all_pairs_predecessors(csr), csr_path)
+        csr = CSRGraph.load(csr_path)
+        report("query: predecessor table walk", timeit.timeit(csr_queries, number=1), queries)
+
+
+def bench_result_cache(number=200, rows=1000):
+    import pandas as pd
+
+    query = (
+        "SELECT cp.alogp, md.black_box_warning "
+        "FROM `bigquery-public-data.ebi_chembl.compound_properties` cp "
+        "JOIN `bigquery-public-data.ebi_chembl.molecule_dictionary` md ON cp.molregno = md.molregno "
+        "LIMIT 10"
+    )
+    variant = query.lower().replace("cp", "a").replace("md", "b").replace(" = ", "=")
+    frame = pd.DataFrame({"alogp": [float(i) for i in range(rows)], "black_box_warning": [0] * rows})
+    stand_in = StaticExecutor(default=frame)
+    with tempfile.TemporaryDirectory() as tmp:
+        executor = CachedExecutor(stand_in, ResultCache(tmp, release="bench"))
+        executor.run(query)
+        report("fingerprint (first sight, sqlglot parse)", timeit.timeit(lambda: fingerprint.__wrapped__(query), number=number), number)
+        report("fingerprint (memoized)", timeit.timeit(lambda: fingerprint(query), number=number), number)
+        report("cached run (alias-renamed variant)", timeit.timeit(lambda: executor.run(variant), number=number), number)
+        print(f"executor calls: {stand_in.calls}, cache: {executor.cache.stats()}")
+
+
+def bench_compiler(number=2000):
+    catalog = load_catalog()
+    graph = load_graph()
+    print(f"{'question':<62} {'us':>7} {'compiled':>9}")
+    for question, start, end in SAMPLE_QUESTIONS:
+        path = find_shortest_path(graph, start, end, catalog)
+        seconds = timeit.timeit(lambda: compile_path(path, catalog), number=number)
+        compiled = compile_path(path, catalog) is not None
+        print(f"{question[:62]:<62} {seconds / number * 1e6:>7.1f} {'yes' if compiled else 'no':>9}")
+
+
+def bench_join_costs(queries=500):
+    catalog = load_catalog()
+    graph = load_graph()
+    row_counts = load_table_stats()
+    if not row_counts:
+        print("table_stats.json is empty; every table counts as the default size")
+    weighted = CostWeightedPaths(graph, catalog, row_counts)
+    estimator = LocalDryRun(catalog, row_counts)
+
+    def scanned(path):
+        query = compile_path(path, catalog)
+        return estimator.estimate(query).bytes_processed if query else None
+
+    totals = {"hops": 0, "cost": 0}
+    compiled = {"hops": 0, "cost": 0}
+    both = 0
+    for start, end in column_pairs(catalog.column_names, queries):
+        hops = scanned(find_shortest_path(graph, start, end, catalog))
+        cost = scanned(find_shortest_path(weighted, start, end, catalog))
+        compiled["hops"] += hops is not None
+        compiled["cost"] += cost is not None
+        if hops is not None and cost is not None:
+            both += 1
+            totals["hops"] += hops
+            totals["cost"] += cost
+    print(f"compiled paths out of {queries}: hop count {compiled['hops']}, cost-weighted {compiled['cost']}")
+    if both:
+        print(f"mean estimated bytes over {both} pairs compiled both ways: "
+              f"hop count {totals['hops'] / both / 1e6:.1f} MB, cost-weighted {totals['cost'] / both / 1e6:.1f} MB")
+
+    pairs = column_pairs(catalog.column_names, 2000, seed=1)
+    weighted.predecessors_from.cache_clear()
+    report("query: Dijkstra (cold)", timeit.timeit(lambda: [weighted.shortest_path(*p) for p in pairs], number=1), len(pairs))
+    report("query: Dijkstra (memoized)", timeit.timeit(lambda: [weighted.shortest_path(*p) for p in pairs], number=1), len(pairs))
+
+
+def bench_column_stats(queries=500):
+    # Everything here runs on the synthetic stand-in dataset
+    catalog = load_catalog()
+    executor = make_executor("standin", catalog=catalog)
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "column_stats.json")
+        for workers in (1, 8):
+            seconds = timeit.timeit(
+                lambda: refresh_column_stats(executor, "duckdb", catalog, file_path, workers=workers), number=1
+            )
+            print(f"{'refresh, ' + str(workers) + ' workers':<40} {seconds * 1e3:10.1f} ms for {len(catalog)} tables")
+        stats = refresh_column_stats(executor, "duckdb", catalog, file_path)
+
+    graph = load_graph()
+    estimator = LocalDryRun(catalog, stats.row_counts, column_stats=stats)
+    graphs = {
+        "key types": CostWeightedPaths(graph, catalog, stats.row_counts),
+        "column stats": CostWeightedPaths(graph, catalog, stats.row_counts, stats),
+    }
+    for name, weighted in graphs.items():
+        compiled, total = 0, 0
+        for start, end in column_pairs(catalog.column_names, queries):
+            query = compile_path(find_shortest_path(weighted, start, end, catalog), catalog)
+            if query:
+                compiled += 1
+                total += estimator.estimate(query).bytes_processed
+        print(f"{name:<40} {compiled}/{queries} compile, mean estimate {total / max(compiled, 1) / 1e3:.1f} KB")
+
+    for _, start, end in SAMPLE_QUESTIONS[:2]:
+        path = find_shortest_path(graph, start, end, catalog)
+        plain = count_tokens(path_sql_messages(start, end, path, catalog))
+        hinted = count_tokens(path_sql_messages(start, end, path, catalog, stats=stats))
+        print(f"prompt tokens {start}->{end}: {plain} plain, {hinted} with stats hints")
+
+
+def bench_k_paths(k=3, queries=200):
+    catalog = load_catalog()
+    graph = CostWeightedPaths(load_graph(), catalog)
+    pairs = column_pairs(catalog.column_names, queries, seed=2)
+
+    def all_pairs():
+        for start, end in pairs:
+            find_k_shortest_paths(graph, start, end, k)
+
+    _k_shortest_paths.cache_clear()
+    report(f"k={k} paths: Yen (cold)", timeit.timeit(all_pairs, number=1), queries)
+    report(f"k={k} paths: memoized", timeit.timeit(all_pairs, number=1), queries)
+    found = [len(find_k_shortest_paths(graph, start, end, k)) for start, end in pairs]
+    print(f"pairs with at least one alternative: {sum(n > 1 for n in found)}/{queries}")
+
+
+def directory_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory))
+
+
+def bench_table_graph(number=50, queries=2000):
+    catalog = load_catalog()
+    with tempfile.TemporaryDirectory() as tmp:
+        bipartite_path = os.path.join(tmp, "schema_graph")
+        table_path = os.path.join(tmp, "schema_table_graph")
+        bipartite = CSRGraph.from_networkx(build_graph(catalog.schema))
+        bipartite.save(bipartite_path)
+        save_predecessors(all_pairs_predecessors(bipartite), bipartite_path)
+        TableGraph.from_networkx(build_table_graph(catalog.schema), catalog).save(table_path)
+
+        for name, path, cls in (("bipartite", bipartite_path, CSRGraph), ("table", table_path, TableGraph)):
+            graph = cls.load(path)
+            print(f"{name}: {len(graph)} nodes, {len(graph.neighbors) // 2} edges, "
+                  f"{directory_size(path) / 1024:.1f} KiB on disk")
+            report(f"load: {name}", timeit.timeit(lambda: cls.load(path), number=number), number)
+            pairs = column_pairs(catalog.column_names, queries)
+            # The table graph builds its hop table on the first lookup
+            report(f"first query: {name}", timeit.timeit(lambda: graph.shortest_path(*pairs[0]), number=1), 1)
+            report(
+                f"query: {name}",
+                timeit.timeit(lambda: [graph.shortest_path(a, b) for a, b in pairs], number=1),
+                queries,
+            )
+            paths = [graph.shortest_path(a, b) for a, b in pairs[:500]]
+            compiled = sum(compile_path(p, catalog) is not None for p in paths if p)
+            print(f"{name}: {compiled}/500 paths compile to SQL")
+
+
+def bench_batch_paths(queries=10_000):
+    import numpy as np
+
+    catalog = load_catalog()
+    graph = load_graph()
+    nx_graph = build_graph(catalog.schema)
+    pairs = column_pairs(catalog.column_names, queries)
+    sources = np.array([graph.index[node_id(a)] for a, _ in pairs])
+    targets = np.array([graph.index[node_id(b)] for _, b in pairs])
+
+    def nx_loop():
+        for start, end in pairs:
+            find_shortest_path(nx_graph, start, end)
+
+    def csr_loop():
+        for start, end in pairs:
+            graph.shortest_path(start, end)
+
+    predecessors = graph.predecessors
+    graph.predecessors = None
+    batch_shortest_paths(graph, sources[:1], targets[:1])  # keep the scipy import out of the timing
+    report("per-pair loop: networkx", timeit.timeit(nx_loop, number=1), queries)
+    report("per-pair loop: CSR BFS", timeit.timeit(csr_loop, number=1), queries)
+    report("batch: csgraph", timeit.timeit(lambda: batch_shortest_paths(graph, sources, targets), number=1), queries)
+    graph.predecessors = predecessors
+    report("batch: predecessor table", timeit.timeit(lambda: batch_shortest_paths(graph, sources, targets), number=1), queries)
+    weighted = CostWeightedPaths(graph, catalog)
+    report(
+        "batch: cost-weighted Dijkstra",
+        timeit.timeit(lambda: batch_shortest_paths(graph, sources, targets, weighted.matrix), number=1),
+        queries,
+    )
+    report("batch by name (find_shortest_paths)", timeit.timeit(lambda: find_shortest_paths(graph, pairs), number=1), queries)
+    offsets, nodes = batch_shortest_paths(graph, sources, targets)
+    print(f"offsets form: {offsets.nbytes + nodes.nbytes} bytes for {queries} paths")
+
+
+def bench_path_cache(queries=2000, k=3):
+    catalog = load_catalog()
+    pairs = column_pairs(catalog.column_names, queries, seed=3)
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "path_cache.sqlite")
+        graph = CostWeightedPaths(load_graph(), catalog)
+        warm = PathCache(file_path)
+        warm.put_many([(a, b, graph.k_shortest_paths(a, b, k)) for a, b in pairs], graph.version(), k)
+
+        # A fresh container: new graph object (empty memo), same volume
+        cold_graph = CostWeightedPaths(load_graph(), catalog)
+        report(
+            f"cold container, no cache (k={k})",
+            timeit.timeit(lambda: [cold_graph.k_shortest_paths(a, b, k) for a, b in pairs[:200]], number=1),
+            200,
+        )
+        cache = PathCache(file_path)
+        lookups = lambda: [find_k_shortest_paths(cold_graph, a, b, k, cache=cache) for a, b in pairs]
+        report("cold container, SQLite tier", timeit.timeit(lookups, number=1), queries)
+        report("warm container, memory tier", timeit.timeit(lookups, number=1), queries)
+        print(cache.stats())
+
+        # On a volume: the entries sit in another container's shard
+        class LocalVolume:
+            def commit(self):
+                pass
+
+            def reload(self):
+                pass
+
+        os.replace(file_path, os.path.join(tmp, "path_cache.other.sqlite"))
+        cache = PathCache(file_path, sync=VolumeSync(LocalVolume(), container="this"))
+        lookups = lambda: [find_k_shortest_paths(cold_graph, a, b, k, cache=cache) for a, b in pairs]
+        report("cold container, other container's shard", timeit.timeit(lookups, number=1), queries)
+
+
+def synthetic_documentation(schema, copies):
+    # Render the schema back into the documentation layout, `copies` times
+    lines = []
+    for copy in range(copies):
+        for table in schema:
+            suffix = f"_{copy}" if copy else ""
+            lines += [f"{table.name}{suffix}:", "Synthetic table description.", ""]
+            lines.append("KEYS  COLUMN_NAME  DATA_TYPE  NULLABLE  COMMENT")
+            for column in table.columns:
+                fields = [column.keys.label(), column.name, column.data_type, column.nullable]
+                lines.append("  ".join(f for f in fields if f) + "  " + column.comment)
+            lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_parse_schema(file_path):
+    # schema_parser.py before it streamed: readlines() and re.* per line
+    import re
+
+    with open(file_path, "r") as file:
+        lines = file.readlines()
+    schema, current_table, reading_data = [], None, False
+    for line in lines:
+        line = line.strip()
+        if line.endswith(":"):
+            if current_table is not None:
+                schema.append(current_table)
+            current_table = {"TableName": line[:-1], "Columns": []}
+            reading_data = False
+        elif current_table:
+            if "KEYS" in line and "COLUMN_NAME" in line:
+                reading_data = True
+            elif reading_data and line:
+                data = re.split(r"\s{2,}", line)
+                try:
+                    if not re.match(r"^([A-Z]K,)*[A-Z]K$", data[0]):
+                        data = [None] + data
+                    if " " in data[1]:
+                        column_name, dtype = data[1].split(" ")
+                        data = [data[0], column_name, dtype] + data[2:]
+                    if len(data) == 3:
+                        data += [None, ""]
+                    if len(data) == 4:
+                        data = data + [""] if data[-1] == "NOT NULL" else data[:-1] + [None, data[-1]]
+                    entry = dict(zip(["Keys", "ColumnName", "DataType", "Nullable", "Comment"], data))
+                except IndexError:
+                    continue
+                current_table["Columns"].append(entry)
+    if current_table is not None:
+        schema.append(current_table)
+    return schema
+
+
+def bench_schema_parser(copies=100, number=3):
+    catalog = load_catalog()
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "schema_documentation.txt")
+        with open(file_path, "w") as f:
+            f.write(synthetic_documentation(catalog.schema, 1))
+        parsed = parse_schema(file_path)
+        same = parsed == catalog.schema
+        print(f"1x document round-trips to schema.json: {same}")
+
+        with open(file_path, "w") as f:
+            f.write(synthetic_documentation(catalog.schema, copies))
+        size = os.path.getsize(file_path)
+        rows = sum(len(t.columns) for t in catalog.schema) * copies
+        print(f"{copies}x document: {size / 1024**2:.1f} MiB, {rows} column rows")
+        for name, parse in (("legacy readlines", legacy_parse_schema), ("streaming", parse_schema)):
+            seconds = timeit.timeit(lambda: parse(file_path), number=number) / number
+            print(f"{name:<40} {seconds * 1e3:10.1f} ms/document {rows / seconds / 1e6:8.2f} M rows/s")
+
+        import tracemalloc
+
+        for name, parse in (("legacy readlines", legacy_parse_schema), ("streaming (iterate only)", iter_schema)):
+            tracemalloc.start()
+            for _ in parse(file_path):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name:<40} peak {peak / 1024**2:8.1f} MiB")
+
+
+def bench_schema_snapshot(number=500, tables=("ACTIVITIES", "MOLECULE_DICTIONARY")):
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "schema.bin")
+        write_snapshot(load_catalog().schema, file_path)
+        print(f"schema.json {os.path.getsize(SCHEMA_PATH)} bytes, snapshot {os.path.getsize(file_path)} bytes")
+
+        def json_load():
+            with open(SCHEMA_PATH, "r") as f:
+                return json.load(f)
+
+        def json_lookup():
+            schema = json_load()
+            return [next(t for t in schema if t["TableName"] == name) for name in tables]
+
+        cases = [
+            ("json.load", json_load),
+            ("snapshot open", lambda: load_snapshot(file_path)),
+            (f"json.load + {len(tables)} tables", json_lookup),
+            (f"snapshot open + {len(tables)} tables", lambda: [load_snapshot(file_path).table(t) for t in tables]),
+            ("snapshot open + all tables", lambda: list(load_snapshot(file_path))),
+        ]
+        for name, load in cases:
+            report(name, timeit.timeit(load, number=number), number)
+
+        schema, snapshot = json_load(), load_snapshot(file_path)
+        by_name = {t["TableName"]: t for t in schema}
+        names = [t["TableName"] for t in schema]
+        cold = load_snapshot(file_path)
+        seconds = timeit.timeit(lambda: [cold.table(n) for n in names], number=1)
+        report("snapshot lookup (cold, first decode)", seconds, len(names))
+        seconds = timeit.timeit(lambda: [snapshot.table(n) for n in names], number=number)
+        report("snapshot lookup (warm)", seconds, number * len(names))
+        seconds = timeit.timeit(lambda: [by_name[n] for n in names], number=number)
+        report("dict lookup after json.load", seconds, number * len(names))
+
+
+def schema_footprint(kind):
+    # Bytes still allocated once the schema is held as `kind`
+    import tracemalloc
+
+    tracemalloc.start()
+    if kind == "snapshot tables":
+        schema = list(load_snapshot("schema.bin"))
+    else:
+        with open(SCHEMA_PATH, "r") as f:
+            schema = json.load(f)
+        if kind == "tables":
+            schema = as_tables(schema)
+        elif kind == "catalog":
+            schema = SchemaCatalog(schema)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def bench_schema_memory():
+    # Each measurement runs in a fresh interpreter, as in a new worker, so
+    # strings interned by earlier benchmarks are not shared into it
+    sizes = {}
+    for kind in ("dicts", "tables", "snapshot tables", "catalog"):
+        code = f"import benchmarks; print(benchmarks.schema_footprint({kind!r}))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        sizes[kind] = int(result.stdout)
+    for kind, size in sizes.items():
+        print(f"{'schema as ' + kind:<40} {size / 1024:10.1f} KiB")
+    print(f"Table/Column vs schema.json dicts: {1 - sizes['tables'] / sizes['dicts']:.0%} less per worker")
+
+
+BENCHMARKS = {
+    "batch-paths": bench_batch_paths,
+    "catalog": bench_catalog,
+    "column-stats": bench_column_stats,
+    "compiler": bench_compiler,
+    "graph": bench_graph,
+    "join-costs": bench_join_costs,
+    "k-paths": bench_k_paths,
+    "path-cache": bench_path_cache,
+    "prompt-tokens": bench_prompt_tokens,
+    "result-cache": bench_result_cache,
+    "retriever": bench_retriever,
+    "schema-memory": bench_schema_memory,
+    "schema-parser": bench_schema_parser,
+    "schema-snapshot": bench_schema_snapshot,
+    "table-graph": bench_table_graph,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DrugCrow microbenchmarks")
+    parser.add_argument("name", choices=sorted(BENCHMARKS) + ["all"])
+    args = parser.parse_args()
+
+    names = sorted(BENCHMARKS) if args.name == "all" else [args.name]
+    for name in names:
+        print(f"== {name}")
+        BENCHMARKS[name]()
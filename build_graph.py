@@ -1,8 +1,26 @@
 #!/usr/bin/env python3
 
+import difflib
 import json
+import os
+import re
+
 import networkx as nx
-import pickle
+
+from csr_graph import CSRGraph, node_id
+from path_table import all_pairs_predecessors, save_predecessors
+from schema_catalog import SchemaCatalog
+from schema_model import KeyType, as_tables
+from schema_snapshot import read_schema, write_snapshot
+
+FK_MAP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fk_map.json")
+# "FK to SMID in ACTIVITY_SUPP_MAP" names the target column as well
+FK_COLUMN_RE = re.compile(r"\bFK to (\w+) in (?:the )?(\w+)", re.I)
+# "Foreign key to the assays table", "Foreign key that maps to the X table",
+# "FK to PRODUCTS", "Foreign key to cell dictionary."
+FK_PHRASE_RE = re.compile(r"\b(?:foreign key|FK)(?: that maps)? to (?:the )?(\w+)(?: (\w+))?", re.I)
+# Names the comments use for tables that no spelling rule recovers
+TABLE_ALIASES = {"COMPOUNDS": "MOLECULE_DICTIONARY", "DOCUMENTS": "DOCS"}
 
 
 def read_json_file(file_path):
@@ -12,39 +30,321 @@ def read_json_file(file_path):
         return data
 
 
-if __name__ == "__main__":
-    file_path = "schema.json"
-    data = read_json_file(file_path)
+def table_alias_index(table_names):
+    # Every spelling a comment may use for a table -> its canonical name
+    index = {alias: t for alias, t in TABLE_ALIASES.items() if t in table_names}
+    for table_name in table_names:
+        variants = {table_name, table_name + "S"}
+        if table_name.endswith("S"):
+            variants.add(table_name[:-1])
+        if table_name.endswith("_LOOKUP"):
+            variants.add(table_name[: -len("_LOOKUP")])
+        for variant in variants:
+            index.setdefault(variant, table_name)
+    return index
+
+
+def resolve_table(phrase, aliases):
+    # Canonical table for a comment phrase ("cell dictionary"), or None
+    key = re.sub(r"\W+", "_", phrase.strip()).strip("_").upper()
+    if key in aliases:
+        return aliases[key]
+    # "record_metabolism" -> METABOLISM: the longest alias the phrase ends with
+    for i in range(1, key.count("_") + 1):
+        suffix = key.split("_", i)[-1]
+        if suffix in aliases:
+            return aliases[suffix]
+    # Misspellings ("target_dicitionary")
+    close = difflib.get_close_matches(key, list(aliases), n=1, cutoff=0.9)
+    return aliases[close[0]] if close else None
+
+
+def resolve_foreign_keys(data):
+    """Map every "Foreign key to ..." comment onto a real (table, column).
+
+    Returns {"foreign_keys": [...], "unresolved": [...]}, each entry a dict
+    with the referencing table and column and the comment phrase.
+    """
+    catalog = SchemaCatalog(data)
+    aliases = table_alias_index(catalog.tables)
+    foreign_keys, unresolved = [], []
+    for table in catalog.schema:
+        table_name = table.name.upper()
+        for column in table.columns:
+            comment = column.comment or ""
+            column_name = column.name.upper()
+            target, target_column, phrase = None, None, None
+            match = FK_COLUMN_RE.search(comment)
+            if match:
+                phrase = match.group(0)
+                target = resolve_table(match.group(2), aliases)
+                target_column = match.group(1).upper()
+            else:
+                match = FK_PHRASE_RE.search(comment)
+                if match is None:
+                    continue
+                phrase = match.group(0)
+                words = [w for w in match.groups() if w and w.lower() != "table"]
+                # Two-word names first ("cell dictionary"), then the first word
+                for candidate in (" ".join(words), words[0]):
+                    target = resolve_table(candidate, aliases)
+                    if target is not None:
+                        break
+            entry = {"table": table_name, "column": column_name, "phrase": phrase}
+            if target is None or target == table_name:
+                unresolved.append(entry)
+                continue
+            target_columns = catalog.columns_by_table[target]
+            if target_column not in target_columns:
+                keys = [c for c in target_columns if KeyType.PK in catalog.key_type(target, c)]
+                if column_name in keys:
+                    target_column = column_name
+                elif len(keys) == 1:
+                    target_column = keys[0]
+                elif column_name in target_columns:
+                    target_column = column_name
+                else:
+                    unresolved.append(entry)
+                    continue
+            foreign_keys.append(dict(entry, target_table=target, target_column=target_column))
+    return {"foreign_keys": foreign_keys, "unresolved": unresolved}
+
+
+def load_fk_map(data, file_path=FK_MAP_PATH):
+    # The stored map keeps builds deterministic; resolve afresh if missing
+    if os.path.exists(file_path):
+        return read_json_file(file_path)
+    return resolve_foreign_keys(data)
+
+
+def build_graph(data, fk_map=None):
+    fk_map = fk_map or resolve_foreign_keys(data)
+    targets = fk_targets(fk_map)
     graph = nx.Graph()
 
-    for json_object in data:
-        table_name = json_object["TableName"].upper()
-        columns = json_object["Columns"]
-        column_names = [column["ColumnName"] for column in columns]
-        comments = [column["Comment"] for column in columns]
-
-        if table_name not in graph:
-            graph.add_node(table_name, node_type="table")
-
-        table_dict = {}
-        for e, (column, comment) in enumerate(zip(column_names, comments)):
-            column = column.upper()
-            if column not in graph:
-                graph.add_node(column, node_type="column")
-
-            graph.add_edge(table_name, column)
-
-            if "Foreign key to " in comment:
-                foreign_relationship = (
-                    comment.split("Foreign key to ")[1].split("table")[0].lower()
-                )
-                if "the" in foreign_relationship:
-                    foreign_relationship.split("the")[1].strip()
-
-                foreign_relationship = foreign_relationship.strip().upper()
-                if foreign_relationship not in graph:
-                    graph.add_node(foreign_relationship, node_type="table")
-                graph.add_edge(column, foreign_relationship)
-
-    with open("schema_graph.pkl", "wb") as f:
-        pickle.dump(graph, f)
+    for table in as_tables(data):
+        table_name = table.name.upper()
+        table_node = node_id(table_name, "table")
+        graph.add_node(table_node, node_type="table")
+
+        for column in table.columns:
+            column_name = column.name.upper()
+            column_node = node_id(column_name)
+            graph.add_node(column_node, node_type="column")
+            graph.add_edge(table_node, column_node)
+
+            target = targets.get((table_name, column_name))
+            if target is not None:
+                # Distinct IDs keep an FK into a table of the same name
+                # (TARGET_DICTIONARY.TARGET_TYPE) from becoming a self-loop
+                graph.add_node(node_id(target, "table"), node_type="table")
+                graph.add_edge(column_node, node_id(target, "table"))
+
+    return graph
+
+
+def edge_key(u, v):
+    return (u, v) if u <= v else (v, u)
+
+
+def fk_targets(fk_map):
+    return {(fk["table"], fk["column"]): fk["target_table"] for fk in fk_map["foreign_keys"]}
+
+
+def table_edges(table, targets):
+    # The edges build_graph derives from one table definition, as node IDs
+    table_name = table.name.upper()
+    edges = set()
+    for column in table.columns:
+        column_name = column.name.upper()
+        edges.add(edge_key(node_id(table_name, "table"), node_id(column_name)))
+        target = targets.get((table_name, column_name))
+        if target is not None:
+            edges.add(edge_key(node_id(column_name), node_id(target, "table")))
+    return edges
+
+
+def schema_diff(old_data, new_data):
+    old = {table.name.upper(): table for table in as_tables(old_data)}
+    new = {table.name.upper(): table for table in as_tables(new_data)}
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "changed": sorted(t for t in old.keys() & new.keys() if old[t] != new[t]),
+    }
+
+
+def update_graph(graph, old_data, new_data, old_fk_map=None, new_fk_map=None):
+    """Apply a schema change to a previous CSRGraph build.
+
+    Only the tables in the diff (and tables whose resolved FKs changed) are
+    re-derived. Surviving nodes keep their relative order, new ones are
+    appended. Returns (new graph, changelog); the changelog lists touched
+    nodes by node ID ("table:X" / "col:X") and by new integer ID, plus
+    id_map (old integer ID -> new, -1 when removed) for remapping anything
+    indexed by integer ID.
+    """
+    old_data, new_data = as_tables(old_data), as_tables(new_data)
+    diff = schema_diff(old_data, new_data)
+    old_targets = fk_targets(old_fk_map or resolve_foreign_keys(old_data))
+    new_targets = fk_targets(new_fk_map or resolve_foreign_keys(new_data))
+    affected = set(diff["added"]) | set(diff["removed"]) | set(diff["changed"])
+    affected |= {t for t, c in old_targets.keys() | new_targets.keys() if old_targets.get((t, c)) != new_targets.get((t, c))}
+
+    old_tables = {table.name.upper(): table for table in old_data}
+    new_tables = {table.name.upper(): table for table in new_data}
+    old_edges, new_edges = set(), set()
+    for table_name in affected:
+        if table_name in old_tables:
+            old_edges |= table_edges(old_tables[table_name], old_targets)
+        if table_name in new_tables:
+            new_edges |= table_edges(new_tables[table_name], new_targets)
+
+    # An edge an unaffected table still produces must stay
+    produced = {
+        edge_key(node_id(t, "table"), node_id(c.name.upper())) for t, table in new_tables.items() for c in table.columns
+    }
+    produced |= {edge_key(node_id(c), node_id(target, "table")) for (_, c), target in new_targets.items()}
+
+    nx_graph = graph.to_networkx()
+    removed_edges = sorted(e for e in old_edges - new_edges if e not in produced and nx_graph.has_edge(*e))
+    added_edges = sorted(e for e in new_edges if not nx_graph.has_edge(*e))
+
+    types = {}
+    for table in new_data:
+        table_name = table.name.upper()
+        types[node_id(table_name, "table")] = "table"
+        for column in table.columns:
+            types[node_id(column.name.upper())] = "column"
+            target = new_targets.get((table_name, column.name.upper()))
+            if target is not None:
+                types[node_id(target, "table")] = "table"
+    for node, node_type in types.items():
+        if node not in nx_graph:
+            nx_graph.add_node(node, node_type=node_type)
+    nx_graph.remove_edges_from(removed_edges)
+    nx_graph.add_edges_from(added_edges)
+
+    # Affected tables count as touched even when their edges survive: their
+    # key types feed edge weights
+    touched = {n for edge in removed_edges + added_edges for n in edge} | {node_id(t, "table") for t in affected}
+    removed_nodes = sorted(n for n in nx_graph if n not in types)
+    nx_graph.remove_nodes_from(removed_nodes)
+
+    updated = CSRGraph.from_networkx(nx_graph)
+    touched_nodes = sorted(n for n in touched if n in updated.index)
+    changelog = {
+        "tables": diff,
+        "added_nodes": [n for n in updated.nodes if n not in graph.index],
+        "removed_nodes": removed_nodes,
+        "touched_nodes": touched_nodes,
+        "touched_ids": sorted(updated.index[n] for n in touched_nodes),
+        "added_edges": [list(e) for e in added_edges],
+        "removed_edges": [list(e) for e in removed_edges],
+        "id_map": [updated.index.get(node, -1) for node in graph.nodes],
+    }
+    return updated, changelog
+
+
+def build_table_graph(data, fk_map=None):
+    """One node per table; an edge for every pair of tables with a key join,
+    labelled with its join columns as ((table, column), (table, column))."""
+    fk_map = fk_map or resolve_foreign_keys(data)
+    catalog = SchemaCatalog(data)
+    graph = nx.Graph()
+    for table_name in catalog.tables:
+        graph.add_node(node_id(table_name, "table"), node_type="table")
+
+    def add_join(left, right):
+        if left[0] == right[0]:
+            return
+        left, right = sorted((left, right))
+        u, v = node_id(left[0], "table"), node_id(right[0], "table")
+        if not graph.has_edge(u, v):
+            graph.add_edge(u, v, joins=[])
+        joins = graph.edges[u, v]["joins"]
+        if (left, right) not in joins:
+            joins.append((left, right))
+
+    # Same column in both tables, keyed on both sides
+    for column_name, table_names in catalog.tables_by_column.items():
+        for i, left in enumerate(table_names):
+            for right in table_names[i + 1 :]:
+                if catalog.joinable((left, column_name), (right, column_name)):
+                    add_join((left, column_name), (right, column_name))
+
+    # Differently named FKs (ENZYME_TID -> TARGET_DICTIONARY.TID)
+    for fk in fk_map["foreign_keys"]:
+        add_join((fk["table"], fk["column"]), (fk["target_table"], fk["target_column"]))
+
+    return graph
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from table_graph import TableGraph
+
+    parser = argparse.ArgumentParser(description="Build the schema graph artifacts")
+    parser.add_argument("--mode", default="bipartite", choices=["bipartite", "table"])
+    parser.add_argument("--resolve-fks", action="store_true", help="re-resolve FK comments into fk_map.json")
+    parser.add_argument(
+        "--previous-schema",
+        help="schema.json the current schema_graph/ was built from; update that build incrementally",
+    )
+    parser.add_argument("--previous-release", help="like --previous-schema, read from the schema store")
+    parser.add_argument("--schema", default="schema.json", help="schema.json or a binary schema snapshot")
+    parser.add_argument("--snapshot", help="also write the schema as a binary snapshot to this path")
+    args = parser.parse_args()
+
+    data = read_schema(args.schema)
+    if args.snapshot:
+        write_snapshot(data, args.snapshot)
+    if args.previous_schema or args.previous_release:
+        from join_costs import CostWeightedPaths
+        from schema_store import SchemaStore
+
+        if args.previous_release:
+            previous_data = SchemaStore().load_schema(args.previous_release)
+        else:
+            previous_data = read_schema(args.previous_schema)
+        previous = CSRGraph.load("schema_graph")
+        fk_map = resolve_foreign_keys(data)
+        updated, changelog = update_graph(previous, previous_data, data, new_fk_map=fk_map)
+        # Path caches key on these; path_cache.py carry-over migrates entries.
+        # Default stats (join_costs.load_cost_stats) match the endpoint's.
+        changelog["graph_versions"] = {
+            "bipartite": [previous.version(), updated.version()],
+            "weighted": [
+                CostWeightedPaths(previous, SchemaCatalog(previous_data)).version(),
+                CostWeightedPaths(updated, SchemaCatalog(data)).version(),
+            ],
+        }
+        with open(FK_MAP_PATH, "w") as f:
+            json.dump(fk_map, f, indent=4)
+        # Release the mmapped arrays before overwriting their file
+        del previous
+        updated.save("schema_graph")
+        if changelog["added_edges"] or changelog["removed_edges"]:
+            save_predecessors(all_pairs_predecessors(updated), "schema_graph")
+        with open("schema_graph/changelog.json", "w") as f:
+            json.dump(changelog, f, indent=4)
+        print(json.dumps(changelog["tables"]))
+        print(f"{len(changelog['touched_nodes'])} nodes touched, "
+              f"{len(changelog['added_nodes'])} added, {len(changelog['removed_nodes'])} removed")
+        raise SystemExit
+    if args.resolve_fks:
+        fk_map = resolve_foreign_keys(data)
+        with open(FK_MAP_PATH, "w") as f:
+            json.dump(fk_map, f, indent=4)
+        print(f"{len(fk_map['foreign_keys'])} foreign keys resolved")
+        for entry in fk_map["unresolved"]:
+            print(f"unresolved: {entry['table']}.{entry['column']}: {entry['phrase']!r}")
+    fk_map = load_fk_map(data)
+    if args.mode == "table":
+        TableGraph.from_networkx(build_table_graph(data, fk_map), SchemaCatalog(data)).save("schema_table_graph")
+    else:
+        graph = build_graph(data, fk_map)
+        csr = CSRGraph.from_networkx(graph)
+        csr.save("schema_graph")
+        save_predecessors(all_pairs_predecessors(csr), "schema_graph")
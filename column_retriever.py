@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+import math
+import re
+from collections import Counter, defaultdict
+
+from schema_catalog import load_catalog
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be between by can do does for from has have how i in is it "
+    "its of on or show that the their them there these this to was what when where "
+    "which who why will with".split()
+)
+# Words questions use to frame the analysis; a column named after one
+# (RELATIONSHIP) is never picked on that word alone
+FRAMING_WORDS = frozenset(
+    "association compare comparison correlation difference effect relation relationship trend".split()
+)
+MAX_WINDOW = 4
+MIN_NAME_SIMILARITY = 0.3
+# Single-word names whose word is this common across the schema (NAME, TYPE,
+# VALUE) are too ambiguous to skip the LLM on
+MIN_CONFIDENT_IDF = 3.0
+
+
+def words(text):
+    return WORD_RE.findall(text.lower())
+
+
+def trigrams(text):
+    text = f"  {text} "
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class ColumnRetriever:
+    """Ranks schema columns against a question without calling the LLM.
+
+    Column names are matched with a trigram index over every 1..MAX_WINDOW word
+    window of the question; column comments are scored with BM25. The name
+    score dominates, the comment score breaks ties and surfaces columns the
+    question only describes.
+    """
+
+    def __init__(self, column_names, comments, k1=1.5, b=0.75, comment_weight=0.3):
+        self.column_names = list(column_names)
+        self.comment_weight = comment_weight
+
+        # Trigram index over the spaced-out column name ("black box warning")
+        self.name_grams = []
+        self.gram_index = defaultdict(list)
+        for i, name in enumerate(self.column_names):
+            grams = trigrams(name.lower().replace("_", " "))
+            self.name_grams.append(len(grams))
+            for gram in grams:
+                self.gram_index[gram].append(i)
+
+        # BM25 over name words + all comments the column carries
+        self.term_freqs = []
+        postings = defaultdict(list)
+        for i, name in enumerate(self.column_names):
+            tokens = words(name.replace("_", " "))
+            for comment in comments.get(name, ()):
+                tokens += [w for w in words(comment) if w not in STOPWORDS]
+            freqs = Counter(tokens)
+            self.term_freqs.append(sum(freqs.values()))
+            for term, freq in freqs.items():
+                postings[term].append((i, freq))
+        # The index is static, so each posting's BM25 contribution is too
+        avg_len = sum(self.term_freqs) / max(len(self.term_freqs), 1)
+        n = len(self.column_names)
+        self.weights = {}
+        self.idf = {}
+        for term, entries in postings.items():
+            idf = self.idf[term] = math.log(1 + (n - len(entries) + 0.5) / (len(entries) + 0.5))
+            self.weights[term] = [
+                (i, idf * freq * (k1 + 1) / (freq + k1 * (1 - b + b * self.term_freqs[i] / avg_len)))
+                for i, freq in entries
+            ]
+
+    @classmethod
+    def from_catalog(cls, catalog, columns_path=None):
+        if columns_path is None:
+            column_names = catalog.column_names
+        else:
+            with open(columns_path, "r") as f:
+                column_names = [line.strip().upper() for line in f if line.strip()]
+        comments = defaultdict(list)
+        for table in catalog.schema:
+            for column in table.columns:
+                if column.comment:
+                    comments[column.name.upper()].append(column.comment)
+        return cls(column_names, comments)
+
+    def name_matches(self, tokens):
+        # Best (similarity, start, end) window per column
+        best = {}
+        for start in range(len(tokens)):
+            if tokens[start] in STOPWORDS:
+                continue
+            for end in range(start + 1, min(start + MAX_WINDOW, len(tokens)) + 1):
+                if tokens[end - 1] in STOPWORDS:
+                    continue
+                grams = trigrams(" ".join(tokens[start:end]))
+                shared = Counter()
+                for gram in grams:
+                    shared.update(self.gram_index.get(gram, ()))
+                floor = MIN_NAME_SIMILARITY * len(grams)
+                for i, common in shared.items():
+                    if common < floor:
+                        continue
+                    similarity = common / (len(grams) + self.name_grams[i] - common)
+                    if similarity > best.get(i, (0.0,))[0]:
+                        best[i] = (similarity, start, end)
+        return best
+
+    def comment_scores(self, tokens):
+        scores = Counter()
+        for term in set(tokens) - STOPWORDS:
+            for i, weight in self.weights.get(term, ()):
+                scores[i] += weight
+        return scores
+
+    def search(self, question, k=10, names=None):
+        tokens = words(question)
+        if names is None:
+            names = self.name_matches(tokens)
+        comments = self.comment_scores(tokens)
+        top_comment = max(comments.values(), default=0.0) or 1.0
+        scores = Counter()
+        for i, (similarity, _, _) in names.items():
+            scores[i] += similarity
+        for i, score in comments.items():
+            scores[i] += self.comment_weight * score / top_comment
+        return [(self.column_names[i], score) for i, score in scores.most_common(k)]
+
+    def distinctive(self, i):
+        # Multi-word names are specific enough; single words must be rare in
+        # the schema and not just part of how the question is phrased
+        tokens = words(self.column_names[i].replace("_", " "))
+        if len(tokens) > 1:
+            return True
+        return tokens[0] not in FRAMING_WORDS and self.idf.get(tokens[0], 0.0) >= MIN_CONFIDENT_IDF
+
+    def confident_columns(self, question, threshold=0.85, names=None):
+        # Distinctive columns whose names appear (almost) verbatim in
+        # non-overlapping spans of the question, in question order
+        if names is None:
+            names = self.name_matches(words(question))
+        ranked = sorted(
+            (
+                (s, end - start, start, end, i)
+                for i, (s, start, end) in names.items()
+                if s >= threshold and self.distinctive(i)
+            ),
+            reverse=True,
+        )
+        taken, found = set(), []
+        for _, _, start, end, i in ranked:
+            span = set(range(start, end))
+            if span & taken:
+                continue
+            taken |= span
+            found.append((start, self.column_names[i]))
+        return [name for _, name in sorted(found)]
+
+    def select(self, question, k=10, threshold=0.85):
+        """Return (columns, candidates): `columns` holds two or more confident
+        matches when the LLM round trip can be skipped, otherwise it is empty
+        and `candidates` is the top-k shortlist to hint to the LLM."""
+        names = self.name_matches(words(question))
+        columns = self.confident_columns(question, threshold, names)
+        if len(columns) >= 2:
+            return columns, []
+        return [], [name for name, _ in self.search(question, k, names)]
+
+
+def load_retriever(columns_path="columns.txt", catalog=None):
+    return ColumnRetriever.from_catalog(catalog or load_catalog(), columns_path)
+
+
+if __name__ == "__main__":
+    retriever = load_retriever()
+    for question in [
+        "What is the correlation between ALogP and black box warning?",
+        "How does the organism relate to pChEMBL value?",
+        "Do withdrawn drugs have a higher molecular weight?",
+    ]:
+        print(question)
+        print("  confident:", retriever.confident_columns(question))
+        print("  ranked:", retriever.search(question, 5))
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+import datetime
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from executors import DATASET
+from schema_catalog import load_catalog
+
+STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "column_stats.json")
+QUANTILES = 8
+TOP_VALUES = 5
+# Prompt hints list the top values of columns with at most this many distinct
+CATEGORICAL_DISTINCT = 50
+# Quoting and aggregates that differ between engines; {c} is the column
+DIALECTS = {
+    "bigquery": {
+        "quote": "`{c}`",
+        "distinct": "APPROX_COUNT_DISTINCT({c})",
+        "quantiles": f"APPROX_QUANTILES({{c}}, {QUANTILES})",
+        "top_values": f"APPROX_TOP_COUNT({{c}}, {TOP_VALUES})",
+    },
+    "duckdb": {
+        "quote": '"{c}"',
+        "distinct": "approx_count_distinct({c})",
+        "quantiles": "approx_quantile({c}, [" + ", ".join(str(i / QUANTILES) for i in range(QUANTILES + 1)) + "])",
+        "top_values": f"approx_top_k({{c}}, {TOP_VALUES})",
+    },
+}
+
+
+def column_kind(data_type):
+    # Which statistics a schema.json type gets: quantiles for ordered types,
+    # top values for short strings, counts only for LOBs
+    data_type = (data_type or "").upper()
+    if data_type.startswith(("NUMBER", "INTEGER", "DATE")):
+        return "ordered"
+    if data_type.startswith(("CLOB", "BLOB")):
+        return "lob"
+    return "text"
+
+
+def json_value(value):
+    if value is None:
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        # BigQuery's APPROX_TOP_COUNT yields {"value", "count"} structs
+        return json_value(value.get("value"))
+    return value
+
+
+def table_stats_query(table, dialect):
+    # One scan of the table computes every column's statistics
+    sql = DIALECTS[dialect]
+    select = ["COUNT(*) AS n"]
+    for i, column in enumerate(table.columns):
+        c = sql["quote"].format(c=column.name.lower())
+        kind = column_kind(column.data_type)
+        select.append(f"COUNT({c}) AS c{i}_present")
+        if kind == "lob":
+            continue
+        select += [
+            f"{sql['distinct'].format(c=c)} AS c{i}_distinct",
+            f"MIN({c}) AS c{i}_min",
+            f"MAX({c}) AS c{i}_max",
+        ]
+        if kind == "ordered":
+            select.append(f"{sql['quantiles'].format(c=c)} AS c{i}_quantiles")
+        else:
+            select.append(f"{sql['top_values'].format(c=c)} AS c{i}_top_values")
+    return f"SELECT {', '.join(select)} FROM `{DATASET}.{table.name.lower()}`"
+
+
+def scan_table(executor, table, dialect):
+    row = executor.run(table_stats_query(table, dialect)).iloc[0]
+    rows = int(row["n"])
+    columns = {}
+    for i, column in enumerate(table.columns):
+        present = int(row[f"c{i}_present"])
+        entry = {"null_fraction": round(1 - present / rows, 4) if rows else 0.0}
+        for field in ("distinct", "min", "max", "quantiles", "top_values"):
+            if f"c{i}_{field}" not in row.index:
+                continue
+            value = row[f"c{i}_{field}"]
+            if field in ("quantiles", "top_values"):
+                value = [json_value(v) for v in value] if hasattr(value, "__len__") else []
+            entry[field] = json_value(value)
+        columns[column.name.upper()] = entry
+    return {"rows": rows, "columns": columns}
+
+
+class ColumnStats:
+    """Per-column statistics from column_stats.json: distinct counts, null
+    fractions, min/max, and a compact histogram (quantile boundaries for
+    numbers and dates, most common values for strings). Lookups return None
+    for anything that has not been measured."""
+
+    def __init__(self, tables=None, release=None):
+        self.tables = {k.upper(): v for k, v in (tables or {}).items()}
+        self.release = release
+
+    def __bool__(self):
+        return bool(self.tables)
+
+    @property
+    def row_counts(self):
+        return {table_name: entry["rows"] for table_name, entry in self.tables.items()}
+
+    def rows(self, table_name):
+        entry = self.tables.get(table_name.upper())
+        return entry["rows"] if entry else None
+
+    def column(self, table_name, column_name):
+        entry = self.tables.get(table_name.upper())
+        return entry["columns"].get(column_name.upper()) if entry else None
+
+    def present_fraction(self, table_name, column_name):
+        column = self.column(table_name, column_name)
+        return 1.0 - column["null_fraction"] if column else None
+
+    def fanout(self, table_name, column_name):
+        # Expected rows per distinct value: what a join on the column multiplies by
+        column = self.column(table_name, column_name)
+        if not column or not column.get("distinct"):
+            return None
+        return self.rows(table_name) * (1.0 - column["null_fraction"]) / column["distinct"]
+
+    def hint(self, table_name, column_name):
+        # Short prompt text: the values of categorical columns or the range
+        # of ordered ones, plus the null share, e.g. "values IC50/Ki, 12% null"
+        column = self.column(table_name, column_name)
+        if not column:
+            return ""
+        parts = []
+        distinct = column.get("distinct") or CATEGORICAL_DISTINCT + 1
+        if column.get("top_values") and distinct <= CATEGORICAL_DISTINCT:
+            prefix = "values " if distinct <= TOP_VALUES else "e.g. "
+            parts.append(prefix + "/".join(str(v) for v in column["top_values"]))
+        elif column.get("quantiles") and column.get("min") is not None:
+            parts.append(f"{column['min']}..{column['max']}")
+        elif column.get("distinct") is not None:
+            parts.append(f"~{column['distinct']} distinct")
+        if column["null_fraction"] >= 0.01:
+            parts.append(f"{column['null_fraction']:.0%} null")
+        return ", ".join(parts)
+
+
+def load_column_stats(file_path=STATS_PATH):
+    if not os.path.exists(file_path):
+        return ColumnStats()
+    with open(file_path, "r") as f:
+        data = json.load(f)
+    return ColumnStats(data["tables"], data.get("release"))
+
+
+def refresh_column_stats(executor, dialect, catalog=None, file_path=STATS_PATH, release=None, workers=8):
+    """Scan every table once, `workers` tables at a time, and write the
+    statistics to file_path."""
+    catalog = catalog or load_catalog()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        scanned = pool.map(lambda table: scan_table(executor, table, dialect), catalog.schema)
+        tables = {table.name.upper(): entry for table, entry in zip(catalog.schema, scanned)}
+    with open(file_path, "w") as f:
+        json.dump({"release": release, "schema_version": catalog.version, "tables": tables}, f, indent=1)
+    return ColumnStats(tables, release)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from executors import make_executor
+
+    parser = argparse.ArgumentParser(description="Refresh column_stats.json from an executor")
+    parser.add_argument("--executor", default="bigquery", choices=["bigquery", "duckdb", "standin"])
+    parser.add_argument("--data-dir", help="Parquet directory for the duckdb executor")
+    parser.add_argument("--release")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("-o", "--output", default=STATS_PATH)
+    args = parser.parse_args()
+
+    client = None
+    if args.executor == "bigquery":
+        from google.cloud.bigquery.client import Client
+
+        client = Client()
+    executor = make_executor(args.executor, client, args.data_dir)
+    start = time.perf_counter()
+    dialect = "bigquery" if args.executor == "bigquery" else "duckdb"
+    stats = refresh_column_stats(executor, dialect, file_path=args.output, release=args.release, workers=args.workers)
+    columns = sum(len(entry["columns"]) for entry in stats.tables.values())
+    print(f"{len(stats.tables)} tables, {columns} columns in {time.perf_counter() - start:.1f}s -> {args.output}")
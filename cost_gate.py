@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import re
+import time
+from collections import deque, namedtuple
+
+from executors import Executor, referenced_tables
+from schema_catalog import load_catalog
+
+logger = logging.getLogger(__name__)
+
+Estimate = namedtuple("Estimate", ["bytes_processed", "valid", "error"])
+
+DEFAULT_MAX_BYTES = 10 * 1024**3
+DEFAULT_ROW_COUNT = 100_000
+IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+STAR_RE = re.compile(r"(?:\bselect|,)\s*(?:\w+\.)?\*", re.I)
+SAMPLE_RE = re.compile(r"tablesample\s+system\s*\(\s*([\d.]+)\s*percent\s*\)", re.I)
+TABLE_REF_RE = (
+    r"(`?bigquery-public-data\.ebi_chembl\.{table}`?"
+    r"(?:\s+(?:as\s+)?(?!(?:where|join|inner|left|right|full|cross|on|using|group|order|limit|tablesample)\b)\w+)?)"
+)
+
+
+class QueryRejected(Exception):
+    def __init__(self, message, estimate):
+        super().__init__(message)
+        self.estimate = estimate
+
+
+def data_type_width(data_type):
+    # Rough bytes per value of an Oracle column type as stored by BigQuery
+    data_type = (data_type or "").upper()
+    if data_type.startswith(("NUMBER", "DATE")):
+        return 8
+    if data_type.startswith(("CLOB", "BLOB")):
+        return 2048
+    match = re.search(r"\((\d+)\)", data_type)
+    if match:
+        return min(int(match.group(1)), 64)
+    return 16
+
+
+class BigQueryDryRun:
+    def __init__(self, client):
+        self.client = client
+
+    def estimate(self, query):
+        from google.api_core.exceptions import GoogleAPIError
+        from google.cloud.bigquery import QueryJobConfig
+
+        config = QueryJobConfig(dry_run=True, use_query_cache=False)
+        try:
+            job = self.client.query(query, job_config=config)
+        except GoogleAPIError as e:
+            return Estimate(0, False, str(e))
+        return Estimate(job.total_bytes_processed or 0, True, None)
+
+
+class LocalDryRun:
+    """Stand-in for a BigQuery dry run.
+
+    Bytes are estimated like BigQuery bills them: rows of every referenced
+    table times the width of the columns the query mentions, less the NULLs
+    when column_stats knows their fraction (BigQuery bills NULLs as 0 bytes).
+    Validity comes from EXPLAIN on `validator` (e.g. a DuckDBExecutor) when
+    one is given.
+    """
+
+    def __init__(self, catalog=None, row_counts=None, validator=None, column_stats=None):
+        self.catalog = catalog or load_catalog()
+        self.row_counts = {k.upper(): v for k, v in (row_counts or {}).items()}
+        self.validator = validator
+        self.column_stats = column_stats
+
+    def table_bytes(self, table_name, query):
+        table = self.catalog.table(table_name)
+        identifiers = {w.upper() for w in IDENTIFIER_RE.findall(query)}
+        star = STAR_RE.search(query) is not None
+        width = sum(
+            data_type_width(column.data_type) * self.present_fraction(table_name, column.name)
+            for column in table.columns
+            if star or column.name.upper() in identifiers
+        )
+        rows = self.row_counts.get(table_name)
+        if rows is None and self.column_stats:
+            rows = self.column_stats.rows(table_name)
+        return (DEFAULT_ROW_COUNT if rows is None else rows) * width
+
+    def present_fraction(self, table_name, column_name):
+        fraction = self.column_stats.present_fraction(table_name, column_name) if self.column_stats else None
+        return 1.0 if fraction is None else fraction
+
+    def estimate(self, query):
+        tables = referenced_tables(query)
+        unknown = sorted(t for t in tables if t not in self.catalog)
+        if unknown:
+            return Estimate(0, False, f"Unknown tables: {', '.join(unknown)}")
+        if self.validator is not None:
+            try:
+                self.validator.run(f"EXPLAIN {query}")
+            except Exception as e:
+                return Estimate(0, False, str(e))
+        sample = SAMPLE_RE.search(query)
+        fraction = float(sample.group(1)) / 100 if sample else 1.0
+        total = sum(self.table_bytes(t, query) for t in tables)
+        return Estimate(int(total * fraction), True, None)
+
+
+def sample_rewrite(query, table_name, percent):
+    # Add TABLESAMPLE to the first reference of `table_name` (after its alias)
+    pattern = re.compile(TABLE_REF_RE.format(table=re.escape(table_name.lower())), re.I)
+    return pattern.sub(rf"\1 TABLESAMPLE SYSTEM ({percent:g} PERCENT)", query, count=1)
+
+
+class GatedExecutor(Executor):
+    """Dry-runs every query before handing it to `executor`.
+
+    Invalid queries and queries over `max_bytes` raise QueryRejected. With
+    `rewrite` on, an over-budget query first gets its biggest table sampled
+    down to fit and is re-estimated. Estimates are kept in `records`.
+    """
+
+    def __init__(self, executor, estimator, max_bytes=DEFAULT_MAX_BYTES, rewrite=True, catalog=None):
+        self.executor = executor
+        self.estimator = estimator
+        self.max_bytes = max_bytes
+        self.rewrite = rewrite
+        self.catalog = catalog or load_catalog()
+        self.records = deque(maxlen=1000)
+
+    def record(self, query, estimate, action):
+        entry = {
+            "time": time.time(),
+            "bytes_processed": estimate.bytes_processed,
+            "valid": estimate.valid,
+            "action": action,
+            "query": query,
+        }
+        self.records.append(entry)
+        logger.info(json.dumps({"dry_run": entry}))
+
+    def biggest_table(self, query):
+        tables = referenced_tables(query)
+        local = LocalDryRun(self.catalog, getattr(self.estimator, "row_counts", None))
+        return max(sorted(tables), key=lambda t: local.table_bytes(t, query), default=None)
+
+    def check(self, query):
+        estimate = self.estimator.estimate(query)
+        if not estimate.valid:
+            self.record(query, estimate, "rejected")
+            raise QueryRejected(f"Query failed dry run: {estimate.error}", estimate)
+        if estimate.bytes_processed <= self.max_bytes:
+            self.record(query, estimate, "accepted")
+            return query
+
+        table_name = self.biggest_table(query) if self.rewrite else None
+        if table_name is not None and not SAMPLE_RE.search(query):
+            percent = max(1, int(100 * self.max_bytes / estimate.bytes_processed))
+            rewritten = sample_rewrite(query, table_name, percent)
+            sampled = self.estimator.estimate(rewritten)
+            if sampled.valid and sampled.bytes_processed <= self.max_bytes:
+                self.record(rewritten, sampled, "rewritten")
+                return rewritten
+
+        self.record(query, estimate, "rejected")
+        raise QueryRejected(
+            f"Query would process {estimate.bytes_processed} bytes (budget {self.max_bytes})", estimate
+        )
+
+    def run(self, query):
+        return self.executor.run(self.check(query))
+
+
+if __name__ == "__main__":
+    estimator = LocalDryRun(row_counts={"ACTIVITIES": 20_000_000})
+    gate = GatedExecutor(Executor(), estimator, max_bytes=50 * 1024**2)
+    query = (
+        "SELECT a.standard_value, m.pref_name "
+        "FROM `bigquery-public-data.ebi_chembl.activities` a "
+        "JOIN `bigquery-public-data.ebi_chembl.molecule_dictionary` m ON a.molregno = m.molregno "
+        "LIMIT 10"
+    )
+    print(gate.check(query))
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+
+import hashlib
+import heapq
+import os
+
+import numpy as np
+
+from path_table import load_predecessors, walk_predecessors
+
+NODE_TYPES = ("column", "table")
+NODE_TYPE_CODES = {name: code for code, name in enumerate(NODE_TYPES)}
+# Tables and columns share names (TARGET_TYPE is both), so node IDs carry
+# their type: "table:TARGET_TYPE", "col:TARGET_TYPE"
+NODE_PREFIXES = {"column": "col", "table": "table"}
+
+
+def node_id(name, node_type="column"):
+    return f"{NODE_PREFIXES[node_type]}:{name}"
+
+
+def node_name(node):
+    return node.split(":", 1)[1]
+
+
+class CSRGraph:
+    """Undirected schema graph as integer-ID CSR arrays.
+
+    Node i's neighbors are neighbors[offsets[i]:offsets[i + 1]]. On disk the
+    three arrays share one int32 .npy file (so loading is a single mmap) laid
+    out as [n, m, node_type[n], offsets[n + 1], neighbors[m]], and node IDs
+    (see node_id) are one per line in nodes.txt. `index` maps node IDs to
+    integer IDs; `names` holds the bare table or column names paths report.
+    """
+
+    def __init__(self, nodes, node_type, offsets, neighbors, predecessors=None):
+        self.nodes = list(nodes)
+        self.names = [node_name(node) for node in self.nodes]
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.node_type = node_type
+        self.offsets = offsets
+        self.neighbors = neighbors
+        # Optional all-pairs table from path_table.py; turns lookups into walks
+        self.predecessors = predecessors
+        # Neighbor rows are decoded from the arrays on first visit
+        self._rows = [None] * len(self.nodes)
+        self._version = None
+
+    @classmethod
+    def from_networkx(cls, graph):
+        nodes = list(graph.nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        node_type = np.array(
+            [NODE_TYPE_CODES[graph.nodes[n]["node_type"]] for n in nodes], dtype=np.uint8
+        )
+        offsets = np.zeros(len(nodes) + 1, dtype=np.int32)
+        adjacency = []
+        for i, node in enumerate(nodes):
+            row = sorted(index[other] for other in graph.neighbors(node))
+            adjacency.extend(row)
+            offsets[i + 1] = offsets[i] + len(row)
+        return cls(nodes, node_type, offsets, np.array(adjacency, dtype=np.int32))
+
+    def to_networkx(self):
+        import networkx as nx
+
+        graph = nx.Graph()
+        for i, node in enumerate(self.nodes):
+            graph.add_node(node, node_type=self.type_of(i))
+        for i, node in enumerate(self.nodes):
+            graph.add_edges_from((node, self.nodes[j]) for j in self.neighbors_of(i) if j >= i)
+        return graph
+
+    @classmethod
+    def load(cls, directory, mmap_mode="r"):
+        with open(os.path.join(directory, "nodes.txt"), "r") as f:
+            nodes = f.read().split("\n")
+        # Plain ndarray views skip np.memmap's per-item overhead
+        data = np.load(os.path.join(directory, "graph.npy"), mmap_mode=mmap_mode).view(np.ndarray)
+        n, m = int(data[0]), int(data[1])
+        node_type = data[2 : 2 + n]
+        offsets = data[2 + n : 3 + 2 * n]
+        neighbors = data[3 + 2 * n : 3 + 2 * n + m]
+        predecessors = load_predecessors(directory, mmap_mode)
+        return cls(nodes, node_type, offsets, neighbors, predecessors)
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "nodes.txt"), "w") as f:
+            f.write("\n".join(self.nodes))
+        header = np.array([len(self.nodes), len(self.neighbors)], dtype=np.int32)
+        data = np.concatenate([header, self.node_type, self.offsets, self.neighbors]).astype(np.int32)
+        np.save(os.path.join(directory, "graph.npy"), data)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def version(self):
+        # Content hash of the graph; path caches key on it
+        if self._version is None:
+            digest = hashlib.sha256("\n".join(self.nodes).encode())
+            for array in (self.node_type, self.offsets, self.neighbors):
+                digest.update(np.ascontiguousarray(array, dtype=np.int32).tobytes())
+            self._version = digest.hexdigest()[:16]
+        return self._version
+
+    def __contains__(self, node):
+        return node in self.index
+
+    def neighbors_of(self, i):
+        row = self._rows[i]
+        if row is None:
+            row = self._rows[i] = self.neighbors[self.offsets[i] : self.offsets[i + 1]].tolist()
+        return row
+
+    def type_of(self, i):
+        return NODE_TYPES[self.node_type[i]]
+
+    def bfs_path(self, source, target):
+        # Single-source BFS; returns node IDs or None
+        parent = {source: source}
+        frontier = [source]
+        while frontier and target not in parent:
+            next_frontier = []
+            for u in frontier:
+                for v in self.neighbors_of(u):
+                    if v not in parent:
+                        parent[v] = u
+                        next_frontier.append(v)
+            frontier = next_frontier
+        if target not in parent:
+            return None
+        path = [target]
+        while path[-1] != source:
+            path.append(parent[path[-1]])
+        return path[::-1]
+
+    def bidirectional_path(self, source, target):
+        # Expands the smaller frontier each round; returns node IDs or None
+        if source == target:
+            return [source]
+        pred, succ = {source: None}, {target: None}
+        forward, backward = [source], [target]
+        while forward and backward:
+            if len(forward) <= len(backward):
+                frontier, seen, other = forward, pred, succ
+            else:
+                frontier, seen, other = backward, succ, pred
+            next_frontier = []
+            for u in frontier:
+                for v in self.neighbors_of(u):
+                    if v in seen:
+                        continue
+                    seen[v] = u
+                    if v in other:
+                        return self._join(v, pred, succ)
+                    next_frontier.append(v)
+            if frontier is forward:
+                forward = next_frontier
+            else:
+                backward = next_frontier
+        return None
+
+    @staticmethod
+    def _join(meet, pred, succ):
+        path = []
+        node = meet
+        while node is not None:
+            path.append(node)
+            node = pred[node]
+        path.reverse()
+        node = succ[meet]
+        while node is not None:
+            path.append(node)
+            node = succ[node]
+        return path
+
+    def edge_weight(self, u, v, weights=None):
+        if weights is None:
+            return 1.0
+        start = int(self.offsets[u])
+        return float(weights[start + self.neighbors_of(u).index(v)])
+
+    def dijkstra_path(self, sources, targets, weights=None, banned_nodes=(), banned_edges=()):
+        # Cheapest path from any of `sources` to any of `targets` avoiding the
+        # banned nodes and (u, v) edges; returns (cost, node IDs) or None.
+        # weights align with self.neighbors
+        dist = {s: 0.0 for s in sources}
+        parent = {s: None for s in sources}
+        heap = [(0.0, s) for s in sorted(sources)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if u in targets:
+                path = [u]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return d, path[::-1]
+            if d > dist[u]:
+                continue
+            start = int(self.offsets[u])
+            for slot, v in enumerate(self.neighbors_of(u)):
+                if v in banned_nodes or (u, v) in banned_edges:
+                    continue
+                nd = d + (1.0 if weights is None else weights[start + slot])
+                if nd < dist.get(v, float("inf")):
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd, v))
+        return None
+
+    def yen_paths(self, sources, targets, k, weights=None):
+        """Yen's algorithm: up to k loopless node-ID paths from any source to
+        any target, cheapest first. A virtual root joins all sources, so
+        alternatives may start from a different source."""
+        first = self.dijkstra_path(sources, targets, weights)
+        if first is None or k < 1:
+            return []
+        found = [first]
+        candidates = []
+        seen = {tuple(first[1])}
+        while len(found) < k:
+            _, previous = found[-1]
+            for i in range(-1, len(previous) - 1):
+                root = previous[: i + 1]
+                if i < 0:
+                    # Spur at the virtual root: start from an unused source
+                    spur_sources = set(sources) - {path[0] for _, path in found}
+                    spur = self.dijkstra_path(spur_sources, targets, weights)
+                else:
+                    banned_edges = set()
+                    for _, path in found:
+                        if path[: i + 1] == root and len(path) > i + 1:
+                            banned_edges.add((path[i], path[i + 1]))
+                            banned_edges.add((path[i + 1], path[i]))
+                    spur = self.dijkstra_path({root[-1]}, targets, weights, set(root[:-1]), banned_edges)
+                if spur is None:
+                    continue
+                path = root[:-1] + spur[1]
+                if tuple(path) in seen:
+                    continue
+                seen.add(tuple(path))
+                root_cost = sum(self.edge_weight(u, v, weights) for u, v in zip(root, root[1:]))
+                heapq.heappush(candidates, (root_cost + spur[0], path))
+            if not candidates:
+                break
+            found.append(heapq.heappop(candidates))
+        return [path for _, path in found]
+
+    def k_shortest_paths(self, start, end, k, weights=None):
+        # Up to k paths between two columns in increasing cost, as lists of
+        # (name, node_type)
+        start, end = node_id(start), node_id(end)
+        if start not in self.index or end not in self.index:
+            return []
+        paths = self.yen_paths({self.index[start]}, {self.index[end]}, k, weights)
+        return [[(self.names[i], self.type_of(i)) for i in path] for path in paths]
+
+    def shortest_path(self, start, end):
+        # Same output shape as find_shortest_path: [(name, node_type), ...]
+        start, end = node_id(start), node_id(end)
+        if start not in self.index or end not in self.index:
+            return None
+        source, target = self.index[start], self.index[end]
+        if self.predecessors is not None:
+            path = walk_predecessors(self.predecessors, source, target)
+        else:
+            path = self.bidirectional_path(source, target)
+        if path is None:
+            return None
+        return [(self.names[i], self.type_of(i)) for i in path]
+
+
+def load_csr_graph(directory="schema_graph"):
+    return CSRGraph.load(directory)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+
+import os
+import re
+
+from schema_catalog import load_catalog
+from schema_model import KeyType
+
+DATASET = "bigquery-public-data.ebi_chembl"
+DATASET_TABLE_RE = re.compile(r"`?bigquery-public-data\.ebi_chembl\.(\w+)`?", re.I)
+
+# Oracle types in schema.json -> DuckDB types
+DUCKDB_TYPES = (
+    ("VARCHAR", "VARCHAR"),
+    ("CHAR", "VARCHAR"),
+    ("CLOB", "VARCHAR"),
+    ("NUMBER", "DOUBLE"),
+    ("DATE", "DATE"),
+    ("BLOB", "BLOB"),
+)
+
+
+class QueryFailed(Exception):
+    """The engine could not run a query (BigQuery job error, DuckDB error)."""
+
+
+class Executor:
+    """Runs a SQL query and returns the result as a pandas DataFrame; engine
+    errors surface as QueryFailed."""
+
+    def run(self, query):
+        raise NotImplementedError
+
+
+class BigQueryExecutor(Executor):
+    def __init__(self, client):
+        self.client = client
+
+    def run(self, query):
+        from google.api_core.exceptions import GoogleAPIError
+
+        try:
+            return self.client.query(query).result().to_dataframe()
+        except GoogleAPIError as e:
+            raise QueryFailed(str(e)) from e
+
+
+class StaticExecutor(Executor):
+    """Local stand-in that serves canned results and counts how often it ran.
+
+    `results` maps SQL text (compared whitespace-insensitively) to a DataFrame;
+    unknown queries get `default` or raise KeyError.
+    """
+
+    def __init__(self, results=None, default=None):
+        self.results = {" ".join(q.split()): frame for q, frame in (results or {}).items()}
+        self.default = default
+        self.calls = 0
+
+    def run(self, query):
+        self.calls += 1
+        frame = self.results.get(" ".join(query.split()), self.default)
+        if frame is None:
+            raise KeyError(f"No canned result for query: {query}")
+        return frame.copy()
+
+
+def strip_dataset(query):
+    # `bigquery-public-data.ebi_chembl.docs` -> "docs" for engines without the dataset
+    return DATASET_TABLE_RE.sub(lambda m: f'"{m.group(1).lower()}"', query)
+
+
+def referenced_tables(query):
+    return {m.group(1).upper() for m in DATASET_TABLE_RE.finditer(query)}
+
+
+def duckdb_type(data_type):
+    data_type = (data_type or "").upper()
+    for prefix, duck_type in DUCKDB_TYPES:
+        if data_type.startswith(prefix):
+            return duck_type
+    return "VARCHAR"
+
+
+class DuckDBExecutor(Executor):
+    """ChEMBL tables served by an in-process DuckDB.
+
+    Every schema.json table exists: as a view over `<data_dir>/<table>.parquet`
+    when that file is present, otherwise as an empty table with the documented
+    columns. `tables` holds the names that actually have data.
+    """
+
+    def __init__(self, data_dir=None, catalog=None, database=":memory:"):
+        import duckdb
+
+        self.db = duckdb.connect(database)
+        self.error = duckdb.Error
+        self.tables = set()
+        for table in (catalog or load_catalog()).schema:
+            name = table.name.lower()
+            file_path = os.path.join(data_dir, f"{name}.parquet") if data_dir else None
+            if file_path and os.path.exists(file_path):
+                self.db.execute(
+                    f"CREATE VIEW \"{name}\" AS SELECT * FROM read_parquet('{file_path}')"
+                )
+                self.tables.add(name.upper())
+            else:
+                columns = ", ".join(
+                    f'"{column.name.lower()}" {duckdb_type(column.data_type)}'
+                    for column in table.columns
+                )
+                self.db.execute(f'CREATE TABLE "{name}" ({columns})')
+
+    def load_frame(self, table_name, frame):
+        # Replace a table with an in-memory DataFrame (stand-in datasets)
+        name = table_name.lower()
+        self.db.register("_frame", frame)
+        # DuckDB refuses DROP VIEW IF EXISTS on a table (and vice versa)
+        existing = self.db.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = ?", [name]
+        ).fetchone()
+        if existing:
+            kind = "VIEW" if existing[0] == "VIEW" else "TABLE"
+            self.db.execute(f'DROP {kind} "{name}"')
+        self.db.execute(f'CREATE TABLE "{name}" AS SELECT * FROM _frame')
+        self.db.unregister("_frame")
+        self.tables.add(name.upper())
+
+    def run(self, query):
+        # A cursor per call keeps concurrent requests off each other's state
+        try:
+            return self.db.cursor().execute(strip_dataset(query)).fetchdf()
+        except self.error as e:
+            raise QueryFailed(str(e)) from e
+
+
+class RoutingExecutor(Executor):
+    """Sends a query to `local` when every table it reads is held there."""
+
+    def __init__(self, local, remote):
+        self.local = local
+        self.remote = remote
+
+    def run(self, query):
+        tables = referenced_tables(query)
+        if tables and tables <= self.local.tables:
+            return self.local.run(query)
+        return self.remote.run(query)
+
+
+def load_dump(sqlite_path, data_dir, catalog=None, tables=None, chunksize=500_000):
+    """Export schema.json tables from a ChEMBL SQLite dump to Parquet files."""
+    import sqlite3
+
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    os.makedirs(data_dir, exist_ok=True)
+    wanted = {t.upper() for t in tables} if tables else None
+    with sqlite3.connect(sqlite_path) as db:
+        present = {r[0].upper() for r in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        for table in (catalog or load_catalog()).schema:
+            name = table.name.upper()
+            if name not in present or (wanted and name not in wanted):
+                continue
+            writer = None
+            for chunk in pd.read_sql_query(f'SELECT * FROM "{name.lower()}"', db, chunksize=chunksize):
+                chunk.columns = [c.lower() for c in chunk.columns]
+                batch = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(os.path.join(data_dir, f"{name.lower()}.parquet"), batch.schema)
+                writer.write_table(batch.cast(writer.schema))
+            if writer is not None:
+                writer.close()
+                print(f"exported {name}")
+
+
+def standin_column(column, rows, rng):
+    """Synthetic values for one column. Integer keys are 1..rows and string
+    keys COLUMN<n> in every table, so foreign keys find their targets."""
+    import pandas as pd
+
+    data_type = column.data_type.upper()
+    size = re.search(r"\((\d+)", data_type)
+    size = int(size.group(1)) if size else None
+    unique = bool(column.keys & (KeyType.PK | KeyType.UK))
+    ids = pd.Series(range(1, rows + 1)) if unique else pd.Series(rng.integers(1, rows + 1, rows))
+    if data_type.startswith("INTEGER") or (data_type.startswith("NUMBER") and not re.search(r",\s*[1-9]", data_type)):
+        if column.keys:
+            series = ids.astype("Int64")
+        else:
+            series = pd.Series(rng.integers(0, min(10 ** (size or 3), 1000), rows), dtype="Int64")
+    elif data_type.startswith("NUMBER"):
+        series = pd.Series(rng.lognormal(1.0, 1.5, rows).round(2), dtype="Float64")
+    elif data_type.startswith("DATE"):
+        series = pd.Timestamp("2000-01-01") + pd.to_timedelta(rng.integers(0, 9000, rows), unit="D")
+        series = pd.Series(series)
+    elif data_type.startswith("BLOB"):
+        return pd.Series([None] * rows, dtype=object)
+    elif column.keys or (size or 4000) > 30:
+        series = ids.map(lambda i: f"{column.name}{i}").astype(object)
+    else:
+        # Short strings are mostly categorical (types, flags, units)
+        series = pd.Series([f"{column.name}_{k}" for k in rng.integers(0, 8, rows)], dtype=object)
+    if column.nullable != "NOT NULL" and not column.keys:
+        missing = rng.random(rows) < 0.1
+        series = series.where(~missing, None) if series.dtype == object else series.mask(missing)
+    return series
+
+
+def load_standin(executor, catalog=None, rows=1000, seed=0):
+    """Fill a DuckDBExecutor with `rows` synthetic rows per table, for running
+    stats and cost tooling offline."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    for table in (catalog or load_catalog()).schema:
+        frame = pd.DataFrame({c.name.lower(): standin_column(c, rows, rng) for c in table.columns})
+        executor.load_frame(table.name, frame)
+    return executor
+
+
+def make_executor(kind, client=None, data_dir=None, catalog=None):
+    if kind == "bigquery":
+        return BigQueryExecutor(client)
+    if kind == "duckdb":
+        return DuckDBExecutor(data_dir, catalog)
+    if kind == "standin":
+        return load_standin(DuckDBExecutor(None, catalog), catalog)
+    if kind == "routed":
+        return RoutingExecutor(DuckDBExecutor(data_dir, catalog), BigQueryExecutor(client))
+    raise ValueError(f"Unknown executor: {kind}")
+
+
+def detect_release(executor, default=None):
+    # The VERSION table holds a single row naming the ChEMBL release. A local
+    # dataset without version.parquet has it empty: `default`, or an error.
+    frame = executor.run(f"SELECT name FROM `{DATASET}.version` LIMIT 1")
+    if frame.empty or frame.iloc[0, 0] is None:
+        if default is None:
+            raise LookupError("the VERSION table is empty; set DRUGCROW_CHEMBL_RELEASE or export version.parquet")
+        return default
+    return str(frame.iloc[0, 0])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export a ChEMBL SQLite dump to Parquet for DuckDBExecutor")
+    parser.add_argument("sqlite_path")
+    parser.add_argument("data_dir")
+    parser.add_argument("--tables", nargs="*")
+    args = parser.parse_args()
+    load_dump(args.sqlite_path, args.data_dir, tables=args.tables)
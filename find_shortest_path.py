@@ -1,41 +1,139 @@
 #!/usr/bin/env python3
 
-import json
-import pickle
+from functools import lru_cache
+from itertools import islice
+
 import networkx as nx
 
+from csr_graph import CSRGraph, load_csr_graph, node_id, node_name
+from path_table import batch_shortest_paths
+from schema_catalog import load_catalog
+
+
+def load_graph(directory="schema_graph"):
+    return load_csr_graph(directory)
 
-def find_shortest_path(graph, start, end):
+
+def find_shortest_path(graph, start, end, catalog=None, cache=None):
+    if catalog is not None:
+        start, end = catalog.resolve_column(start), catalog.resolve_column(end)
+        if start is None or end is None:
+            return None
+    if cache is not None and hasattr(graph, "version"):
+        # PathCache in front of the search, keyed by the graph's content hash
+        paths = cache.get(start, end, graph.version())
+        if paths is None:
+            path = find_shortest_path(graph, start, end)
+            paths = [path] if path else []
+            cache.put(start, end, graph.version(), paths)
+        return paths[0] if paths else None
+    if isinstance(graph, CSRGraph) or hasattr(graph, "path_cost"):
+        return graph.shortest_path(start, end)
     try:
-        path = nx.shortest_path(graph, start, end)
-        out_path = [(n, graph.nodes[n]["node_type"]) for n in path]
+        path = nx.shortest_path(graph, node_id(start), node_id(end))
+        out_path = [(node_name(n), graph.nodes[n]["node_type"]) for n in path]
         return out_path
-    except nx.NetworkXNoPath:
+    except (nx.NetworkXNoPath, nx.NodeNotFound):
         return None
 
 
-def format_query(start, end, path, schema):
+def find_shortest_paths(graph, pairs, catalog=None):
+    """find_shortest_path for many (start, end) pairs, solved in one batch
+    over csgraph when the graph allows it."""
+    if catalog is not None:
+        pairs = [(catalog.resolve_column(a), catalog.resolve_column(b)) for a, b in pairs]
+    base, matrix = graph, None
+    if hasattr(graph, "matrix"):
+        # CostWeightedPaths: same search, over its weighted matrix
+        base, matrix = graph.graph, graph.matrix
+    if type(base) is not CSRGraph:
+        return [find_shortest_path(graph, a, b) if a and b else None for a, b in pairs]
+
+    pairs = [(node_id(a), node_id(b)) if a and b else (None, None) for a, b in pairs]
+    known = [i for i, (a, b) in enumerate(pairs) if a in base.index and b in base.index]
+    sources = [base.index[pairs[i][0]] for i in known]
+    targets = [base.index[pairs[i][1]] for i in known]
+    offsets, nodes = batch_shortest_paths(base, sources, targets, matrix)
+    paths = [None] * len(pairs)
+    for j, i in enumerate(known):
+        ids = nodes[offsets[j] : offsets[j + 1]].tolist()
+        paths[i] = [(base.names[n], base.type_of(n)) for n in ids] or None
+    return paths
+
+
+@lru_cache(maxsize=4096)
+def _k_shortest_paths(graph, start, end, k):
+    if hasattr(graph, "k_shortest_paths"):
+        return tuple(tuple(path) for path in graph.k_shortest_paths(start, end, k))
+    try:
+        paths = islice(nx.shortest_simple_paths(graph, node_id(start), node_id(end)), k)
+        return tuple(tuple((node_name(n), graph.nodes[n]["node_type"]) for n in path) for path in paths)
+    except (nx.NetworkXNoPath, nx.NodeNotFound):
+        return ()
+
+
+def find_k_shortest_paths(graph, start, end, k=3, catalog=None, cache=None):
+    """Up to k alternative join paths, best first (Yen's algorithm).
+
+    Memoized per (graph, start, end, k), so fallbacks after a failed query
+    cost no further search; a PathCache `cache` carries that across processes.
+    """
+    if catalog is not None:
+        start, end = catalog.resolve_column(start), catalog.resolve_column(end)
+        if start is None or end is None:
+            return []
+    if cache is not None and hasattr(graph, "version"):
+        paths = cache.get(start, end, graph.version(), k)
+        if paths is None:
+            paths = find_k_shortest_paths(graph, start, end, k)
+            cache.put(start, end, graph.version(), paths, k)
+        return paths
+    return [list(path) for path in _k_shortest_paths(graph, start, end, k)]
+
+
+def path_tables(path, catalog, hops=0):
+    # Tables on the join path, optionally widened by a k-hop FK neighborhood.
+    # The catalog decides what is a table, so a path from a graph with
+    # stale node types still puts every joined table in the prompt
+    tables = list(dict.fromkeys(name for name, _ in path if name in catalog))
+    # An FK column can end a path at the table it references
+    # (SUBSTRATE_RECORD_ID -> COMPOUND_RECORDS); add the table holding it
+    for column in (path[0][0], path[-1][0]):
+        holders = catalog.tables_by_column.get(column, [])
+        if holders and not set(holders) & set(tables):
+            linked = [t for t in holders if catalog.links[t] & set(tables)]
+            tables.append((linked or holders)[0])
+    return catalog.neighborhood(tables, hops)
+
+
+def format_tables(table_names, catalog, stats=None):
+    # stats (column_stats.ColumnStats) adds a short profile to non-key columns
+    text = ""
+    for table_name in table_names:
+        table = catalog.table(table_name)
+        text += f'Table: {table.name}\n'
+        for column in table.columns:
+            key = column.keys.label()
+            text += f'Column: {column.name}, Type: {column.data_type}, Key type: {key or "n/a"}'
+            hint = stats.hint(table.name, column.name) if stats and not column.keys else ""
+            text += f", Stats: {hint}\n" if hint else "\n"
+        text += "\n"
+    return text
+
+
+def format_query(start, end, path, catalog, hops=0, stats=None):
     query = f"Write a SQL query to find the relationship between the columns {start} and {end}. "
     query += "Here is are the schema of some relevant tables:\n\n"
-    for node, node_type in path:
-        if node_type == "table":
-            table = next(t for t in schema if t["TableName"].upper() == node)
-            query += f'Table: {table["TableName"]}\n'
-            for column in table["Columns"]:
-                key = column["Keys"]
-                query += f'Column: {column["ColumnName"]}, Type: {column["DataType"]}, Key type: {key or "n/a"}\n'
-            query += "\n"
-
+    query += format_tables(path_tables(path, catalog, hops), catalog, stats)
     return query
 
 
 if __name__ == "__main__":
-    with open("schema.json", "r") as f:
-        schema = json.load(f)
-
-    with open("schema_graph.pkl", "rb") as f:
-        graph = pickle.load(f)
+    catalog = load_catalog()
+    graph = load_graph()
 
     start, end = "ALOGP", "BLACK_BOX_WARNING"
-    path = find_shortest_path(graph, start, end)
-    print(format_query(start, end, path, schema))
+    path = find_shortest_path(graph, start, end, catalog)
+    print(format_query(start, end, path, catalog))
+    for alternative in find_k_shortest_paths(graph, start, end, 3, catalog)[1:]:
+        print(" -> ".join(name for name, _ in alternative))
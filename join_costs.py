@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from column_stats import STATS_PATH as COLUMN_STATS_PATH
+from column_stats import load_column_stats
+from cost_gate import DEFAULT_ROW_COUNT, data_type_width
+from executors import DATASET
+from csr_graph import node_id
+from path_table import csr_matrix_of, walk_predecessors
+from schema_catalog import load_catalog
+from schema_model import KeyType
+
+STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "table_stats.json")
+
+# Multiplier on the bytes read through a join column, by its key type
+KEY_PENALTIES = ((KeyType.PK, 1.0), (KeyType.UK, 1.0), (KeyType.FK, 1.5))
+NON_KEY_PENALTY = 10.0
+# Edges to tables the catalog does not know are all but banned (a graph built
+# from another release than the catalog's)
+UNKNOWN_TABLE_COST = 1e15
+
+
+def load_table_stats(file_path=STATS_PATH):
+    # {TABLE: row count}; empty when the stats have never been refreshed
+    if not os.path.exists(file_path):
+        return {}
+    with open(file_path, "r") as f:
+        return {k.upper(): v for k, v in json.load(f)["row_counts"].items()}
+
+
+def load_cost_stats(table_stats_path=STATS_PATH, column_stats_path=COLUMN_STATS_PATH):
+    """(row counts, ColumnStats) as every CostWeightedPaths should weigh
+    joins, so graph versions agree between the endpoint and the tools that
+    precompute cache entries for it. table_stats.json's row counts win over
+    column_stats.json's."""
+    column_stats = load_column_stats(column_stats_path)
+    return {**column_stats.row_counts, **load_table_stats(table_stats_path)}, column_stats
+
+
+def refresh_table_stats(executor, catalog=None, file_path=STATS_PATH, release=None):
+    catalog = catalog or load_catalog()
+    row_counts = {}
+    for table_name in sorted(catalog.tables):
+        frame = executor.run(f"SELECT COUNT(*) AS n FROM `{DATASET}.{table_name.lower()}`")
+        row_counts[table_name] = int(frame.iloc[0, 0])
+    with open(file_path, "w") as f:
+        json.dump({"release": release, "row_counts": row_counts}, f, indent=4)
+    return row_counts
+
+
+def key_penalty(keys, fanout=None):
+    # With column stats, the measured fan-out (rows per distinct value) of a
+    # join on the column, floored by what its key type promises
+    if fanout is not None:
+        return max(1.0 if keys else NON_KEY_PENALTY, fanout)
+    for key, penalty in KEY_PENALTIES:
+        if key in keys:
+            return penalty
+    return NON_KEY_PENALTY
+
+
+def edge_cost(catalog, row_counts, table_name, column_name, column_stats=None):
+    # Expected bytes read when a join passes through table_name.column_name;
+    # a path enters and leaves each table, so each edge carries half
+    if table_name not in catalog:
+        return UNKNOWN_TABLE_COST
+    rows = row_counts.get(table_name, DEFAULT_ROW_COUNT)
+    column = catalog.table(table_name).column(column_name)
+    width = data_type_width(column.data_type) if column else 8
+    fanout = column_stats.fanout(table_name, column_name) if column_stats else None
+    return rows * width * key_penalty(catalog.key_type(table_name, column_name), fanout) / 2
+
+
+def table_end(catalog, a, b):
+    # (table, column) for a graph edge, decided by the catalog: the end whose
+    # table holds the other end as a column, else the end that is a known
+    # table (an FK column's target)
+    if b in catalog.columns_by_table.get(a, ()):
+        return a, b
+    if a in catalog.columns_by_table.get(b, ()):
+        return b, a
+    return (a, b) if a in catalog else (b, a)
+
+
+def edge_weights(graph, catalog, row_counts, column_stats=None):
+    # One weight per CSR entry, aligned with graph.neighbors
+    weights = np.empty(len(graph.neighbors), dtype=np.float64)
+    for i in range(len(graph)):
+        for slot in range(graph.offsets[i], graph.offsets[i + 1]):
+            table_name, column_name = table_end(catalog, graph.names[i], graph.names[int(graph.neighbors[slot])])
+            weights[slot] = max(edge_cost(catalog, row_counts, table_name, column_name, column_stats), 1.0)
+    return weights
+
+
+class CostWeightedPaths:
+    """Join paths that minimize expected bytes scanned instead of hop count.
+
+    Dijkstra (scipy.sparse.csgraph) over the CSR schema graph with edge
+    weights from table row counts and join-column key types (or measured
+    join fan-out, given column_stats.py statistics). Predecessor rows are
+    memoized per source node.
+    """
+
+    def __init__(self, graph, catalog=None, row_counts=None, column_stats=None):
+        from scipy.sparse import csr_matrix
+
+        self.graph = graph
+        self.catalog = catalog or load_catalog()
+        if row_counts is None:
+            row_counts, loaded = load_cost_stats()
+            column_stats = loaded if column_stats is None else column_stats
+        self.row_counts = row_counts
+        self.index = graph.index
+        self.weights = edge_weights(graph, self.catalog, self.row_counts, column_stats)
+        # Python floats index far faster than numpy scalars in the Yen loop
+        self._weight_list = self.weights.tolist()
+        structure = csr_matrix_of(graph)
+        self.matrix = csr_matrix((self.weights, structure.indices, structure.indptr), shape=structure.shape)
+        self._version = None
+        self.predecessors_from = lru_cache(maxsize=1024)(self._predecessors_from)
+
+    def _predecessors_from(self, source):
+        from scipy.sparse.csgraph import dijkstra
+
+        return dijkstra(self.matrix, directed=False, indices=source, return_predecessors=True)
+
+    def type_of(self, i):
+        return self.graph.type_of(i)
+
+    def version(self):
+        if self._version is None:
+            digest = hashlib.sha256(self.graph.version().encode())
+            digest.update(self.weights.tobytes())
+            self._version = digest.hexdigest()[:16]
+        return self._version
+
+    def shortest_path(self, start, end):
+        if node_id(start) not in self.index or node_id(end) not in self.index:
+            return None
+        source, target = self.index[node_id(start)], self.index[node_id(end)]
+        _, predecessors = self.predecessors_from(source)
+        path = walk_predecessors({source: predecessors}, source, target)
+        if path is None:
+            return None
+        return [(self.graph.names[i], self.graph.type_of(i)) for i in path]
+
+    def k_shortest_paths(self, start, end, k):
+        return self.graph.k_shortest_paths(start, end, k, self._weight_list)
+
+    def path_cost(self, start, end):
+        distances, _ = self.predecessors_from(self.index[node_id(start)])
+        return float(distances[self.index[node_id(end)]])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from executors import make_executor
+
+    parser = argparse.ArgumentParser(description="Refresh table_stats.json row counts from an executor")
+    parser.add_argument("--executor", default="bigquery", choices=["bigquery", "duckdb"])
+    parser.add_argument("--data-dir", help="Parquet directory for the duckdb executor")
+    parser.add_argument("--release")
+    args = parser.parse_args()
+
+    client = None
+    if args.executor == "bigquery":
+        from google.cloud.bigquery.client import Client
+
+        client = Client()
+    executor = make_executor(args.executor, client, args.data_dir)
+    counts = refresh_table_stats(executor, release=args.release)
+    print(f"wrote {len(counts)} row counts to {STATS_PATH}")
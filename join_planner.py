@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict, namedtuple
+
+from schema_catalog import load_catalog
+
+# edges join (name, node_type) nodes: a table and a column may share a name
+JoinPlan = namedtuple("JoinPlan", ["terminals", "tables", "edges"])
+
+
+def minimum_spanning_tree(nodes, weight):
+    # Prim's algorithm over the complete graph on `nodes`
+    nodes = list(nodes)
+    if not nodes:
+        return []
+    in_tree = {nodes[0]}
+    best = {n: (weight(nodes[0], n), nodes[0]) for n in nodes[1:]}
+    edges = []
+    while best:
+        node = min(best, key=lambda n: (best[n][0], n))
+        cost, parent = best.pop(node)
+        if cost == float("inf"):
+            return None
+        edges.append((parent, node))
+        in_tree.add(node)
+        for other in best:
+            w = weight(node, other)
+            if w < best[other][0]:
+                best[other] = (w, node)
+    return edges
+
+
+class JoinPlanner:
+    """Approximate Steiner tree connecting N columns in the schema graph.
+
+    Kou-Markowsky-Berman: MST of the terminals' metric closure (pairwise
+    shortest paths: predecessor-table walks on a plain CSRGraph, one memoized
+    Dijkstra row per terminal on CostWeightedPaths), expanded back into graph
+    paths, re-spanned and stripped of non-terminal leaves. The last
+    `memo_entries` plans are memoized by terminal set.
+    """
+
+    def __init__(self, graph, catalog=None, memo_entries=1024):
+        self.graph = graph
+        self.catalog = catalog or load_catalog()
+        self.memo_entries = memo_entries
+        # Least recently used first; questions can name any column set
+        self.memo = OrderedDict()
+
+    def path(self, start, end):
+        # [(name, node_type), ...] as the graph reports it (a TableGraph has
+        # no column nodes to look up)
+        path = self.graph.shortest_path(start, end)
+        if not path:
+            return None
+        return [tuple(node) for node in path]
+
+    def plan(self, columns):
+        terminals = frozenset(c for c in map(self.catalog.resolve_column, columns) if c)
+        if terminals in self.memo:
+            self.memo.move_to_end(terminals)
+            return self.memo[terminals]
+        plan = self.memo[terminals] = self._plan(sorted(terminals))
+        while len(self.memo) > self.memo_entries:
+            self.memo.popitem(last=False)
+        return plan
+
+    def _plan(self, terminals):
+        if len(terminals) < 2:
+            return None
+        paths = {}
+        for i, a in enumerate(terminals):
+            for b in terminals[i + 1 :]:
+                paths[a, b] = paths[b, a] = self.path(a, b)
+
+        def distance(a, b):
+            # Expected bytes when the graph is cost-weighted, else hop count
+            path = paths[a, b]
+            if not path:
+                return float("inf")
+            if hasattr(self.graph, "path_cost"):
+                return self.graph.path_cost(a, b)
+            return len(path) - 1
+
+        closure_tree = minimum_spanning_tree(terminals, distance)
+        if closure_tree is None:
+            return None
+
+        # Expand closure edges into graph edges, then re-span that subgraph
+        adjacency = {}
+        for a, b in closure_tree:
+            path = paths[a, b]
+            for u, v in zip(path, path[1:]):
+                adjacency.setdefault(u, set()).add(v)
+                adjacency.setdefault(v, set()).add(u)
+        edges = self._spanning_edges(adjacency, (terminals[0], "column"))
+
+        # Strip non-terminal leaves until none are left
+        degree = {}
+        for u, v in edges:
+            degree[u] = degree.get(u, 0) + 1
+            degree[v] = degree.get(v, 0) + 1
+        keep = {(t, "column") for t in terminals}
+        pruned = True
+        while pruned:
+            pruned = False
+            for u, v in list(edges):
+                for leaf in (u, v):
+                    if degree[leaf] == 1 and leaf not in keep:
+                        edges.remove((u, v))
+                        degree[u] -= 1
+                        degree[v] -= 1
+                        pruned = True
+                        break
+
+        nodes = {n for edge in edges for n in edge}
+        tables = sorted(name for name, node_type in nodes if node_type == "table")
+        return JoinPlan(tuple(terminals), tables, edges)
+
+    @staticmethod
+    def _spanning_edges(adjacency, root):
+        # BFS tree of the expanded subgraph (its edges all lie on chosen paths)
+        seen = {root}
+        frontier = [root]
+        edges = []
+        while frontier:
+            next_frontier = []
+            for u in frontier:
+                for v in sorted(adjacency[u]):
+                    if v not in seen:
+                        seen.add(v)
+                        edges.append((u, v))
+                        next_frontier.append(v)
+            frontier = next_frontier
+        return edges
+
+
+if __name__ == "__main__":
+    from find_shortest_path import load_graph
+
+    planner = JoinPlanner(load_graph())
+    plan = planner.plan(["ALOGP", "BLACK_BOX_WARNING", "MAX_PHASE", "STANDARD_VALUE"])
+    print("tables:", plan.tables)
+    for (u, _), (v, _) in plan.edges:
+        print(f"  {u} -- {v}")
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from csr_graph import node_id
+from sql_cache import CACHE_DIR, VolumeSync, add_counts, sum_counts, transaction
+
+COUNTERS = ("memory_hits", "disk_hits", "misses")
+
+
+class PathCache:
+    """Join paths keyed by (start, end, graph version, k).
+
+    Each entry is the list of up to k best paths (k=1 for plain shortest
+    path lookups; an empty list records "no path"). An in-memory LRU sits in
+    front of a SQLite file; with a VolumeSync `sync` on a mounted volume each
+    container writes its own shard and reads everyone's, so a new
+    container's first lookups are already warm. Paths are undirected:
+    (end, start) is served from the (start, end) entry.
+
+    Hit and miss counters live in the shards too, so stats() reports every
+    container's lookups. Memory hits and misses are added to them with the
+    next write, or after `flush_interval` seconds.
+    """
+
+    def __init__(self, file_path=None, memory_entries=4096, max_entries=100_000, sync=None, flush_interval=60.0):
+        if file_path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            file_path = os.path.join(CACHE_DIR, "path_cache.sqlite")
+        self.file_path = file_path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.memory = OrderedDict()
+        # Counts not yet written to path_cache_counters
+        self.pending = Counter()
+        self.flush_interval = flush_interval
+        self.flushed_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.sync = sync or VolumeSync()
+        self.shard = self.sync.shard(file_path)
+        with transaction(self.shard) as db:
+            db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS path_cache (
+                    start TEXT NOT NULL,
+                    end TEXT NOT NULL,
+                    graph_version TEXT NOT NULL,
+                    k INTEGER NOT NULL,
+                    paths TEXT NOT NULL,
+                    used_at REAL NOT NULL,
+                    PRIMARY KEY (start, end, graph_version, k)
+                );
+                CREATE INDEX IF NOT EXISTS path_cache_used_at ON path_cache (used_at);
+                CREATE TABLE IF NOT EXISTS path_cache_counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                """
+            )
+
+    @staticmethod
+    def key(start, end, graph_version, k):
+        return (start, end, graph_version, k) if start <= end else (end, start, graph_version, k)
+
+    @staticmethod
+    def orient(paths, start):
+        # Stored paths run from the smaller name; flip for the caller's order
+        return [path[::-1] if path[0][0] != start else path for path in paths]
+
+    def _remember(self, key, paths):
+        self.memory[key] = paths
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def _flush(self, db):
+        add_counts(db, "path_cache_counters", self.pending)
+        self.pending.clear()
+        self.flushed_at = time.monotonic()
+        self.sync.mark()
+
+    def _read(self, key):
+        # Stored paths JSON (counted as a disk hit, used_at touched in this
+        # container's shard), or None
+        for shard in self.sync.shards(self.file_path):
+            with transaction(shard) as db:
+                row = db.execute(
+                    "SELECT paths FROM path_cache WHERE start = ? AND end = ? AND graph_version = ? AND k = ?", key
+                ).fetchone()
+                if row is not None and shard == self.shard:
+                    db.execute(
+                        "UPDATE path_cache SET used_at = ? WHERE start = ? AND end = ? AND graph_version = ? AND k = ?",
+                        (time.time(), *key),
+                    )
+                    self.pending["disk_hits"] += 1
+                    self._flush(db)
+                    return row[0]
+            if row is not None:
+                break
+        else:
+            return None
+        # Another container's entry: copy it into this shard for eviction
+        with transaction(self.shard) as db:
+            db.execute("INSERT OR REPLACE INTO path_cache VALUES (?, ?, ?, ?, ?, ?)", (*key, row[0], time.time()))
+            self.pending["disk_hits"] += 1
+            self._flush(db)
+        return row[0]
+
+    def get(self, start, end, graph_version, k=1):
+        """List of up to k paths (empty: no path), or None on a miss."""
+        key = self.key(start, end, graph_version, k)
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                self.pending["memory_hits"] += 1
+                if time.monotonic() - self.flushed_at > self.flush_interval:
+                    with transaction(self.shard) as db:
+                        self._flush(db)
+                return self.orient(self.memory[key], start)
+            stored = self._read(key)
+            if stored is None and self.sync.reload():
+                stored = self._read(key)
+            if stored is None:
+                # Written with the put that usually follows a miss
+                self.pending["misses"] += 1
+                return None
+            paths = [[tuple(node) for node in path] for path in json.loads(stored)]
+            self._remember(key, paths)
+            return self.orient(paths, start)
+
+    def put_many(self, items, graph_version, k=1):
+        # items: ((start, end, paths), ...)
+        now = time.time()
+        rows = []
+        with self.lock:
+            for start, end, paths in items:
+                key = self.key(start, end, graph_version, k)
+                paths = self.orient([list(path) for path in paths], key[0])
+                self._remember(key, paths)
+                rows.append((*key, json.dumps(paths), now))
+            with transaction(self.shard) as db:
+                db.executemany("INSERT OR REPLACE INTO path_cache VALUES (?, ?, ?, ?, ?, ?)", rows)
+                db.execute(
+                    "DELETE FROM path_cache WHERE rowid IN ("
+                    "SELECT rowid FROM path_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self._flush(db)
+
+    def put(self, start, end, graph_version, paths, k=1):
+        self.put_many([(start, end, paths)], graph_version, k)
+
+    def carry_over(self, old_version, new_version, touched_nodes):
+        """Copy entries from a previous graph version whose paths avoid every
+        touched node ID (see build_graph.update_graph's changelog). Those paths
+        are still valid joins; ones that new edges would shorten stay until
+        they age out. Returns the number of entries copied."""
+        touched = set(touched_nodes)
+        with self.lock:
+            rows = []
+            for shard in self.sync.shards(self.file_path):
+                with transaction(shard) as db:
+                    rows += db.execute(
+                        "SELECT start, end, k, paths, used_at FROM path_cache WHERE graph_version = ?", (old_version,)
+                    ).fetchall()
+            kept = [
+                (start, end, new_version, k, paths, used_at)
+                for start, end, k, paths, used_at in rows
+                if node_id(start) not in touched
+                and node_id(end) not in touched
+                and not any(node_id(*node) in touched for path in json.loads(paths) for node in path)
+            ]
+            with transaction(self.shard) as db:
+                db.executemany("INSERT OR IGNORE INTO path_cache VALUES (?, ?, ?, ?, ?, ?)", kept)
+            self.sync.mark()
+        return len(kept)
+
+    def stats(self):
+        with self.lock:
+            with transaction(self.shard) as db:
+                self._flush(db)
+            shards = self.sync.shards(self.file_path)
+            counters = dict.fromkeys(COUNTERS, 0) | sum_counts(shards, "path_cache_counters")
+            keys = set()
+            for shard in shards:
+                with transaction(shard) as db:
+                    keys.update(db.execute("SELECT start, end, graph_version, k FROM path_cache"))
+        lookups = sum(counters.values())
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        return dict(counters, hit_rate=hits / lookups if lookups else 0.0, entries=len(keys))
+
+    def clear(self):
+        # This container's shard (the whole cache without a volume)
+        with self.lock, transaction(self.shard) as db:
+            self.memory.clear()
+            self.pending.clear()
+            db.execute("DELETE FROM path_cache")
+            db.execute("DELETE FROM path_cache_counters")
+        self.sync.mark()
+
+
+def question_pairs(questions, retriever, k=20):
+    # Column pairs the endpoint would search for, from the confident matches
+    pairs = set()
+    for question in questions:
+        columns, _ = retriever.select(question, k=k)
+        for i, a in enumerate(columns):
+            for b in columns[i + 1 :]:
+                pairs.add((a, b))
+    return sorted(pairs)
+
+
+def read_question_log(file_path):
+    # Plain text (one question per line) or JSON lines with a "message" field
+    questions = []
+    with open(file_path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                record = json.loads(line)
+                line = record.get("message") or record.get("question") or ""
+            if line:
+                questions.append(line)
+    return questions
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from column_retriever import load_retriever
+    from find_shortest_path import find_k_shortest_paths, find_shortest_paths, load_graph
+    from join_costs import CostWeightedPaths
+    from schema_catalog import load_catalog
+    from table_graph import load_table_graph
+
+    parser = argparse.ArgumentParser(description="Join-path cache")
+    parser.add_argument("command", choices=["warm", "carry-over", "stats", "clear"])
+    parser.add_argument("log", nargs="?", help="question log for warm (text or JSON lines), changelog for carry-over")
+    parser.add_argument("--graph", default="weighted", choices=["weighted", "table", "bipartite"])
+    parser.add_argument("--k", type=int, default=3, help="also cache k alternative paths (DRUGCROW_PATH_CANDIDATES)")
+    parser.add_argument("--cache", help="SQLite file (default: $DRUGCROW_CACHE_DIR/path_cache.sqlite)")
+    args = parser.parse_args()
+
+    cache = PathCache(args.cache)
+    if args.command == "warm":
+        catalog = load_catalog()
+        if args.graph == "table":
+            graph = load_table_graph()
+        elif args.graph == "weighted":
+            graph = CostWeightedPaths(load_graph(), catalog)
+        else:
+            graph = load_graph()
+        pairs = question_pairs(read_question_log(args.log), load_retriever(catalog=catalog))
+        paths = find_shortest_paths(graph, pairs)
+        cache.put_many([(a, b, [path] if path else []) for (a, b), path in zip(pairs, paths)], graph.version())
+        if args.k > 1:
+            alternatives = [(a, b, find_k_shortest_paths(graph, a, b, args.k)) for a, b in pairs]
+            cache.put_many(alternatives, graph.version(), args.k)
+        print(f"cached paths for {len(pairs)} column pairs, graph {graph.version()}")
+    elif args.command == "carry-over":
+        with open(args.log or "schema_graph/changelog.json", "r") as f:
+            changelog = json.load(f)
+        touched = changelog["touched_nodes"] + changelog["removed_nodes"]
+        for name, (old_version, new_version) in changelog["graph_versions"].items():
+            count = cache.carry_over(old_version, new_version, touched)
+            print(f"{name}: carried {count} entries from {old_version} to {new_version}")
+    elif args.command == "clear":
+        cache.clear()
+    print(json.dumps(cache.stats(), indent=4))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import os
+import time
+
+import numpy as np
+
+NO_PATH = -9999
+
+
+def csr_matrix_of(graph):
+    from scipy.sparse import csr_matrix
+
+    n = len(graph)
+    data = np.ones(len(graph.neighbors), dtype=np.int8)
+    return csr_matrix((data, np.asarray(graph.neighbors), np.asarray(graph.offsets)), shape=(n, n))
+
+
+def all_pairs_predecessors(graph):
+    # predecessors[i, j] is the node before j on a shortest i -> j path
+    from scipy.sparse.csgraph import shortest_path
+
+    if len(graph) > np.iinfo(np.int16).max:
+        raise ValueError(f"{len(graph)} nodes do not fit the int16 predecessor table")
+
+    _, predecessors = shortest_path(
+        csr_matrix_of(graph), directed=False, unweighted=True, return_predecessors=True
+    )
+    return predecessors.astype(np.int16)
+
+
+def walk_predecessors(predecessors, source, target):
+    # Rebuild a path from the table alone; returns node IDs or None
+    if source == target:
+        return [source]
+    row = predecessors[source]
+    path = [target]
+    node = int(row[target])
+    if node == NO_PATH:
+        return None
+    while node != source:
+        path.append(node)
+        node = int(row[node])
+    path.append(source)
+    return path[::-1]
+
+
+def batch_shortest_paths(graph, sources, targets, matrix=None):
+    """Shortest paths for many (source, target) node-ID pairs at once.
+
+    One csgraph call covers every distinct source (the graph's predecessor
+    table is used instead when loaded and `matrix` is not given); all paths
+    are then walked back together, one vectorized step per hop. Returns
+    (offsets, nodes): pair i's path is nodes[offsets[i]:offsets[i + 1]],
+    empty when there is none. `matrix` overrides the unit edge weights.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    if matrix is None and getattr(graph, "predecessors", None) is not None:
+        predecessors, rows = graph.predecessors, sources
+    else:
+        from scipy.sparse.csgraph import shortest_path
+
+        unique, rows = np.unique(sources, return_inverse=True)
+        _, predecessors = shortest_path(
+            csr_matrix_of(graph) if matrix is None else matrix,
+            method="D",
+            directed=False,
+            unweighted=matrix is None,
+            indices=unique,
+            return_predecessors=True,
+        )
+
+    # steps[k, i] is the k-th node back from pair i's target (-1 once done)
+    current = targets.copy()
+    found = (sources == targets) | (predecessors[rows, targets] != NO_PATH)
+    current[~found] = -1
+    steps = [current]
+    active = found & (current != sources)
+    while active.any():
+        current = np.where(active, predecessors[rows, np.maximum(current, 0)], -1)
+        steps.append(current)
+        active &= current != sources
+
+    steps = np.stack(steps)
+    lengths = (steps >= 0).sum(axis=0)
+    offsets = np.zeros(len(sources) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    # Column-major over the reversed steps gives each path source-first
+    reversed_steps = steps[::-1].T
+    nodes = reversed_steps[reversed_steps >= 0].astype(np.int32)
+    return offsets, nodes
+
+
+def save_predecessors(predecessors, directory):
+    np.save(os.path.join(directory, "predecessors.npy"), predecessors)
+
+
+def load_predecessors(directory, mmap_mode="r"):
+    file_path = os.path.join(directory, "predecessors.npy")
+    if not os.path.exists(file_path):
+        return None
+    return np.load(file_path, mmap_mode=mmap_mode).view(np.ndarray)
+
+
+if __name__ == "__main__":
+    from csr_graph import load_csr_graph
+
+    directory = "schema_graph"
+    graph = load_csr_graph(directory)
+
+    start = time.perf_counter()
+    predecessors = all_pairs_predecessors(graph)
+    elapsed = time.perf_counter() - start
+    save_predecessors(predecessors, directory)
+
+    size = os.path.getsize(os.path.join(directory, "predecessors.npy"))
+    print(f"{len(graph)} nodes, {len(graph) ** 2} pairs")
+    print(f"build time: {elapsed * 1e3:.1f} ms")
+    print(f"artifact size: {size / 1024:.1f} KiB ({predecessors.dtype})")
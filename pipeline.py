@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+import logging
+
+from cost_gate import QueryRejected
+from executors import QueryFailed
+from find_shortest_path import find_k_shortest_paths, path_tables
+from prompts import column_selection_messages, multi_sql_messages, repair_sql_messages, sql_messages
+from sql_compiler import compile_path, compile_plan
+from sql_validator import extract_sql, validate_sql
+
+logger = logging.getLogger(__name__)
+
+
+class Pipeline:
+    """The endpoint's question -> rows flow over components built elsewhere.
+
+    Columns come from the local retriever (when it is unsure the LLM picks
+    from every column, with the retriever's shortlist as a hint); SQL comes from the SQL cache, then the
+    join-path compiler, then the LLM with one repair round trip; results
+    come from `executor` (in the endpoint: cached and cost-gated). `llm` is
+    anything with invoke(messages).content, so the whole flow runs offline
+    with a stand-in executor and a scripted model.
+    """
+
+    def __init__(
+        self, catalog, retriever, graph, planner, llm, executor, sql_cache,
+        path_cache=None, column_stats=None, retriever_top_k=20, path_candidates=3, prompt_hops=0,
+    ):
+        self.catalog = catalog
+        self.retriever = retriever
+        self.graph = graph
+        self.planner = planner
+        self.llm = llm
+        self.executor = executor
+        self.sql_cache = sql_cache
+        self.path_cache = path_cache
+        self.column_stats = column_stats
+        self.retriever_top_k = retriever_top_k
+        self.path_candidates = path_candidates
+        self.prompt_hops = prompt_hops
+
+    def select_columns(self, question):
+        columns, candidates = self.retriever.select(question, k=self.retriever_top_k)
+        if not columns:
+            # Low confidence: the shortlist can miss, so offer every column
+            messages = column_selection_messages(question, self.catalog.columns_csv, candidates)
+            columns = self.llm.invoke(messages).content.split(",")
+        return [c for c in dict.fromkeys(map(self.catalog.resolve_column, columns)) if c]
+
+    def generate_sql(self, columns, path=None, plan=None):
+        # LLM fallback for joins the compiler gives up on; returns (query, problems)
+        if len(columns) == 2:
+            messages = sql_messages(
+                columns[0], columns[1], path, self.catalog, hops=self.prompt_hops, stats=self.column_stats
+            )
+        else:
+            messages = multi_sql_messages(columns, plan, self.catalog, hops=self.prompt_hops, stats=self.column_stats)
+        query = extract_sql(self.llm.invoke(messages).content)
+        problems = validate_sql(query, self.catalog)
+        if problems:
+            # One repair round trip is far cheaper than a failed remote job
+            if path:
+                tables = path_tables(path, self.catalog, self.prompt_hops)
+            else:
+                tables = self.catalog.neighborhood(plan.tables, self.prompt_hops) if plan else ()
+            messages = repair_sql_messages(query, problems, self.catalog, stats=self.column_stats, tables=tables)
+            query = extract_sql(self.llm.invoke(messages).content)
+            problems = validate_sql(query, self.catalog)
+        return query, problems
+
+    def answer(self, question):
+        columns = self.select_columns(question)
+        if len(columns) < 2:
+            return {"success": False, "data": "Could not find two known columns in the question"}
+        cached_query = query = self.sql_cache.get(columns, self.catalog.version)
+        path = plan = None
+        alternatives = []
+        if query is None:
+            if len(columns) == 2:
+                paths = find_k_shortest_paths(
+                    self.graph, columns[0], columns[1], self.path_candidates, self.catalog, cache=self.path_cache
+                )
+                path = paths[0] if paths else None
+                # Mechanical joins need no model; compile_path gives up on anything else
+                compiled = [q for q in (compile_path(p, self.catalog) for p in paths) if q]
+                query, alternatives = (compiled[0], compiled[1:]) if compiled else (None, [])
+            else:
+                # One query over the Steiner tree instead of a round trip per pair
+                plan = self.planner.plan(columns)
+                query = compile_plan(plan, self.catalog) if plan else None
+        if query is None:
+            query, problems = self.generate_sql(columns, path, plan)
+            if problems:
+                return {"success": False, "data": "Could not build a valid query: " + "; ".join(problems)}
+        rows, errors = None, []
+        for candidate in [query] + alternatives:
+            # A rejected, failed or empty result falls through to the next join path
+            try:
+                rows = self.executor.run(candidate)
+            except (QueryRejected, QueryFailed) as e:
+                logger.warning("join path query failed: %s", e)
+                errors.append(str(e))
+                continue
+            query = candidate
+            if len(rows):
+                break
+        if rows is None:
+            return {"success": False, "data": "; ".join(errors)}
+        if cached_query is None:
+            # Only SQL that actually ran is worth replaying
+            self.sql_cache.put(columns, self.catalog.version, query)
+        return {"success": True, "data": rows.to_string()}
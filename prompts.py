@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+from executors import referenced_tables
+from find_shortest_path import format_query, format_tables
+from schema_model import as_dicts
+
+SQL_INSTRUCTIONS = (
+    "Return the query as a string. Add bigquery-public-data.ebi_chembl before the table names. "
+    "Limit to the first 10 rows. Table names should be in lower case. Only return the query nothing else."
+)
+
+
+def column_selection_messages(question, columns_csv, candidates=()):
+    openai_prompt = f"""Given a list of 
+    available columns {columns_csv}. Select from the list of available columns the columns that are mentioned in the 
+    query.{question}. Return the result as a string with each column name seperated by ,.The column names have to match exactly on every character. "
+                   "Uppercase or lowercase differences are okay. Dont add any other text or 
+    information."""
+    if candidates:
+        # Ranked hints only; the answer may use any available column
+        openai_prompt += f" The closest matches by name and description are {','.join(candidates)}."
+    return [
+        ("system", "You are an agent who is given a query and a list of columns and you are trying to figure out "
+                   "which of the columns are mentioned."),
+        ("human", openai_prompt),
+    ]
+
+
+def join_columns(columns):
+    return " and ".join([", ".join(columns[:-1]), columns[-1]]) if len(columns) > 1 else columns[0]
+
+
+def full_schema_sql_messages(columns, schema):
+    openai_prompt = f"""Give description of available columns in the tables in a database as a list of json objects 
+    {as_dicts(schema)} Where 
+    each object represents one database table. Build a SQL query that connects the columns
+     {join_columns(columns)}. {SQL_INSTRUCTIONS}"""
+    return [
+        ("system", "You are an agent who is given information about the tables in a sql database in the form of a "
+                   "json, and you are trying to construct a sql query to relate columns"),
+        ("human", openai_prompt),
+    ]
+
+
+def path_sql_messages(start, end, path, catalog, hops=0, stats=None):
+    # Only the tables on the join path (plus `hops` FK neighbors) go in the prompt
+    openai_prompt = format_query(start, end, path, catalog, hops, stats) + SQL_INSTRUCTIONS
+    return [
+        ("system", "You are an agent who is given the schema of the tables on a join path in a sql database, "
+                   "and you are trying to construct a sql query to relate two columns"),
+        ("human", openai_prompt),
+    ]
+
+
+def plan_sql_messages(columns, plan, catalog, hops=0, stats=None):
+    # Only the Steiner-tree tables (plus `hops` FK neighbors) go in the prompt
+    openai_prompt = (
+        f"Write a SQL query to find the relationship between the columns {join_columns(columns)}. "
+        "Here is are the schema of some relevant tables:\n\n"
+        + format_tables(catalog.neighborhood(plan.tables, hops), catalog, stats)
+        + SQL_INSTRUCTIONS
+    )
+    return [
+        ("system", "You are an agent who is given the schema of the tables that connect several columns in a sql "
+                   "database, and you are trying to construct a sql query to relate those columns"),
+        ("human", openai_prompt),
+    ]
+
+
+def sql_messages(start, end, path, catalog, hops=0, stats=None):
+    if path is None:
+        return full_schema_sql_messages([start, end], catalog.schema)
+    return path_sql_messages(start, end, path, catalog, hops, stats)
+
+
+def multi_sql_messages(columns, plan, catalog, hops=0, stats=None):
+    if plan is None:
+        return full_schema_sql_messages(columns, catalog.schema)
+    return plan_sql_messages(columns, plan, catalog, hops, stats)
+
+
+def repair_sql_messages(query, problems, catalog, stats=None, tables=()):
+    # The join path's or plan's `tables` plus the known ones the query reads:
+    # an "Unknown table" query may reference none the catalog has
+    tables = list(dict.fromkeys([*tables, *sorted(t for t in referenced_tables(query) if t in catalog)]))
+    if not tables:
+        tables = sorted(catalog.tables)
+    openai_prompt = (
+        f"This BigQuery SQL query failed validation:\n\n{query}\n\nProblems:\n"
+        + "".join(f"- {problem}\n" for problem in problems)
+        + "\nHere is the schema of the tables it can use:\n\n"
+        + format_tables(tables, catalog, stats)
+        + f"Fix the query. {SQL_INSTRUCTIONS}"
+    )
+    return [
+        ("system", "You are an agent who repairs sql queries so that they only use tables, columns and joins "
+                   "that exist in the given schema"),
+        ("human", openai_prompt),
+    ]
+
+
+def count_tokens(messages, model="gpt-4-turbo"):
+    text = "\n".join(content for _, content in messages)
+    try:
+        import tiktoken
+    except ImportError:
+        # ~4 characters per token for English/SQL text
+        return len(text) // 4
+    return len(tiktoken.encoding_for_model(model).encode(text))
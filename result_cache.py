@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+import hashlib
+import os
+import re
+import threading
+from functools import lru_cache
+
+import pandas as pd
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+from executors import Executor
+from sql_cache import VolumeSync, add_counts, sum_counts, transaction
+
+CACHE_DIR = os.environ.get("DRUGCROW_CACHE_DIR", "cache")
+
+# Fallback for SQL sqlglot cannot parse. One left-to-right scan, so comment
+# markers inside literals and quotes inside comments are both left alone
+LITERAL_OR_COMMENT_RE = re.compile(
+    r"(?P<literal>'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")|--[^\n]*|/\*.*?\*/", re.S
+)
+SPACE_RE = re.compile(r"\s+")
+
+
+def normalized_text(query):
+    # Comments dropped and whitespace collapsed; everything else as written
+    text = LITERAL_OR_COMMENT_RE.sub(lambda m: m.group("literal") or " ", query)
+    return SPACE_RE.sub(" ", text).strip().rstrip(";").strip()
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(query):
+    """Canonical text of `query`: sqlglot's BigQuery rendering of its syntax
+    tree, so comments, case, spacing and table aliases (renamed t1, t2, ...
+    in order of appearance) do not matter while literals and operators do.
+    Unparsable SQL falls back to its text without comments."""
+    try:
+        tree = sqlglot.parse_one(query, read="bigquery")
+    except ParseError:
+        tree = None
+    if tree is None:
+        return normalized_text(query)
+
+    aliases = {}
+    for alias in tree.find_all(exp.TableAlias, bfs=False):
+        name = alias.name.lower()
+        if name and name not in aliases:
+            aliases[name] = f"t{len(aliases) + 1}"
+    for identifier in tree.find_all(exp.Identifier):
+        name = identifier.name.lower()
+        parent = identifier.parent
+        if isinstance(parent, exp.TableAlias) or (isinstance(parent, exp.Column) and identifier is parent.args.get("table")):
+            name = aliases.get(name, name)
+        identifier.set("this", name)
+    return tree.sql(dialect="bigquery", comments=False)
+
+
+class ResultCache:
+    """Query results stored as Parquet files on local disk.
+
+    Keyed by the SQL fingerprint plus the ChEMBL release, since the dataset
+    only changes between releases. The least recently read files are deleted
+    once the directory grows past `max_bytes`. Each file is one key, so
+    containers sharing the directory through a VolumeSync `sync` never
+    overwrite each other's entries; hit and miss counts go to this
+    container's shard of counters.sqlite, and stats() sums every shard.
+    """
+
+    def __init__(self, directory=None, release="unknown", max_bytes=512 * 1024 * 1024, sync=None):
+        self.directory = directory or os.path.join(CACHE_DIR, "results")
+        os.makedirs(self.directory, exist_ok=True)
+        self.release = release
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.sync = sync or VolumeSync()
+        self.counters_path = os.path.join(self.directory, "counters.sqlite")
+        with transaction(self.sync.shard(self.counters_path)) as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache_counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+
+    def count(self, name):
+        with transaction(self.sync.shard(self.counters_path)) as db:
+            add_counts(db, "result_cache_counters", {name: 1})
+        self.sync.mark()
+
+    def key(self, query):
+        return hashlib.sha256(f"{self.release}\n{fingerprint(query)}".encode()).hexdigest()
+
+    def path(self, query):
+        return os.path.join(self.directory, f"{self.key(query)}.parquet")
+
+    def read(self, file_path):
+        try:
+            return pd.read_parquet(file_path)
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+
+    def get(self, query):
+        file_path = self.path(query)
+        frame = self.read(file_path)
+        if frame is None and self.sync.reload():
+            frame = self.read(file_path)
+        if frame is None:
+            self.count("misses")
+            return None
+        # mtime doubles as the last-access time for eviction
+        os.utime(file_path)
+        self.count("hits")
+        return frame
+
+    def put(self, query, frame):
+        file_path = self.path(query)
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        frame.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, file_path)
+        self.evict()
+        self.sync.mark()
+
+    def evict(self):
+        with self.lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".parquet"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, file_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def stats(self):
+        counters = sum_counts(self.sync.shards(self.counters_path), "result_cache_counters")
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        }
+
+
+class CachedExecutor(Executor):
+    def __init__(self, executor, cache):
+        self.executor = executor
+        self.cache = cache
+
+    def run(self, query):
+        frame = self.cache.get(query)
+        if frame is None:
+            frame = self.executor.run(query)
+            self.cache.put(query, frame)
+        return frame
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+
+from schema_model import KeyType, as_tables
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema.json")
+
+
+def canonical(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def table_hash(table):
+    return content_hash(canonical(table.to_dict()))
+
+
+def manifest_hash(table_hashes):
+    # table_hashes: [[TABLE, table hash], ...] in schema order
+    return content_hash(canonical(table_hashes))
+
+
+def schema_version(schema):
+    """The schema's version key: schema_store's manifest hash, whichever
+    file (schema.json, schema.bin, a store release) the schema came from."""
+    return manifest_hash([[table.name.upper(), table_hash(table)] for table in as_tables(schema)])
+
+
+class TableIndex(Mapping):
+    """TABLE -> Table over a schema sequence. Over a schema_snapshot
+    SchemaSnapshot, a Table is only decoded when it is looked up."""
+
+    def __init__(self, schema, table_names):
+        self.schema = schema
+        self.positions = {name.upper(): i for i, name in enumerate(table_names)}
+
+    def __getitem__(self, table_name):
+        return self.schema[self.positions[table_name]]
+
+    def __contains__(self, table_name):
+        return table_name in self.positions
+
+    def __iter__(self):
+        return iter(self.positions)
+
+    def __len__(self):
+        return len(self.positions)
+
+
+class SchemaCatalog:
+    """Read-only view of schema.json with dict indexes for the lookups the
+    endpoint does on every request. schema may be schema.json's dicts,
+    schema_model Tables, or a SchemaSnapshot; the indexes need only column
+    names and key types, so over a snapshot the catalog keeps it and decodes
+    each Table the first time it is asked for."""
+
+    def __init__(self, schema, version=None):
+        if hasattr(schema, "column_keys"):
+            self.schema = schema
+            column_keys = schema.column_keys()
+        else:
+            self.schema = as_tables(schema)
+            column_keys = [(t.name, [(c.name, c.keys) for c in t.columns]) for t in self.schema]
+        # schema_version(); caches use it as their version key
+        self.version = version or schema_version(self.schema)
+        self.tables = TableIndex(self.schema, [table_name for table_name, _ in column_keys])
+        self.columns_by_table = {}
+        self.tables_by_column = {}
+        self.key_types = {}
+        self.fk_edges = {}
+
+        for table_name, columns in column_keys:
+            table_name = table_name.upper()
+            self.columns_by_table[table_name] = [column_name.upper() for column_name, _ in columns]
+            for column_name, keys in columns:
+                column_name = column_name.upper()
+                self.tables_by_column.setdefault(column_name, []).append(table_name)
+                self.key_types[(table_name, column_name)] = keys
+
+        # A foreign key points at the table(s) where the same column is the
+        # primary key.
+        for (table_name, column_name), keys in self.key_types.items():
+            if KeyType.FK not in keys:
+                continue
+            targets = [
+                other
+                for other in self.tables_by_column[column_name]
+                if other != table_name and KeyType.PK in self.key_types[(other, column_name)]
+            ]
+            if targets:
+                self.fk_edges[(table_name, column_name)] = targets
+
+        self.links = {table_name: set() for table_name in self.tables}
+        for (table_name, _), targets in self.fk_edges.items():
+            for target in targets:
+                self.links[table_name].add(target)
+                self.links[target].add(table_name)
+
+        self.column_names = sorted(self.tables_by_column)
+        self.columns_csv = ",".join(self.column_names)
+
+    @classmethod
+    def from_file(cls, file_path=SCHEMA_PATH):
+        from schema_snapshot import is_snapshot, load_snapshot
+
+        if is_snapshot(file_path):
+            snapshot = load_snapshot(file_path)
+            return cls(snapshot, snapshot.version)
+        with open(file_path, "r") as file:
+            return cls(json.load(file))
+
+    def __len__(self):
+        return len(self.tables)
+
+    def __contains__(self, table_name):
+        return table_name.upper() in self.tables
+
+    def table(self, table_name):
+        return self.tables[table_name.upper()]
+
+    def has_column(self, column_name):
+        return column_name.strip().upper() in self.tables_by_column
+
+    def resolve_column(self, column_name):
+        # Normalise an LLM-returned column name; None if it is not in the schema
+        column_name = column_name.strip().strip("\"'`").upper()
+        if column_name in self.tables_by_column:
+            return column_name
+        return None
+
+    def key_type(self, table_name, column_name):
+        return self.key_types.get((table_name.upper(), column_name.upper()), KeyType(0))
+
+    def foreign_keys(self, table_name):
+        table_name = table_name.upper()
+        return {
+            column: targets
+            for (table, column), targets in self.fk_edges.items()
+            if table == table_name
+        }
+
+    def joinable(self, left, right):
+        # Whether (table, column) pairs `left` and `right` form a key join
+        (t1, c1), (t2, c2) = left, right
+        if t2 in self.fk_edges.get(left, ()) or t1 in self.fk_edges.get(right, ()):
+            return True
+        k1, k2 = self.key_type(t1, c1), self.key_type(t2, c2)
+        if c1 == c2 and k1 and k2:
+            return True
+        # Differently named FK pointing at the other table's key
+        return (KeyType.FK in k1 and KeyType.PK in k2) or (KeyType.FK in k2 and KeyType.PK in k1)
+
+    def neighborhood(self, table_names, hops=1):
+        # Tables within `hops` FK links of any of `table_names`, in BFS order
+        seen = [t.upper() for t in table_names if t.upper() in self.tables]
+        frontier = list(seen)
+        for _ in range(hops):
+            next_frontier = []
+            for table_name in frontier:
+                for other in sorted(self.links[table_name]):
+                    if other not in seen:
+                        seen.append(other)
+                        next_frontier.append(other)
+            frontier = next_frontier
+        return seen
+
+
+@lru_cache(maxsize=None)
+def load_catalog(file_path=SCHEMA_PATH):
+    return SchemaCatalog.from_file(file_path)
+
+
+if __name__ == "__main__":
+    catalog = load_catalog()
+    print(f"{len(catalog)} tables, {len(catalog.column_names)} columns")
+    print(f"{len(catalog.fk_edges)} foreign keys")
+    print("MOLREGNO is in", catalog.tables_by_column["MOLREGNO"])
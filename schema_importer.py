@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+from executors import DATASET
+from schema_model import Column, KeyType, Table
+
+CONSTRAINT_KEYS = {"PRIMARY KEY": KeyType.PK, "FOREIGN KEY": KeyType.FK, "UNIQUE": KeyType.UK}
+# Engine type prefix -> the Oracle type family schema.json uses
+ORACLE_TYPES = (
+    ("VARCHAR", "VARCHAR2"),
+    ("CHAR", "VARCHAR2"),
+    ("STRING", "VARCHAR2"),
+    ("TEXT", "CLOB"),
+    ("CLOB", "CLOB"),
+    ("BLOB", "BLOB"),
+    ("BYTES", "BLOB"),
+    ("DATE", "DATE"),
+    ("TIMESTAMP", "DATE"),
+)
+ENGINE_TYPE_RE = re.compile(r"([A-Z]+)\w*\s*(\([\d, ]+\))?")
+
+
+def oracle_type(engine_type):
+    # "VARCHAR(50)" -> "VARCHAR2(50)", "INT64"/"DECIMAL(9,2)" -> "NUMBER"/"NUMBER(9,2)"
+    match = ENGINE_TYPE_RE.match((engine_type or "").upper())
+    if match is None:
+        return "VARCHAR2"
+    base, size = match.group(1), (match.group(2) or "").replace(" ", "")
+    family = next((oracle for prefix, oracle in ORACLE_TYPES if base.startswith(prefix)), "NUMBER")
+    return family + size if family in ("VARCHAR2", "NUMBER") else family
+
+
+class InformationSchema:
+    """Catalog queries against INFORMATION_SCHEMA views, run through an
+    Executor. Each method answers for one table so tables can be
+    introspected concurrently."""
+
+    def __init__(self, executor):
+        self.executor = executor
+
+    def view(self, name):
+        return f"information_schema.{name}"
+
+    def rows(self, query):
+        return list(self.executor.run(query).itertuples(index=False, name=None))
+
+    def table_names(self):
+        return [name for (name,) in self.rows(f"SELECT table_name FROM {self.view('tables')}")]
+
+    def columns_query(self, table_name):
+        return (
+            f"SELECT column_name, data_type, is_nullable, column_comment FROM {self.view('columns')} "
+            f"WHERE table_name = '{table_name}' ORDER BY ordinal_position"
+        )
+
+    def columns(self, table_name):
+        # [(name, engine type, nullable, comment or None)]
+        return [
+            (name, data_type, is_nullable == "YES", comment if isinstance(comment, str) else None)
+            for name, data_type, is_nullable, comment in self.rows(self.columns_query(table_name))
+        ]
+
+    def constraints(self, table_name):
+        # [(column name, "PRIMARY KEY" | "FOREIGN KEY" | "UNIQUE")]
+        return self.rows(
+            f"SELECT k.column_name, t.constraint_type FROM {self.view('table_constraints')} t "
+            f"JOIN {self.view('key_column_usage')} k "
+            "ON k.constraint_name = t.constraint_name AND k.table_name = t.table_name "
+            f"WHERE t.table_name = '{table_name}'"
+        )
+
+
+class BigQueryInformationSchema(InformationSchema):
+    def view(self, name):
+        return f"`{DATASET}.INFORMATION_SCHEMA.{name.upper()}`"
+
+    def columns_query(self, table_name):
+        # Column descriptions live in COLUMN_FIELD_PATHS
+        return (
+            f"SELECT c.column_name, c.data_type, c.is_nullable, p.description FROM {self.view('columns')} c "
+            f"LEFT JOIN {self.view('column_field_paths')} p "
+            "ON p.table_name = c.table_name AND p.field_path = c.column_name "
+            f"WHERE c.table_name = '{table_name}' ORDER BY c.ordinal_position"
+        )
+
+
+class SQLiteInformationSchema:
+    """The same queries answered from a ChEMBL SQLite dump's PRAGMAs (SQLite
+    has no INFORMATION_SCHEMA). Opens a connection per call, so it is safe
+    to use from several threads."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def rows(self, query, *params):
+        with closing(sqlite3.connect(f"file:{self.file_path}?mode=ro", uri=True)) as db:
+            return db.execute(query, params).fetchall()
+
+    def table_names(self):
+        return [name for (name,) in self.rows(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )]
+
+    def columns(self, table_name):
+        return [
+            (name, data_type, not not_null, None)
+            for name, data_type, not_null in self.rows(
+                'SELECT name, type, "notnull" FROM pragma_table_info(?) ORDER BY cid', table_name
+            )
+        ]
+
+    def constraints(self, table_name):
+        rows = [(name, "PRIMARY KEY") for (name,) in self.rows(
+            "SELECT name FROM pragma_table_info(?) WHERE pk > 0", table_name
+        )]
+        rows += [(name, "FOREIGN KEY") for (name,) in self.rows(
+            'SELECT "from" FROM pragma_foreign_key_list(?)', table_name
+        )]
+        for (index_name,) in self.rows(
+            "SELECT name FROM pragma_index_list(?) WHERE \"unique\" AND origin != 'pk'", table_name
+        ):
+            rows += [(name, "UNIQUE") for (name,) in self.rows("SELECT name FROM pragma_index_info(?)", index_name)]
+        return rows
+
+
+def introspect_table(source, table_name):
+    keys = {}
+    for column_name, constraint_type in source.constraints(table_name):
+        column_name = column_name.upper()
+        keys[column_name] = keys.get(column_name, KeyType(0)) | CONSTRAINT_KEYS.get(constraint_type, KeyType(0))
+    columns = [
+        Column(name.upper(), oracle_type(data_type), keys.get(name.upper(), KeyType(0)),
+               None if nullable else "NOT NULL", comment or "")
+        for name, data_type, nullable, comment in source.columns(table_name)
+    ]
+    return Table(table_name.upper(), columns)
+
+
+def merge_documentation(table, documented):
+    """Fill in what the engine does not know from the documentation's entry
+    for the table: comments, the documented (Oracle) data types, and key
+    types when the engine declares no constraints on the table (BigQuery's
+    public ChEMBL dataset declares none)."""
+    if documented is None:
+        return table
+    documented_columns = {c.name.upper(): c for c in documented.columns}
+    engine_keys = any(c.keys for c in table.columns)
+    columns = []
+    for column in table.columns:
+        doc = documented_columns.get(column.name)
+        if doc is None:
+            columns.append(column)
+            continue
+        columns.append(Column(
+            column.name, doc.data_type, column.keys if engine_keys else doc.keys,
+            column.nullable, doc.comment or column.comment,
+        ))
+    return Table(table.name, columns)
+
+
+def import_schema(source, documentation=(), workers=8):
+    """Build the schema (a list of Tables) from source's catalog views,
+    introspecting `workers` tables at a time. Tables keep the order of the
+    documentation; undocumented ones follow, sorted."""
+    documented = {t.name.upper(): t for t in documentation}
+    names = {name.upper(): name for name in source.table_names()}
+    order = [t for t in documented if t in names] + sorted(names.keys() - documented.keys())
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        tables = list(pool.map(lambda t: introspect_table(source, names[t]), order))
+    return [merge_documentation(table, documented.get(table.name)) for table in tables]
+
+
+def load_documentation(file_path):
+    # The text documentation, or a schema.json/snapshot standing in for it
+    if file_path is None or not os.path.exists(file_path):
+        return []
+    if file_path.endswith(".txt"):
+        from schema_parser import parse_schema
+
+        return parse_schema(file_path)
+    from schema_snapshot import read_schema
+
+    return list(read_schema(file_path))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from schema_catalog import SchemaCatalog
+    from schema_store import SchemaStore, write_schema_files
+
+    parser = argparse.ArgumentParser(description="Rebuild schema.json from a SQL engine's catalog views")
+    parser.add_argument("--engine", default="bigquery", choices=["bigquery", "duckdb", "sqlite"])
+    parser.add_argument("--data-dir", help="Parquet directory for the duckdb engine")
+    parser.add_argument("--sqlite", help="ChEMBL SQLite dump for the sqlite engine")
+    parser.add_argument("--documentation", default="schema_documentation.txt",
+                        help="merge comments from this documentation (or a schema.json) when it exists")
+    parser.add_argument("--release", help="also store the result in the schema store under this name")
+    parser.add_argument("--snapshot", help="also write a binary schema snapshot")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--directory", default=".", help="where schema.json and columns.txt go")
+    args = parser.parse_args()
+
+    if args.engine == "sqlite":
+        source = SQLiteInformationSchema(args.sqlite)
+    elif args.engine == "duckdb":
+        from executors import DuckDBExecutor
+
+        source = InformationSchema(DuckDBExecutor(args.data_dir))
+    else:
+        from google.cloud.bigquery.client import Client
+
+        from executors import BigQueryExecutor
+
+        source = BigQueryInformationSchema(BigQueryExecutor(Client()))
+
+    start = time.perf_counter()
+    documentation = load_documentation(args.documentation)
+    schema = import_schema(source, documentation, args.workers)
+    if args.release:
+        store = SchemaStore()
+        store.put_release(args.release, schema)
+        version = store.export(args.release, args.directory)
+    else:
+        version = write_schema_files(SchemaCatalog(schema), args.directory)
+    if args.snapshot:
+        from schema_snapshot import write_snapshot
+
+        write_snapshot(schema, args.snapshot)
+    documented = {t.name.upper() for t in documentation}
+    missing = [t.name for t in schema if t.name not in documented]
+    print(f"{len(schema)} tables, {sum(len(t.columns) for t in schema)} columns in "
+          f"{time.perf_counter() - start:.1f}s, version {version}")
+    if documentation and missing:
+        print(f"undocumented tables: {', '.join(missing)}")
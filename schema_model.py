@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import enum
+import sys
+
+# KeyType.parse results by schema.json spelling; there are only a handful
+_parsed_keys = {}
+
+
+class KeyType(enum.IntFlag):
+    PK = 1
+    FK = 2
+    UK = 4
+
+    @classmethod
+    def parse(cls, keys):
+        # "PK,FK" -> KeyType.PK | KeyType.FK; None -> KeyType(0)
+        flags = _parsed_keys.get(keys)
+        if flags is not None:
+            return flags
+        flags = cls(0)
+        for key in filter(None, (k.strip() for k in (keys or "").split(","))):
+            if key not in cls.__members__:
+                raise ValueError(f"unknown key type {key!r}")
+            flags |= cls[key]
+        _parsed_keys[keys] = flags
+        return flags
+
+    def label(self):
+        # schema.json's spelling: "PK,FK", or None without keys
+        return ",".join(key.name for key in KeyType if key in self) or None
+
+
+class Column:
+    """One schema.json column; names and data types are interned, so the
+    catalog, graphs and prompts share a single copy of each string."""
+
+    __slots__ = ("name", "data_type", "keys", "nullable", "comment")
+
+    def __init__(self, name, data_type, keys=KeyType(0), nullable=None, comment=""):
+        self.name = sys.intern(name)
+        self.data_type = sys.intern(data_type)
+        self.keys = keys
+        self.nullable = None if nullable is None else sys.intern(nullable)
+        self.comment = comment
+
+    @classmethod
+    def from_dict(cls, column):
+        return cls(
+            column["ColumnName"], column["DataType"], KeyType.parse(column["Keys"]),
+            column["Nullable"], column["Comment"],
+        )
+
+    def to_dict(self):
+        return {
+            "Keys": self.keys.label(),
+            "ColumnName": self.name,
+            "DataType": self.data_type,
+            "Nullable": self.nullable,
+            "Comment": self.comment,
+        }
+
+    def _fields(self):
+        return (self.name, self.data_type, self.keys, self.nullable, self.comment)
+
+    def __eq__(self, other):
+        return isinstance(other, Column) and self._fields() == other._fields()
+
+    def __repr__(self):
+        return f"Column({self.name!r}, {self.data_type!r}, {self.keys!r})"
+
+
+class Table:
+    __slots__ = ("name", "columns")
+
+    def __init__(self, name, columns):
+        self.name = sys.intern(name)
+        self.columns = tuple(columns)
+
+    @classmethod
+    def from_dict(cls, table):
+        return cls(table["TableName"], [Column.from_dict(c) for c in table["Columns"]])
+
+    def to_dict(self):
+        return {"TableName": self.name, "Columns": [c.to_dict() for c in self.columns]}
+
+    def column(self, column_name):
+        column_name = column_name.upper()
+        return next((c for c in self.columns if c.name.upper() == column_name), None)
+
+    def __eq__(self, other):
+        return isinstance(other, Table) and self.name == other.name and self.columns == other.columns
+
+    def __repr__(self):
+        return f"Table({self.name!r}, {len(self.columns)} columns)"
+
+
+def as_tables(schema):
+    # schema.json dicts (or Tables already) -> [Table]
+    return [t if isinstance(t, Table) else Table.from_dict(t) for t in schema]
+
+
+def as_dicts(tables):
+    return [t.to_dict() for t in tables]
@@ -2,74 +2,116 @@
 
 import json
 import re
+import sys
 
+from schema_model import Column, KeyType, Table, as_dicts
 
-def parse_schema(file_path):
-    with open(file_path, "r") as file:
-        lines = file.readlines()
+KEYS_RE = re.compile(r"^([A-Z]K,)*[A-Z]K$")
+# Key labels seen so far -> KeyType; most rows hit this instead of KEYS_RE
+KEY_TYPES = {}
+NO_KEYS = KeyType(0)
+# Columns of a data row are separated by at least two spaces
+FIELD_SPLIT_RE = re.compile(r"\s\s+")
+
+
+def parse_row(line):
+    # One "KEYS  COLUMN_NAME DATA_TYPE  NULLABLE  COMMENT" row; raises
+    # IndexError/ValueError on rows that do not fit that shape
+    data = FIELD_SPLIT_RE.split(line)
+    keys = KEY_TYPES.get(data[0])
+    if keys is None:
+        if KEYS_RE.match(data[0]):
+            keys = KEY_TYPES[data[0]] = KeyType.parse(data[0])
+        else:
+            keys = NO_KEYS
+            data = [None] + data
+
+    column_name = data[1]
+    if " " in column_name:
+        column_name, dtype = column_name.split(" ")
+        data = [data[0], column_name, dtype] + data[2:]
+
+    if len(data) == 3:
+        data += [None, ""]
+
+    if len(data) == 4:
+        last = data[-1]
+        if last == "NOT NULL":
+            data = data + [""]
+        else:
+            data = data[:-1] + [None, last]
 
-    schema = []
-    current_table = None
+    return Column(data[1], data[2], keys, data[3], data[4])
+
+
+def iter_tables(lines, on_skip=None):
+    """Yield a Table from documentation lines as each table completes. Rows
+    that cannot be parsed are passed to on_skip(line_number, line, error)
+    and dropped."""
+    table_name, columns = None, []
     reading_data = False
 
-    for line in lines:
+    for line_number, line in enumerate(lines, 1):
         line = line.strip()
         if line.endswith(":"):
-            if current_table is not None:
-                schema.append(current_table)
-            current_table = {"TableName": line[:-1], "Columns": []}
-            description_lines = []
+            if table_name is not None:
+                yield Table(table_name, columns)
+            table_name, columns = line[:-1], []
             reading_data = False
-        elif current_table:
-            if "KEYS" in line and "COLUMN_NAME" in line:  # Start reading the data
-                reading_data = True
-            elif reading_data:
-                if line:  # Read data entries
-                    data = re.split(
-                        r"\s{2,}", line
-                    )  # Assume at least two spaces as a separator
-                    try:
-                        keytype = data[0]
-                        if not re.match(r"^([A-Z]K,)*[A-Z]K$", keytype):
-                            data = [None] + data
-
-                        column_name = data[1]
-                        if " " in column_name:
-                            column_name, dtype = column_name.split(" ")
-                            data = [data[0], column_name, dtype] + data[2:]
-
-                        if len(data) == 3:
-                            data += [None, ""]
-
-                        if len(data) == 4:
-                            last = data[-1]
-                            if last == "NOT NULL":
-                                data = data + [""]
-                            else:
-                                data = data[:-1] + [None, last]
-
-                        column_entry = {
-                            "Keys": data[0],
-                            "ColumnName": data[1],
-                            "DataType": data[2],
-                            "Nullable": data[3],
-                            "Comment": data[4],
-                        }
-                    except IndexError:
-                        print(f"Error parsing line: {line}")
-                        continue
-                    else:
-                        current_table["Columns"].append(column_entry)
-            else:
-                description_lines.append(line)
-                # Optionally store and use description if needed elsewhere; currently not included in output format
-
-    if current_table is not None:
-        schema.append(current_table)
-
-    return schema
-
-
-schema = parse_schema("schema_documentation.txt")
-with open("schema.json", "w") as file:
-    json.dump(schema, file, indent=4)
+        elif table_name is None or not line:
+            continue
+        elif not reading_data:
+            # Table description until the column header
+            reading_data = "KEYS" in line and "COLUMN_NAME" in line
+        else:
+            try:
+                columns.append(parse_row(line))
+            except (IndexError, ValueError) as e:
+                if on_skip is not None:
+                    on_skip(line_number, line, e)
+
+    if table_name is not None:
+        yield Table(table_name, columns)
+
+
+def iter_schema(file_path, on_skip=None):
+    # Streams the file; nothing beyond the current table is held in memory
+    with open(file_path, "r") as file:
+        yield from iter_tables(file, on_skip)
+
+
+def report_skip(file_path):
+    def on_skip(line_number, line, error):
+        print(f"{file_path}:{line_number}: skipped line ({type(error).__name__}): {line}", file=sys.stderr)
+
+    return on_skip
+
+
+def parse_schema(file_path, on_skip=None):
+    return list(iter_schema(file_path, on_skip or report_skip(file_path)))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parse ChEMBL schema documentation into schema.json")
+    parser.add_argument("documentation", nargs="?", default="schema_documentation.txt")
+    parser.add_argument("-o", "--output", default="schema.json")
+    parser.add_argument("--snapshot", help="also write a binary schema snapshot (see schema_snapshot.py)")
+    args = parser.parse_args()
+
+    skipped = []
+
+    def on_skip(line_number, line, error):
+        skipped.append(line_number)
+        report_skip(args.documentation)(line_number, line, error)
+
+    schema = list(iter_schema(args.documentation, on_skip))
+    with open(args.output, "w") as file:
+        json.dump(as_dicts(schema), file, indent=4)
+    if args.snapshot:
+        from schema_snapshot import write_snapshot
+
+        write_snapshot(schema, args.snapshot)
+    columns = sum(len(table.columns) for table in schema)
+    print(f"{len(schema)} tables, {columns} columns, {len(skipped)} lines skipped -> {args.output}")
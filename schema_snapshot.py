@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+import json
+import mmap
+import struct
+import sys
+
+import numpy as np
+
+from schema_catalog import schema_version
+from schema_model import Column, KeyType, Table, as_tables
+
+MAGIC = b"DCSB"
+FORMAT_VERSION = 1
+# magic, format, reserved, content hash, then the section lengths: strings,
+# tables, columns, key codes, type codes, nullable codes
+HEADER = struct.Struct("<4sHH16s6I")
+# Stands in for None wherever a string id is expected
+NONE = 0xFFFFFFFF
+COLUMN_DTYPE = np.dtype(
+    [("name", "<u4"), ("comment", "<u4"), ("type", "<u2"), ("keys", "u1"), ("nullable", "u1")]
+)
+
+
+def write_snapshot(schema, file_path):
+    """Write schema (Tables or schema.json's dicts) as a binary snapshot.
+
+    Layout after the header: string offsets (uint32[n + 1], in characters of
+    the decoded blob), a table index of
+    (name id, first column, end column) uint32 triples, the key/type/nullable
+    code tables as string ids, 12-byte column records, then the UTF-8 string
+    blob. Every distinct string is stored once.
+    """
+    strings = {}
+    vocabularies = ({}, {}, {})
+
+    def string_id(value):
+        return NONE if value is None else strings.setdefault(value, len(strings))
+
+    def code(vocabulary, value, limit):
+        if value not in vocabulary:
+            if len(vocabulary) >= limit:
+                raise ValueError(f"too many distinct values for a {limit}-entry code table: {value!r}")
+            vocabulary[value] = len(vocabulary)
+        return vocabulary[value]
+
+    schema = as_tables(schema)
+    keys, types, nullables = vocabularies
+    tables = np.zeros((len(schema), 3), dtype=np.uint32)
+    columns = np.zeros(sum(len(t.columns) for t in schema), dtype=COLUMN_DTYPE)
+    row = 0
+    for i, table in enumerate(schema):
+        tables[i] = (string_id(table.name), row, row + len(table.columns))
+        for column in table.columns:
+            columns[row] = (
+                string_id(column.name),
+                string_id(column.comment),
+                code(types, column.data_type, 1 << 16),
+                code(keys, column.keys.label(), 1 << 8),
+                code(nullables, column.nullable, 1 << 8),
+            )
+            row += 1
+    code_ids = [np.array([string_id(v) for v in vocabulary], dtype=np.uint32) for vocabulary in vocabularies]
+
+    offsets = np.zeros(len(strings) + 1, dtype=np.uint32)
+    offsets[1:] = np.cumsum([len(s) for s in strings])
+    version = schema_version(schema)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, version.encode(),
+        len(strings), len(tables), len(columns), *(len(ids) for ids in code_ids),
+    )
+    with open(file_path, "wb") as f:
+        f.write(header)
+        for array in [offsets, tables] + code_ids + [columns]:
+            f.write(array.tobytes())
+        f.write("".join(strings).encode())
+    return version
+
+
+def is_snapshot(file_path):
+    with open(file_path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class SchemaSnapshot:
+    """Read-only, mmap-backed view of a snapshot written by write_snapshot.
+
+    Opening one decodes only the header, the table names and the code tables;
+    each Table is decoded the first time it is asked for. Iterating yields
+    tables in file order, so a snapshot can stand in for a list of Tables.
+    """
+
+    def __init__(self, file_path):
+        with open(file_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, file_format, _, version, *counts = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or file_format != FORMAT_VERSION:
+            raise ValueError(f"{file_path} is not a version {FORMAT_VERSION} schema snapshot")
+        n_strings, n_tables, n_columns, n_keys, n_types, n_nullable = counts
+        self.version = version.decode()
+
+        position = HEADER.size
+        sections = []
+        for dtype, count in (
+            (np.uint32, n_strings + 1), (np.uint32, n_tables * 3), (np.uint32, n_keys),
+            (np.uint32, n_types), (np.uint32, n_nullable), (COLUMN_DTYPE, n_columns),
+        ):
+            array = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=position)
+            sections.append(array)
+            position += array.nbytes
+        offsets, tables, key_ids, type_ids, nullable_ids, self._columns = sections
+        self._string_offsets = offsets.tolist()
+        self._blob = position
+        self._text = None
+        self._strings = [None] * n_strings
+        self._table_rows = tables.reshape(-1, 3).tolist()
+        self._keys = [KeyType.parse(self.string(i)) for i in key_ids.tolist()]
+        self._types = [self.string(i) for i in type_ids.tolist()]
+        self._nullable = [self.string(i) for i in nullable_ids.tolist()]
+        self.table_names = [self.string(name) for name, _, _ in self._table_rows]
+        self.index = {name.upper(): i for i, name in enumerate(self.table_names)}
+        self._tables = [None] * n_tables
+
+    def string(self, i):
+        if i == NONE:
+            return None
+        value = self._strings[i]
+        if value is None:
+            if self._text is None:
+                # The blob is small; one decode makes every later string a slice
+                self._text = self._mmap[self._blob :].decode()
+            value = self._strings[i] = sys.intern(self._text[self._string_offsets[i] : self._string_offsets[i + 1]])
+        return value
+
+    def __len__(self):
+        return len(self._tables)
+
+    def __contains__(self, table_name):
+        return table_name.upper() in self.index
+
+    def __getitem__(self, i):
+        table = self._tables[i]
+        if table is None:
+            _, start, end = self._table_rows[i]
+            string, keys, types, nullable = self.string, self._keys, self._types, self._nullable
+            columns = [
+                Column(string(n), types[t], keys[k], nullable[u], string(c))
+                for n, c, t, k, u in self._columns[start:end].tolist()
+            ]
+            table = self._tables[i] = Table(self.table_names[i], columns)
+        return table
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def table(self, table_name):
+        return self[self.index[table_name.upper()]]
+
+    def column_keys(self):
+        # [(table name, [(column name, KeyType)])] straight from the column
+        # records, without decoding any Table
+        names, keys = self._columns["name"].tolist(), self._columns["keys"].tolist()
+        return [
+            (table_name, [(self.string(names[r]), self._keys[keys[r]]) for r in range(start, end)])
+            for table_name, (_, start, end) in zip(self.table_names, self._table_rows)
+        ]
+
+
+def load_snapshot(file_path="schema.bin"):
+    return SchemaSnapshot(file_path)
+
+
+def read_schema(file_path):
+    # Tables from schema.json or a snapshot, whichever file_path holds
+    if is_snapshot(file_path):
+        return load_snapshot(file_path)
+    with open(file_path, "r") as f:
+        return as_tables(json.load(f))
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Convert schema.json to a binary schema snapshot")
+    parser.add_argument("schema", nargs="?", default="schema.json")
+    parser.add_argument("-o", "--output", default="schema.bin")
+    args = parser.parse_args()
+
+    schema = read_schema(args.schema)
+    version = write_snapshot(schema, args.output)
+    assert list(load_snapshot(args.output)) == list(schema)
+    print(f"{os.path.getsize(args.schema)} -> {os.path.getsize(args.output)} bytes, version {version}")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+import json
+import os
+
+from schema_catalog import SchemaCatalog, canonical, content_hash, manifest_hash
+from schema_model import Table, as_dicts, as_tables
+
+STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema_store")
+
+
+def write_schema_files(catalog, directory="."):
+    # The single-release files the rest of the repo reads (schema.json,
+    # columns.txt, and the schema.bin snapshot the endpoint loads)
+    from schema_snapshot import write_snapshot
+
+    with open(os.path.join(directory, "schema.json"), "w") as f:
+        json.dump(as_dicts(catalog.schema), f, indent=4)
+    with open(os.path.join(directory, "columns.txt"), "w") as f:
+        f.write("\n".join(catalog.column_names))
+    write_snapshot(catalog.schema, os.path.join(directory, "schema.bin"))
+    return catalog.version
+
+
+class SchemaStore:
+    """Content-addressed schema definitions across ChEMBL releases.
+
+    Each table definition is stored once under objects/<hash>.json, however
+    many releases share it. A release is a manifest in releases/<name>.json
+    listing (table name, object hash) in schema order; its manifest hash
+    identifies the schema itself, so releases with identical schemas share it
+    and caches can use it as their version key. Loaded objects are kept in
+    memory, so switching release only reads the tables that differ.
+    """
+
+    def __init__(self, directory=STORE_DIR):
+        self.directory = directory
+        self.objects = {}
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(directory, "releases"), exist_ok=True)
+
+    def object_path(self, digest):
+        return os.path.join(self.directory, "objects", f"{digest}.json")
+
+    def manifest_path(self, release):
+        return os.path.join(self.directory, "releases", f"{release}.json")
+
+    def put_table(self, table):
+        # Hashed in canonical form, stored in field order so exports round-trip
+        record = table.to_dict()
+        digest = content_hash(canonical(record))
+        path = self.object_path(digest)
+        if not os.path.exists(path):
+            with open(path + ".tmp", "w") as f:
+                json.dump(record, f, separators=(",", ":"))
+            os.replace(path + ".tmp", path)
+        self.objects[digest] = table
+        return digest
+
+    def put_release(self, release, schema):
+        # Returns the manifest hash; only tables not already stored are written
+        tables = [[table.name.upper(), self.put_table(table)] for table in as_tables(schema)]
+        manifest = {"release": release, "hash": manifest_hash(tables), "tables": tables}
+        with open(self.manifest_path(release), "w") as f:
+            json.dump(manifest, f, indent=1)
+        return manifest["hash"]
+
+    def releases(self):
+        return sorted(name[: -len(".json")] for name in os.listdir(os.path.join(self.directory, "releases")))
+
+    def manifest(self, release):
+        with open(self.manifest_path(release), "r") as f:
+            return json.load(f)
+
+    def manifest_hash(self, release):
+        return self.manifest(release)["hash"]
+
+    def table(self, digest):
+        if digest not in self.objects:
+            with open(self.object_path(digest), "r") as f:
+                self.objects[digest] = Table.from_dict(json.load(f))
+        return self.objects[digest]
+
+    def load_schema(self, release):
+        return [self.table(digest) for _, digest in self.manifest(release)["tables"]]
+
+    def catalog(self, release):
+        # The manifest hash becomes catalog.version, the key every cache uses
+        manifest = self.manifest(release)
+        schema = [self.table(digest) for _, digest in manifest["tables"]]
+        return SchemaCatalog(schema, manifest["hash"])
+
+    def diff(self, old_release, new_release):
+        # Same shape as build_graph.schema_diff, from the manifests alone
+        old = dict(self.manifest(old_release)["tables"])
+        new = dict(self.manifest(new_release)["tables"])
+        return {
+            "added": sorted(new.keys() - old.keys()),
+            "removed": sorted(old.keys() - new.keys()),
+            "changed": sorted(t for t in old.keys() & new.keys() if old[t] != new[t]),
+        }
+
+    def export(self, release, directory="."):
+        return write_schema_files(self.catalog(release), directory)
+
+    def check(self, release, directory="."):
+        """Problems (empty when none) with the files export would write for
+        release, e.g. a schema.json edited without re-importing it."""
+        from schema_snapshot import load_snapshot, read_schema
+
+        catalog = self.catalog(release)
+        problems = []
+        schema_path = os.path.join(directory, "schema.json")
+        if SchemaCatalog(read_schema(schema_path)).version != catalog.version:
+            problems.append(f"{schema_path} does not match release {release} ({catalog.version})")
+        with open(os.path.join(directory, "columns.txt"), "r") as f:
+            if f.read() != "\n".join(catalog.column_names):
+                problems.append(f"columns.txt does not list release {release}'s columns")
+        snapshot = load_snapshot(os.path.join(directory, "schema.bin"))
+        if snapshot.version != catalog.version or list(snapshot) != catalog.schema:
+            problems.append(f"schema.bin does not match release {release} ({catalog.version})")
+        return problems
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Content-addressed schema store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    add = subparsers.add_parser("import", help="store a release from a schema.json")
+    add.add_argument("release")
+    add.add_argument("schema", nargs="?", default="schema.json")
+    subparsers.add_parser("list")
+    compare = subparsers.add_parser("diff")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    out = subparsers.add_parser("export", help="write schema.json, columns.txt and schema.bin for a release")
+    out.add_argument("release")
+    out.add_argument("--directory", default=".")
+    verify = subparsers.add_parser("check", help="check that exported files still match a release")
+    verify.add_argument("release", nargs="?", default="bundled")
+    verify.add_argument("--directory", default=".")
+    parser.add_argument("--store", default=STORE_DIR)
+    args = parser.parse_args()
+
+    store = SchemaStore(args.store)
+    if args.command == "import":
+        with open(args.schema, "r") as f:
+            print(store.put_release(args.release, json.load(f)))
+    elif args.command == "list":
+        for release in store.releases():
+            manifest = store.manifest(release)
+            print(f"{release}\t{manifest['hash']}\t{len(manifest['tables'])} tables")
+    elif args.command == "diff":
+        print(json.dumps(store.diff(args.old, args.new), indent=4))
+    elif args.command == "check":
+        problems = store.check(args.release, args.directory)
+        print("\n".join(problems) or f"{args.release}: files match {store.manifest_hash(args.release)}")
+        raise SystemExit(1 if problems else 0)
+    else:
+        print(store.export(args.release, args.directory))
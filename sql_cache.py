@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+import glob
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+
+CACHE_DIR = os.environ.get("DRUGCROW_CACHE_DIR", "cache")
+
+
+@contextmanager
+def transaction(file_path):
+    # A connection per operation: Volume.reload() refuses to run while the
+    # container holds files on the volume open. The default rollback journal
+    # (not WAL) keeps the whole cache in the one file a volume commit ships.
+    with closing(sqlite3.connect(file_path, timeout=30)) as db:
+        # A lost write after a crash only costs a cache entry
+        db.execute("PRAGMA synchronous=OFF")
+        with db:
+            yield db
+
+
+def add_counts(db, table, counts):
+    db.executemany(
+        f"INSERT INTO {table} VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+        [(name, value) for name, value in counts.items() if value],
+    )
+
+
+def read_counts(db, table):
+    return dict(db.execute(f"SELECT name, value FROM {table}"))
+
+
+def sum_counts(file_paths, table):
+    # Counters summed over every shard of a cache
+    totals = {}
+    for file_path in file_paths:
+        with transaction(file_path) as db:
+            for name, value in read_counts(db, table).items():
+                totals[name] = totals.get(name, 0) + value
+    return totals
+
+
+class VolumeSync:
+    """Shares cache files between containers that mount the same Modal
+    Volume.
+
+    A volume commit is last-writer-wins per file, so each container writes
+    only its own shard of a cache file (shard(), named after the container)
+    and reads every container's shards plus the unsharded file that offline
+    tools write (shards()). Writes only mark() the volume; flush() commits
+    once per request. reload() before a miss is final picks up other
+    containers' shards, at most every `interval` seconds. Shards untouched
+    for `max_age` seconds are no longer read. Without a volume a cache is
+    just its file and nothing is committed.
+    """
+
+    def __init__(self, volume=None, interval=30.0, max_age=7 * 24 * 3600, container=None):
+        self.volume = volume
+        self.interval = interval
+        self.max_age = max_age
+        # Modal sets MODAL_TASK_ID in every container
+        self.container = container or os.environ.get("MODAL_TASK_ID") or f"{socket.gethostname()}-{os.getpid()}"
+        self.reloaded_at = 0.0
+        self.dirty = False
+
+    def shard(self, file_path):
+        if self.volume is None:
+            return file_path
+        root, ext = os.path.splitext(file_path)
+        return f"{root}.{self.container}{ext}"
+
+    def shards(self, file_path):
+        # This container's shard first, then the others' and the seed file
+        own = self.shard(file_path)
+        if self.volume is None:
+            return [own]
+        root, ext = os.path.splitext(file_path)
+        cutoff = time.time() - self.max_age
+        others = [
+            p for p in sorted(glob.glob(f"{glob.escape(root)}.*{ext}"))
+            if p != own and os.path.getmtime(p) > cutoff
+        ]
+        if os.path.exists(file_path):
+            others.append(file_path)
+        return [own] + others
+
+    def mark(self):
+        self.dirty = True
+
+    def flush(self):
+        # Commit everything the caches wrote since the last flush
+        dirty, self.dirty = self.dirty, False
+        if dirty and self.volume is not None:
+            self.volume.commit()
+
+    def reload(self):
+        # True when the volume was reloaded and a lookup is worth retrying
+        now = time.monotonic()
+        if self.volume is None or now - self.reloaded_at < self.interval:
+            return False
+        self.reloaded_at = now
+        try:
+            self.volume.reload()
+        except RuntimeError:
+            # Files still open elsewhere in the container; try again later
+            return False
+        return True
+
+
+def normalize_columns(columns):
+    # The relationship between two columns is symmetric, so order is dropped
+    return ",".join(sorted({c.strip().strip("\"'`").upper() for c in columns if c.strip()}))
+
+
+class SQLCache:
+    """Generated SQL keyed by (selected columns, schema version).
+
+    Backed by a SQLite file so it survives restarts; with a VolumeSync
+    `sync` on a mounted volume each container writes its own shard and reads
+    everyone's. Entries expire after `ttl` seconds and the least recently
+    used ones are evicted beyond `max_entries` (per shard).
+    """
+
+    def __init__(self, file_path=None, max_entries=10000, ttl=30 * 24 * 3600, sync=None):
+        if file_path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            file_path = os.path.join(CACHE_DIR, "sql_cache.sqlite")
+        self.file_path = file_path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.sync = sync or VolumeSync()
+        self.shard = self.sync.shard(file_path)
+        with transaction(self.shard) as db:
+            db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS sql_cache (
+                    columns TEXT NOT NULL,
+                    schema_version TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    used_at REAL NOT NULL,
+                    PRIMARY KEY (columns, schema_version)
+                );
+                CREATE INDEX IF NOT EXISTS sql_cache_used_at ON sql_cache (used_at);
+                CREATE TABLE IF NOT EXISTS sql_cache_counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                """
+            )
+
+    def _read(self, key, schema_version, now):
+        # The cached query (counted as a hit, used_at touched in this
+        # container's shard), or None
+        for shard in self.sync.shards(self.file_path):
+            with transaction(shard) as db:
+                row = db.execute(
+                    "SELECT query, created_at FROM sql_cache WHERE columns = ? AND schema_version = ?",
+                    (key, schema_version),
+                ).fetchone()
+                if row is not None and now - row[1] > self.ttl:
+                    row = None
+                if row is not None and shard == self.shard:
+                    db.execute(
+                        "UPDATE sql_cache SET used_at = ? WHERE columns = ? AND schema_version = ?",
+                        (now, key, schema_version),
+                    )
+                    add_counts(db, "sql_cache_counters", {"hits": 1})
+                    return row[0]
+            if row is not None:
+                break
+        else:
+            return None
+        # Another container's entry: copy it into this shard for eviction
+        with transaction(self.shard) as db:
+            db.execute("INSERT OR REPLACE INTO sql_cache VALUES (?, ?, ?, ?, ?)", (key, schema_version, *row, now))
+            add_counts(db, "sql_cache_counters", {"hits": 1})
+        return row[0]
+
+    def get(self, columns, schema_version):
+        key = normalize_columns(columns)
+        now = time.time()
+        with self.lock:
+            query = self._read(key, schema_version, now)
+            if query is None and self.sync.reload():
+                query = self._read(key, schema_version, now)
+            if query is None:
+                with transaction(self.shard) as db:
+                    add_counts(db, "sql_cache_counters", {"misses": 1})
+            self.sync.mark()
+            return query
+
+    def put(self, columns, schema_version, query):
+        now = time.time()
+        with self.lock:
+            with transaction(self.shard) as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO sql_cache VALUES (?, ?, ?, ?, ?)",
+                    (normalize_columns(columns), schema_version, query, now, now),
+                )
+                db.execute(
+                    "DELETE FROM sql_cache WHERE rowid IN ("
+                    "SELECT rowid FROM sql_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            self.sync.mark()
+
+    def stats(self):
+        with self.lock:
+            shards = self.sync.shards(self.file_path)
+            counters = sum_counts(shards, "sql_cache_counters")
+            keys = set()
+            for shard in shards:
+                with transaction(shard) as db:
+                    keys.update(db.execute("SELECT columns, schema_version FROM sql_cache"))
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": len(keys),
+        }
+
+    def clear(self):
+        # This container's shard (the whole cache without a volume)
+        with self.lock, transaction(self.shard) as db:
+            db.execute("DELETE FROM sql_cache")
+            db.execute("DELETE FROM sql_cache_counters")
+        self.sync.mark()
+
+
+if __name__ == "__main__":
+    import json
+
+    print(json.dumps(SQLCache().stats(), indent=4))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+from executors import DATASET
+from join_planner import JoinPlan
+from schema_catalog import load_catalog
+from schema_model import KeyType
+
+
+def primary_key(catalog, table_name):
+    keys = [c for c in catalog.columns_by_table[table_name] if KeyType.PK in catalog.key_type(table_name, c)]
+    return keys[0] if len(keys) == 1 else None
+
+
+def join_condition(catalog, left, column, right):
+    # (left column, right column) joining `left` to `right` through `column`
+    left_columns, right_columns = catalog.columns_by_table[left], catalog.columns_by_table[right]
+    if column is not None and column in left_columns and column in right_columns:
+        if catalog.joinable((left, column), (right, column)):
+            return column, column
+        return None
+    # FK whose name differs from the key it references (ENZYME_TID -> TID)
+    if column is not None and column in left_columns and KeyType.FK in catalog.key_type(left, column):
+        pk = primary_key(catalog, right)
+        if pk is not None:
+            return column, pk
+    if column is not None and column in right_columns and KeyType.FK in catalog.key_type(right, column):
+        pk = primary_key(catalog, left)
+        if pk is not None:
+            return pk, column
+    if column is None:
+        # Adjacent tables: any shared key column will do
+        for shared in left_columns:
+            if shared in right_columns and catalog.joinable((left, shared), (right, shared)):
+                return shared, shared
+    return None
+
+
+def compile_plan(plan, catalog=None, limit=10):
+    """BigQuery SQL selecting every terminal column of a JoinPlan, or None when
+    some hop has no mechanical join (the caller then asks the LLM)."""
+    catalog = catalog or load_catalog()
+    if not plan.tables or any(t not in catalog for t in plan.tables):
+        return None
+    tables = set(plan.tables)
+    adjacency = {}
+    for u, v in plan.edges:
+        adjacency.setdefault(u, []).append(v)
+        adjacency.setdefault(v, []).append(u)
+
+    # Each terminal is read from a tree table that really holds it
+    homes = {}
+    for column in plan.terminals:
+        home = next(
+            (
+                name for name, node_type in adjacency.get((column, "column"), ())
+                if node_type == "table" and name in tables and column in catalog.columns_by_table[name]
+            ),
+            None,
+        )
+        if home is None:
+            return None
+        homes[column] = home
+
+    # Walk the tree from the first terminal's table, joining as we go
+    root = homes[plan.terminals[0]]
+    aliases = {root: "t1"}
+    joins = []
+    frontier = [root]
+    while frontier:
+        next_frontier = []
+        for table in frontier:
+            for node in adjacency.get((table, "table"), ()):
+                name, node_type = node
+                if node_type == "table":
+                    hops = [(None, name)]
+                else:
+                    hops = [(name, other) for other, other_type in adjacency[node] if other_type == "table"]
+                for via, other in hops:
+                    if other in aliases or other not in tables:
+                        continue
+                    condition = join_condition(catalog, table, via, other)
+                    if condition is None:
+                        return None
+                    aliases[other] = f"t{len(aliases) + 1}"
+                    joins.append((other, table, condition))
+                    next_frontier.append(other)
+        frontier = next_frontier
+    if len(aliases) != len(tables):
+        return None
+
+    selected = ", ".join(f"{aliases[homes[c]]}.{c.lower()}" for c in plan.terminals)
+    lines = [f"SELECT {selected}", f"FROM `{DATASET}.{root.lower()}` AS {aliases[root]}"]
+    for other, table, (left, right) in joins:
+        lines.append(
+            f"JOIN `{DATASET}.{other.lower()}` AS {aliases[other]} "
+            f"ON {aliases[table]}.{left.lower()} = {aliases[other]}.{right.lower()}"
+        )
+    lines.append(f"LIMIT {limit}")
+    return "\n".join(lines)
+
+
+def compile_path(path, catalog=None, limit=10):
+    # A two-column join path is a JoinPlan whose tree is a single chain
+    if not path or len(path) < 3 or path[0][1] != "column" or path[-1][1] != "column":
+        return None
+    nodes = [tuple(node) for node in path]
+    tables = [name for name, node_type in nodes if node_type == "table"]
+    plan = JoinPlan((nodes[0][0], nodes[-1][0]), tables, list(zip(nodes, nodes[1:])))
+    return compile_plan(plan, catalog, limit)
+
+
+if __name__ == "__main__":
+    from find_shortest_path import find_shortest_path, load_graph
+
+    catalog = load_catalog()
+    graph = load_graph()
+    path = find_shortest_path(graph, "ALOGP", "BLACK_BOX_WARNING", catalog)
+    print(compile_path(path, catalog))
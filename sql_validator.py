@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import re
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+from executors import DATASET
+from schema_catalog import load_catalog
+
+# A word right after the opening ``` is a language tag only when the line
+# ends there; "```SELECT a FROM t```" keeps its SELECT
+FENCE_RE = re.compile(r"```(?:[ \t]*[A-Za-z]+[ \t]*\n)?(.*?)```", re.S)
+PROJECT, DATASET_NAME = DATASET.split(".")
+
+
+def extract_sql(text):
+    # Take the body of the first ``` fence (dropping a language tag) if any
+    match = FENCE_RE.search(text)
+    if match:
+        text = match.group(1)
+    return text.strip()
+
+
+def validate_sql(query, catalog=None, require_limit=True):
+    """Problems found in `query` against the schema; an empty list means OK."""
+    catalog = catalog or load_catalog()
+    try:
+        tree = sqlglot.parse_one(query, read="bigquery")
+    except ParseError as e:
+        return [f"SQL does not parse: {e}"]
+    if tree is None:
+        return ["Empty query"]
+
+    problems = []
+    ctes = {cte.alias_or_name.upper() for cte in tree.find_all(exp.CTE)}
+    derived = bool(ctes) or any(True for _ in tree.find_all(exp.Subquery))
+
+    # alias -> TABLE for every real table the query reads
+    sources = {}
+    for table in tree.find_all(exp.Table):
+        name = table.name.upper()
+        if name in ctes and not table.db:
+            continue
+        if table.catalog != PROJECT or table.db != DATASET_NAME:
+            problems.append(f"Table {table.sql('bigquery')} is not in {DATASET}")
+        if name not in catalog:
+            problems.append(f"Unknown table {name}")
+            continue
+        sources[table.alias_or_name.upper()] = name
+        sources.setdefault(name, name)
+
+    select_aliases = {a.alias.upper() for a in tree.find_all(exp.Alias)}
+    for column in tree.find_all(exp.Column):
+        name = column.name.upper()
+        if not name or isinstance(column.this, exp.Star):
+            continue
+        qualifier = column.table.upper()
+        if qualifier:
+            table_name = sources.get(qualifier)
+            if table_name is None:
+                if not derived:
+                    problems.append(f"Unknown table alias {qualifier} in {column.sql('bigquery')}")
+            elif name not in catalog.columns_by_table[table_name]:
+                problems.append(f"Column {name} is not in table {table_name}")
+        elif not derived and name not in select_aliases:
+            if not any(name in catalog.columns_by_table[t] for t in set(sources.values())):
+                problems.append(f"Column {name} is not in any table of the query")
+
+    for join in tree.find_all(exp.Join):
+        on = join.args.get("on")
+        if on is None:
+            continue
+        for eq in on.find_all(exp.EQ):
+            left, right = eq.left, eq.right
+            if not (isinstance(left, exp.Column) and isinstance(right, exp.Column)):
+                continue
+            t1, t2 = sources.get(left.table.upper()), sources.get(right.table.upper())
+            if t1 is None or t2 is None:
+                continue
+            if not catalog.joinable((t1, left.name.upper()), (t2, right.name.upper())):
+                problems.append(
+                    f"Join {t1}.{left.name.upper()} = {t2}.{right.name.upper()} is not on a key column"
+                )
+
+    if require_limit and isinstance(tree, exp.Query) and tree.args.get("limit") is None:
+        problems.append("Query has no LIMIT")
+
+    return problems
+
+
+if __name__ == "__main__":
+    import timeit
+
+    query = extract_sql(
+        "```sql\nSELECT cp.alogp, md.black_box_warning\n"
+        "FROM `bigquery-public-data.ebi_chembl.compound_properties` cp\n"
+        "JOIN `bigquery-public-data.ebi_chembl.molecule_dictionary` md ON cp.molregno = md.molregno\n"
+        "LIMIT 10\n```"
+    )
+    print(validate_sql(query) or "OK")
+    print(validate_sql(query.replace("alogp", "logp").replace("LIMIT 10", "")))
+    number = 1000
+    print(f"{timeit.timeit(lambda: validate_sql(query), number=number) / number * 1e6:.1f} us/query")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+
+from csr_graph import CSRGraph, node_id
+from path_table import NO_PATH, walk_predecessors
+from schema_model import KeyType
+
+
+class TableGraph(CSRGraph):
+    """Collapsed schema graph: one node per table, edges labelled with join
+    columns.
+
+    joins[slot] holds the "THIS_COLUMN=NEIGHBOR_COLUMN" pairs (comma
+    separated) for the edge at neighbors[slot], and via[slot] is the column a
+    bipartite path would route through (what compile_path expects). entries
+    maps each column to the space-separated IDs of the tables holding it;
+    searches start and end there. Labels stay strings until used, which
+    keeps joins.json quick to parse.
+
+    Single-path lookups read an all-pairs hop table (79 x 79, built on first
+    use) instead of searching: the pair of entry tables with the fewest joins
+    between them, then a predecessor walk.
+    """
+
+    def __init__(self, nodes, node_type, offsets, neighbors, joins, via, entries):
+        super().__init__(nodes, node_type, offsets, neighbors)
+        self.joins = joins
+        self.via = via
+        self.entries = entries
+        self._entry_ids = {}
+        self._table_version = None
+        self._slots = None
+        self._hops = None
+
+    @classmethod
+    def from_networkx(cls, graph, catalog):
+        base = CSRGraph.from_networkx(graph)
+        joins, via = [], []
+        for u in range(len(base)):
+            for v in base.neighbors_of(u):
+                pairs = []
+                for left, right in graph.edges[base.nodes[u], base.nodes[v]]["joins"]:
+                    if left[0] != base.names[u]:
+                        left, right = right, left
+                    pairs.append((left[1], right[1]))
+                pairs.sort()
+                joins.append(",".join(f"{left}={right}" for left, right in pairs))
+                via.append(cls.via_column(catalog, base.names[u], pairs))
+        entries = {
+            column: " ".join(str(i) for i in sorted(base.index[node_id(t, "table")] for t in tables))
+            for column, tables in catalog.tables_by_column.items()
+        }
+        return cls(base.nodes, base.node_type, base.offsets, base.neighbors, joins, via, entries)
+
+    @staticmethod
+    def via_column(catalog, table_name, pairs):
+        # Prefer a same-name join; otherwise the FK side of an FK -> PK pair
+        for left, right in pairs:
+            if left == right:
+                return left
+        left, right = pairs[0]
+        return left if KeyType.FK in catalog.key_type(table_name, left) else right
+
+    @classmethod
+    def load(cls, directory, mmap_mode="r"):
+        base = CSRGraph.load(directory, mmap_mode)
+        with open(os.path.join(directory, "joins.json"), "r") as f:
+            labels = json.load(f)
+        return cls(
+            base.nodes, base.node_type, base.offsets, base.neighbors,
+            labels["joins"], labels["via"], labels["entries"],
+        )
+
+    def save(self, directory):
+        super().save(directory)
+        with open(os.path.join(directory, "joins.json"), "w") as f:
+            json.dump({"joins": self.joins, "via": self.via, "entries": self.entries}, f)
+
+    def version(self):
+        if self._table_version is None:
+            digest = hashlib.sha256(super().version().encode())
+            digest.update(json.dumps([self.joins, self.via], sort_keys=True).encode())
+            self._table_version = digest.hexdigest()[:16]
+        return self._table_version
+
+    def slot(self, u, v):
+        if self._slots is None:
+            self._slots = {
+                (u, v): slot
+                for u in range(len(self))
+                for slot, v in enumerate(self.neighbors_of(u), int(self.offsets[u]))
+            }
+        return self._slots[u, v]
+
+    def join_columns(self, u, v):
+        # [(u's column, v's column), ...] for the edge u -- v
+        return [tuple(pair.split("=")) for pair in self.joins[self.slot(u, v)].split(",")]
+
+    def entry_tables(self, column):
+        ids = self._entry_ids.get(column)
+        if ids is None:
+            ids = self._entry_ids[column] = [int(i) for i in self.entries.get(column, "").split()]
+        return ids
+
+    def hop_table(self):
+        # (hops[i][j], parents[i][j]) from one BFS per table; keeping the
+        # first-discovered parent breaks ties toward lower neighbor IDs
+        if self._hops is None:
+            hops, parents = [], []
+            for source in range(len(self)):
+                hop, parent = [float("inf")] * len(self), [NO_PATH] * len(self)
+                hop[source] = 0
+                frontier = [source]
+                while frontier:
+                    next_frontier = []
+                    for u in frontier:
+                        for v in self.neighbors_of(u):
+                            if hop[v] == float("inf"):
+                                hop[v], parent[v] = hop[u] + 1, u
+                                next_frontier.append(v)
+                    frontier = next_frontier
+                hops.append(hop)
+                parents.append(parent)
+            self._hops = hops, parents
+        return self._hops
+
+    def nearest_path(self, sources, targets):
+        # Fewest-joins table path from any source to any target, or None
+        hops, parents = self.hop_table()
+        best, source, target = float("inf"), None, None
+        for s in sources:
+            row = hops[s]
+            for t in targets:
+                if row[t] < best:
+                    best, source, target = row[t], s, t
+        if source is None:
+            return None
+        return walk_predecessors(parents, source, target)
+
+    def table_paths(self, start, end, k=1):
+        # Up to k table-ID paths from a table holding `start` to one holding `end`
+        sources, targets = self.entry_tables(start), self.entry_tables(end)
+        if not sources or not targets:
+            return []
+        if k == 1:
+            path = self.nearest_path(sources, targets)
+            return [path] if path else []
+        return self.yen_paths(set(sources), set(targets), k)
+
+    def join_path(self, start, end):
+        """(tables, [(left table, right table, (left column, right column))])
+        for the shortest join, or None."""
+        paths = self.table_paths(start, end)
+        if not paths:
+            return None
+        path = paths[0]
+        joins = [(self.names[u], self.names[v], self.join_columns(u, v)[0]) for u, v in zip(path, path[1:])]
+        return [self.names[i] for i in path], joins
+
+    def expand(self, start, end, path):
+        # Table-ID path -> bipartite-shaped [(name, node_type), ...]
+        out = [(start, "column"), (self.names[path[0]], "table")]
+        for u, v in zip(path, path[1:]):
+            out.append((self.via[self.slot(u, v)], "column"))
+            out.append((self.names[v], "table"))
+        out.append((end, "column"))
+        return out
+
+    def k_shortest_paths(self, start, end, k, weights=None):
+        return [self.expand(start, end, path) for path in self.table_paths(start, end, k)]
+
+    def shortest_path(self, start, end):
+        paths = self.k_shortest_paths(start, end, 1)
+        return paths[0] if paths else None
+
+
+def load_table_graph(directory="schema_table_graph"):
+    return TableGraph.load(directory)
+
+
+if __name__ == "__main__":
+    graph = load_table_graph()
+    print(f"{len(graph)} tables, {len(graph.neighbors) // 2} join edges")
+    tables, joins = graph.join_path("ALOGP", "BLACK_BOX_WARNING")
+    print(" -> ".join(tables))
+    for left, right, (left_column, right_column) in joins:
+        print(f"  {left}.{left_column} = {right}.{right_column}")
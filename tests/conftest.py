@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def repo_root():
+    # The modules read schema.json, columns.txt etc. relative to the repo root
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    yield
+    os.chdir(cwd)
+
+
+@pytest.fixture(scope="session")
+def standin(repo_root):
+    # In-memory DuckDB copy of the schema with synthetic rows
+    from executors import make_executor
+    from schema_catalog import load_catalog
+
+    return make_executor("standin", catalog=load_catalog())
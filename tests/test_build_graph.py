@@ -0,0 +1,38 @@
+import networkx as nx
+
+from build_graph import build_graph, load_fk_map, update_graph
+from csr_graph import CSRGraph, load_csr_graph, node_id
+from schema_catalog import load_catalog
+
+
+def test_every_catalog_table_is_a_table_node():
+    # TARGET_TYPE, RELATIONSHIP_TYPE and VERSION are column names too
+    catalog = load_catalog()
+    graph = load_csr_graph()
+    for table_name in catalog.tables:
+        assert graph.type_of(graph.index[node_id(table_name, "table")]) == "table"
+    for column_name in ("TARGET_TYPE", "RELATIONSHIP_TYPE", "VERSION"):
+        assert graph.type_of(graph.index[node_id(column_name)]) == "column"
+
+
+def test_graph_is_bipartite_without_self_loops():
+    catalog = load_catalog()
+    graph = build_graph(catalog.schema, load_fk_map(catalog.schema))
+    assert nx.number_of_selfloops(graph) == 0
+    assert all(graph.nodes[u]["node_type"] != graph.nodes[v]["node_type"] for u, v in graph.edges)
+
+
+def test_shipped_graph_matches_a_fresh_build():
+    catalog = load_catalog()
+    built = CSRGraph.from_networkx(build_graph(catalog.schema, load_fk_map(catalog.schema)))
+    assert built.version() == load_csr_graph().version()
+
+
+def test_update_matches_a_full_build():
+    old = load_catalog().schema
+    new = [table for table in old if table.name != "ACTIVITY_SUPP"]
+    updated, changelog = update_graph(CSRGraph.from_networkx(build_graph(old)), old, new)
+    full = build_graph(new)
+    assert set(updated.nodes) == set(full.nodes)
+    assert {frozenset(e) for e in updated.to_networkx().edges} == {frozenset(e) for e in full.edges}
+    assert node_id("ACTIVITY_SUPP", "table") in changelog["removed_nodes"]
@@ -0,0 +1,89 @@
+import os
+
+import pandas as pd
+
+from path_cache import PathCache
+from result_cache import ResultCache
+from sql_cache import SQLCache, VolumeSync
+
+
+class FakeVolume:
+    def __init__(self):
+        self.commits = 0
+        self.reloads = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def reload(self):
+        self.reloads += 1
+
+
+def containers():
+    # Two syncs over one directory stand in for two containers on one volume
+    return VolumeSync(FakeVolume(), container="a"), VolumeSync(FakeVolume(), container="b")
+
+
+def test_containers_write_their_own_shards(tmp_path):
+    a, b = containers()
+    file_path = os.path.join(tmp_path, "sql.sqlite")
+    first, second = SQLCache(file_path, sync=a), SQLCache(file_path, sync=b)
+    assert first.get(["A", "B"], "v1") is None
+    first.put(["A", "B"], "v1", "SELECT 1")
+    second.put(["C", "D"], "v1", "SELECT 2")
+    assert sorted(os.listdir(tmp_path)) == ["sql.a.sqlite", "sql.b.sqlite"]
+    # Each container reads the other's entries and counters
+    assert second.get(["B", "A"], "v1") == "SELECT 1"
+    assert first.get(["C", "D"], "v1") == "SELECT 2"
+    assert first.stats() == second.stats() == {"hits": 2, "misses": 1, "hit_rate": 2 / 3, "entries": 2}
+
+
+def test_one_commit_per_request(tmp_path):
+    a, _ = containers()
+    sql_cache = SQLCache(os.path.join(tmp_path, "sql.sqlite"), sync=a)
+    path_cache = PathCache(os.path.join(tmp_path, "paths.sqlite"), sync=a)
+    result_cache = ResultCache(os.path.join(tmp_path, "results"), sync=a)
+    # A request that misses every cache, then fills them
+    assert sql_cache.get(["A", "B"], "v1") is None
+    assert path_cache.get("A", "B", "g1") is None
+    path_cache.put("A", "B", "g1", [[("A", "T"), ("B", "T")]])
+    assert result_cache.get("SELECT 1") is None
+    result_cache.put("SELECT 1", pd.DataFrame({"a": [1]}))
+    sql_cache.put(["A", "B"], "v1", "SELECT 1")
+    assert a.volume.commits == 0
+    a.flush()
+    assert a.volume.commits == 1
+    # Read-only requests still publish their counters
+    assert sql_cache.get(["A", "B"], "v1") == "SELECT 1"
+    a.flush()
+    a.flush()
+    assert a.volume.commits == 2
+
+
+def test_counters_cover_every_container(tmp_path):
+    a, b = containers()
+    file_path = os.path.join(tmp_path, "paths.sqlite")
+    first, second = PathCache(file_path, sync=a), PathCache(file_path, sync=b)
+    assert first.get("A", "B", "g1") is None
+    first.put("A", "B", "g1", [[("A", "T"), ("B", "T")]])
+    assert second.get("B", "A", "g1") == [[("B", "T"), ("A", "T")]]
+    assert first.get("A", "B", "g1") == [[("A", "T"), ("B", "T")]]
+    # Memory hits reach the shard after flush_interval, or with stats()
+    first.stats()
+    stats = second.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"], stats["entries"]) == (1, 1, 1, 1)
+
+    directory = os.path.join(tmp_path, "results")
+    first, second = ResultCache(directory, sync=a), ResultCache(directory, sync=b)
+    assert first.get("SELECT 1") is None
+    first.put("SELECT 1", pd.DataFrame({"a": [1]}))
+    assert len(second.get("SELECT 1")) == 1
+    assert first.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_seed_file_is_read_by_every_container(tmp_path):
+    # path_cache.py warm writes the unsharded file offline
+    file_path = os.path.join(tmp_path, "paths.sqlite")
+    PathCache(file_path).put("A", "B", "g1", [])
+    a, _ = containers()
+    assert PathCache(file_path, sync=a).get("A", "B", "g1") == []
@@ -0,0 +1,26 @@
+import pytest
+
+from column_retriever import load_retriever
+
+
+@pytest.fixture(scope="module")
+def retriever():
+    return load_retriever()
+
+
+@pytest.mark.parametrize(
+    "question, columns",
+    [
+        ("What is the correlation between ALogP and black box warning?", ["ALOGP", "BLACK_BOX_WARNING"]),
+        ("What's the relationship between target type and organism?", ["TARGET_TYPE", "ORGANISM"]),
+        ("How does the organism relate to pChEMBL value?", ["ORGANISM", "PCHEMBL_VALUE"]),
+    ],
+)
+def test_select_skips_the_llm_on_distinctive_names(retriever, question, columns):
+    assert retriever.select(question)[0] == columns
+
+
+@pytest.mark.parametrize("question", ["name and type of the target", "value and units"])
+def test_select_shortlists_generic_words(retriever, question):
+    columns, candidates = retriever.select(question)
+    assert columns == [] and candidates
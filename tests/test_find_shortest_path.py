@@ -0,0 +1,36 @@
+import random
+
+from find_shortest_path import find_shortest_path, format_query, load_graph, path_tables
+from join_costs import CostWeightedPaths
+from schema_catalog import load_catalog
+from table_graph import load_table_graph
+
+
+def prompt_tables(prompt):
+    return {line.split(": ", 1)[1] for line in prompt.splitlines() if line.startswith("Table: ")}
+
+
+def assert_columns_in_prompt(start, end, path, catalog):
+    tables = prompt_tables(format_query(start, end, path, catalog))
+    for column in (start, end):
+        assert tables & set(catalog.tables_by_column[column]), f"no table holding {column} in the prompt"
+
+
+def test_prompt_holds_each_requested_column():
+    catalog = load_catalog()
+    graphs = [load_graph(), CostWeightedPaths(load_graph(), catalog, {}), load_table_graph()]
+    rng = random.Random(0)
+    pairs = [tuple(rng.sample(catalog.column_names, 2)) for _ in range(200)]
+    for graph in graphs:
+        for start, end in [("PARENT_TYPE", "ORGANISM")] + pairs:
+            path = find_shortest_path(graph, start, end, catalog)
+            if path:
+                assert_columns_in_prompt(start, end, path, catalog)
+
+
+def test_tables_come_from_the_catalog_not_node_types():
+    # TARGET_TYPE typed as a column, as an older graph build had it
+    catalog = load_catalog()
+    path = [("PARENT_TYPE", "column"), ("TARGET_TYPE", "column"), ("TARGET_DICTIONARY", "table"), ("ORGANISM", "column")]
+    assert path_tables(path, catalog) == ["TARGET_TYPE", "TARGET_DICTIONARY"]
+    assert_columns_in_prompt("PARENT_TYPE", "ORGANISM", path, catalog)
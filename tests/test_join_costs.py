@@ -0,0 +1,16 @@
+from find_shortest_path import load_graph
+from join_costs import UNKNOWN_TABLE_COST, CostWeightedPaths, table_end
+from schema_catalog import load_catalog
+
+
+def test_every_catalog_table_gets_a_real_cost():
+    graph = CostWeightedPaths(load_graph(), load_catalog(), {})
+    assert graph.weights.max() < UNKNOWN_TABLE_COST
+
+
+def test_table_end_follows_the_catalog():
+    catalog = load_catalog()
+    assert table_end(catalog, "TARGET_TYPE", "PARENT_TYPE") == ("TARGET_TYPE", "PARENT_TYPE")
+    assert table_end(catalog, "TARGET_TYPE", "TARGET_DICTIONARY") == ("TARGET_DICTIONARY", "TARGET_TYPE")
+    # FK column into a table that does not hold it
+    assert table_end(catalog, "ENZYME_TID", "TARGET_DICTIONARY") == ("TARGET_DICTIONARY", "ENZYME_TID")
@@ -0,0 +1,32 @@
+import networkx as nx
+import pytest
+
+from find_shortest_path import load_graph
+from join_costs import CostWeightedPaths
+from join_planner import JoinPlanner
+from schema_catalog import load_catalog
+
+TERMINALS = ["ALOGP", "BLACK_BOX_WARNING", "MAX_PHASE", "STANDARD_VALUE"]
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_plan_is_a_tree_with_terminal_leaves(weighted):
+    catalog = load_catalog()
+    graph = load_graph()
+    planner = JoinPlanner(CostWeightedPaths(graph, catalog) if weighted else graph, catalog)
+    plan = planner.plan(TERMINALS)
+    tree = nx.Graph(plan.edges)
+    assert nx.is_tree(tree)
+    assert {(c, "column") for c in TERMINALS} <= set(tree.nodes)
+    leaves = {node for node, degree in tree.degree if degree == 1}
+    assert leaves <= {(c, "column") for c in TERMINALS}
+    assert plan.tables == sorted(name for name, node_type in tree.nodes if node_type == "table")
+
+
+def test_memo_keeps_the_most_recent_plans():
+    planner = JoinPlanner(load_graph(), memo_entries=2)
+    first = planner.plan(TERMINALS[:2])
+    planner.plan(TERMINALS[1:3])
+    assert planner.plan(TERMINALS[:2]) is first
+    planner.plan(TERMINALS[2:])
+    assert list(planner.memo) == [frozenset(TERMINALS[:2]), frozenset(TERMINALS[2:])]
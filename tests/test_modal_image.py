@@ -0,0 +1,67 @@
+import ast
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def is_main_block(node):
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+def imported_modules(file_path):
+    # Every module imported anywhere in the file (lazy imports included),
+    # except under `if __name__ == "__main__":`
+    with open(file_path) as f:
+        tree = ast.parse(f.read())
+    modules = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if is_main_block(node):
+            continue
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module.split(".")[0])
+        stack.extend(ast.iter_child_nodes(node))
+    return modules
+
+
+def local_imports(entry):
+    # Repository modules reachable from entry through imports
+    seen, frontier = set(), [entry]
+    while frontier:
+        module = frontier.pop()
+        for name in imported_modules(os.path.join(ROOT, f"{module}.py")):
+            if name not in seen and os.path.exists(os.path.join(ROOT, f"{name}.py")):
+                seen.add(name)
+                frontier.append(name)
+    return seen
+
+
+def image_files():
+    # Sources of the image's copy_local_file/copy_local_dir calls
+    with open(os.path.join(ROOT, "modal_endpoint.py")) as f:
+        tree = ast.parse(f.read())
+    return {
+        node.args[0].value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in ("copy_local_file", "copy_local_dir")
+    }
+
+
+def test_image_copies_every_local_import():
+    missing = {f"{m}.py" for m in local_imports("modal_endpoint")} - image_files()
+    assert not missing, f"modal_endpoint.py's image lacks {sorted(missing)}"
+
+
+def test_image_copies_existing_paths():
+    missing = [p for p in image_files() if not os.path.exists(os.path.join(ROOT, p))]
+    assert not missing
@@ -0,0 +1,57 @@
+import random
+
+import numpy as np
+import pytest
+
+from csr_graph import CSRGraph, node_id
+from find_shortest_path import find_shortest_path, find_shortest_paths, load_graph
+from join_costs import CostWeightedPaths
+from path_table import all_pairs_predecessors
+from schema_catalog import load_catalog
+
+
+def sample_pairs(catalog, n=300):
+    rng = random.Random(0)
+    return [tuple(rng.sample(catalog.column_names, 2)) for _ in range(n)]
+
+
+@pytest.mark.parametrize("predecessors", [False, True])
+def test_batch_matches_single_pair_search(predecessors):
+    catalog = load_catalog()
+    graph = load_graph()
+    graph.predecessors = all_pairs_predecessors(graph) if predecessors else None
+    pairs = sample_pairs(catalog)
+    for (start, end), path in zip(pairs, find_shortest_paths(graph, pairs, catalog)):
+        expected = find_shortest_path(graph, start, end, catalog)
+        # Ties may break differently; the hop count may not
+        assert (path and len(path)) == (expected and len(expected))
+        if path:
+            assert (path[0][0], path[-1][0]) == (catalog.resolve_column(start), catalog.resolve_column(end))
+
+
+def test_weighted_batch_matches_single_pair_cost():
+    catalog = load_catalog()
+    graph = CostWeightedPaths(load_graph(), catalog, {})
+    index = graph.graph.index
+    pairs = sample_pairs(catalog)
+    for (start, end), path in zip(pairs, find_shortest_paths(graph, pairs, catalog)):
+        start, end = catalog.resolve_column(start), catalog.resolve_column(end)
+        if path is None:
+            assert find_shortest_path(graph, start, end) is None
+            continue
+        ids = [index[node_id(*node)] for node in path]
+        cost = sum(graph.matrix[u, v] for u, v in zip(ids, ids[1:]))
+        assert cost == pytest.approx(graph.path_cost(start, end))
+
+
+def test_shipped_predecessors_match_the_graph():
+    graph = load_graph()
+    assert np.array_equal(graph.predecessors, all_pairs_predecessors(graph))
+
+
+def test_oversized_graph_is_refused():
+    n = 2**15
+    nodes = [node_id(f"C{i}") for i in range(n)]
+    graph = CSRGraph(nodes, np.zeros(n, dtype=np.int8), np.zeros(n + 1, dtype=np.int64), np.zeros(0, dtype=np.int32))
+    with pytest.raises(ValueError):
+        all_pairs_predecessors(graph)
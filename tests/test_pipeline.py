@@ -0,0 +1,128 @@
+import os
+
+import pytest
+
+from column_retriever import load_retriever
+from cost_gate import GatedExecutor, LocalDryRun
+from executors import DuckDBExecutor, Executor, QueryFailed, detect_release
+from find_shortest_path import load_graph
+from join_costs import CostWeightedPaths
+from join_planner import JoinPlanner
+from path_cache import PathCache
+from pipeline import Pipeline
+from result_cache import CachedExecutor, ResultCache
+from schema_catalog import load_catalog
+from sql_cache import SQLCache
+
+
+class ScriptedLLM:
+    """Answers invoke() with canned replies, in order, and records prompts."""
+
+    class Reply:
+        def __init__(self, content):
+            self.content = content
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.prompts = []
+
+    def invoke(self, messages):
+        self.prompts.append(messages)
+        return self.Reply(self.replies.pop(0))
+
+
+def make_pipeline(tmp_path, backend, llm):
+    catalog = load_catalog()
+    graph = CostWeightedPaths(load_graph(), catalog, {})
+    estimator = LocalDryRun(catalog, {}, validator=backend)
+    executor = CachedExecutor(GatedExecutor(backend, estimator, catalog=catalog), ResultCache(tmp_path / "results"))
+    return Pipeline(
+        catalog, load_retriever(catalog=catalog), graph, JoinPlanner(graph, catalog), llm, executor,
+        SQLCache(os.path.join(tmp_path, "sql.sqlite")), path_cache=PathCache(os.path.join(tmp_path, "paths.sqlite")),
+    )
+
+
+def test_compiled_join_needs_no_llm(tmp_path, standin):
+    pipeline = make_pipeline(tmp_path, standin, ScriptedLLM())
+    result = pipeline.answer("What is the correlation between ALogP and black box warning?")
+    assert result["success"] and "alogp" in result["data"]
+    # Second time round the SQL and the rows come from the caches
+    assert pipeline.answer("What is the correlation between ALogP and black box warning?") == result
+    assert pipeline.sql_cache.stats()["hits"] == 1
+    assert pipeline.executor.cache.stats()["hits"] == 1
+
+
+def test_llm_picks_columns_from_every_column(tmp_path, standin):
+    llm = ScriptedLLM("MAX_PHASE, STANDARD_VALUE")
+    pipeline = make_pipeline(tmp_path, standin, llm)
+    question = "Do later-stage drugs show stronger measured potency?"
+    result = pipeline.answer(question)
+    assert result["success"]
+    assert len(llm.prompts) == 1
+    # The shortlist is only a hint; a column it missed can still be picked
+    _, candidates = pipeline.retriever.select(question, k=pipeline.retriever_top_k)
+    prompt = llm.prompts[0][-1][1]
+    assert pipeline.catalog.columns_csv in prompt and ",".join(candidates) in prompt
+
+
+def test_llm_sql_is_validated_and_repaired(tmp_path, standin):
+    query = (
+        "SELECT m.pref_name, c.alogp FROM `bigquery-public-data.ebi_chembl.molecule_dictionary` m "
+        "JOIN `bigquery-public-data.ebi_chembl.compound_properties` c ON m.molregno = c.molregno LIMIT 10"
+    )
+    llm = ScriptedLLM("SELECT nope FROM `bigquery-public-data.ebi_chembl.no_such_table`", query)
+    pipeline = make_pipeline(tmp_path, standin, llm)
+    result = pipeline.generate_sql(["PREF_NAME", "ALOGP"], path=None)
+    assert result == (query, [])
+    assert len(llm.prompts) == 2
+
+
+def test_repair_prompt_shows_the_path_tables(tmp_path, standin):
+    # The bad query names no known table; the repair prompt still needs a schema
+    llm = ScriptedLLM("SELECT nope FROM `bigquery-public-data.ebi_chembl.no_such_table`", "SELECT 1")
+    pipeline = make_pipeline(tmp_path, standin, llm)
+    path = pipeline.graph.shortest_path("ALOGP", "BLACK_BOX_WARNING")
+    pipeline.generate_sql(["ALOGP", "BLACK_BOX_WARNING"], path=path)
+    repair_prompt = llm.prompts[1][1][1]
+    for table_name in ("COMPOUND_PROPERTIES", "MOLECULE_DICTIONARY"):
+        assert f"Table: {table_name}\n" in repair_prompt
+
+
+class FailFirstRun(Executor):
+    """Runs queries on `executor`, except the first non-EXPLAIN one, which
+    hits a DuckDB runtime error instead."""
+
+    def __init__(self, executor):
+        self.executor = executor
+        self.tables = getattr(executor, "tables", set())
+        self.queries = []
+
+    def run(self, query):
+        if query.startswith("EXPLAIN"):
+            return self.executor.run(query)
+        self.queries.append(query)
+        if len(self.queries) == 1:
+            return self.executor.run("SELECT CAST('not a number' AS INTEGER)")
+        return self.executor.run(query)
+
+
+def test_execution_error_falls_through_to_the_next_path(tmp_path, standin):
+    backend = FailFirstRun(standin)
+    pipeline = make_pipeline(tmp_path, backend, ScriptedLLM())
+    result = pipeline.answer("What is the correlation between ALogP and black box warning?")
+    assert result["success"]
+    assert len(backend.queries) == 2 and backend.queries[0] != backend.queries[1]
+    # The query that ran, not the one that failed, is cached
+    assert pipeline.sql_cache.get(["ALOGP", "BLACK_BOX_WARNING"], pipeline.catalog.version) == backend.queries[1]
+
+
+def test_duckdb_errors_surface_as_query_failed(standin):
+    with pytest.raises(QueryFailed):
+        standin.run("SELECT CAST('not a number' AS INTEGER)")
+
+
+def test_detect_release_without_a_version_table():
+    empty = DuckDBExecutor(catalog=load_catalog())
+    assert detect_release(empty, default="unknown") == "unknown"
+    with pytest.raises(LookupError):
+        detect_release(empty)
@@ -0,0 +1,50 @@
+import pytest
+
+from result_cache import fingerprint
+
+SELECT = "SELECT pref_name FROM `bigquery-public-data.ebi_chembl.molecule_dictionary` WHERE pref_name "
+
+
+def test_fingerprint_normalizes_comments_case_and_aliases():
+    assert fingerprint(
+        "select m.pref_name -- names\nFROM `bigquery-public-data.ebi_chembl.molecule_dictionary` AS m /* all */"
+    ) == fingerprint("SELECT x.pref_name FROM `bigquery-public-data.ebi_chembl.molecule_dictionary` x")
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (SELECT + "LIKE 'A--%' LIMIT 5", SELECT + "LIKE 'A--B%' AND max_phase = 4 LIMIT 500"),
+        (SELECT + "LIKE 'A/*%' LIMIT 5", SELECT + "LIKE 'A/*B%' LIMIT 5 -- */"),
+        (SELECT + "= 'A'", SELECT + "= 'a'"),
+    ],
+)
+def test_fingerprint_keeps_literals_apart(first, second):
+    assert fingerprint(first) != fingerprint(second)
+
+
+def test_fingerprint_keeps_comment_markers_inside_literals():
+    query = SELECT + "LIKE 'A--B%' AND max_phase = 4 LIMIT 500"
+    assert fingerprint(query).endswith("'A--B%' AND max_phase = 4 LIMIT 500")
+
+
+def test_fingerprint_ignores_quotes_inside_comments():
+    assert fingerprint(SELECT + "= 'A' -- don't\nLIMIT 5") == fingerprint(SELECT + "= 'A' LIMIT 5")
+
+
+@pytest.mark.parametrize("other", ["INTERSECT DISTINCT", "UNION DISTINCT", "UNION ALL"])
+def test_fingerprint_keeps_set_operations_apart(other):
+    query = SELECT + "= 'A' {} " + SELECT + "= 'B'"
+    assert fingerprint(query.format("EXCEPT DISTINCT")) != fingerprint(query.format(other))
+
+
+def test_fingerprint_renames_aliases_in_subqueries():
+    query = (
+        "SELECT {0}.pref_name FROM `bigquery-public-data.ebi_chembl.molecule_dictionary` {0} WHERE {0}.molregno "
+        "IN (SELECT {1}.molregno FROM `bigquery-public-data.ebi_chembl.drug_warning` AS {1})"
+    )
+    assert fingerprint(query.format("a", "b")) == fingerprint(query.format("m", "w"))
+
+
+def test_fingerprint_of_unparsable_sql_drops_comments():
+    assert fingerprint("SELECT a FROM t WHERE ( -- x\n'--' /* y */") == "SELECT a FROM t WHERE ( '--'"
@@ -0,0 +1,82 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from executors import DuckDBExecutor
+from schema_catalog import load_catalog
+from schema_importer import InformationSchema, SQLiteInformationSchema, import_schema, oracle_type
+from schema_model import KeyType
+
+
+def create_table_sql(table):
+    # schema.json's keys as SQLite constraints: one PRIMARY KEY, one UNIQUE
+    # over the UK columns, and a FOREIGN KEY per FK column
+    columns = [
+        f'"{c.name}" {c.data_type}' + (" NOT NULL" if c.nullable == "NOT NULL" else "") for c in table.columns
+    ]
+    for key, clause in ((KeyType.PK, "PRIMARY KEY"), (KeyType.UK, "UNIQUE")):
+        names = [f'"{c.name}"' for c in table.columns if key in c.keys]
+        if names:
+            columns.append(f"{clause} ({', '.join(names)})")
+    columns += [
+        f'FOREIGN KEY ("{c.name}") REFERENCES "{table.name}" ("{c.name}")'
+        for c in table.columns
+        if KeyType.FK in c.keys
+    ]
+    return f'CREATE TABLE "{table.name}" ({", ".join(columns)})'
+
+
+def engine_view(table):
+    # What an engine can know: schema.json has two rows whose comment was
+    # parsed into Nullable, which a NOT NULL constraint cannot express
+    return [
+        (c.name, c.data_type, c.keys, c.nullable if c.nullable == "NOT NULL" else None, c.comment)
+        for c in table.columns
+    ]
+
+
+@pytest.fixture(scope="module")
+def sqlite_standin(tmp_path_factory):
+    file_path = tmp_path_factory.mktemp("standin") / "chembl.db"
+    with closing(sqlite3.connect(file_path)) as db:
+        for table in load_catalog().schema:
+            db.execute(create_table_sql(table))
+        db.commit()
+    return str(file_path)
+
+
+def test_oracle_type():
+    assert oracle_type("VARCHAR(50)") == "VARCHAR2(50)"
+    assert oracle_type("DECIMAL(9, 2)") == "NUMBER(9,2)"
+    assert oracle_type("INT64") == "NUMBER"
+    assert oracle_type("TIMESTAMP") == "DATE"
+    assert oracle_type("TEXT") == "CLOB"
+
+
+def test_sqlite_import_matches_schema_json(sqlite_standin):
+    schema = load_catalog().schema
+    imported = import_schema(SQLiteInformationSchema(sqlite_standin), schema, workers=4)
+    assert [t.name for t in imported] == [t.name for t in schema]
+    for table, expected in zip(imported, schema):
+        assert engine_view(table) == engine_view(expected), table.name
+
+
+def test_sqlite_import_without_documentation_keeps_engine_facts(sqlite_standin):
+    imported = {t.name: t for t in import_schema(SQLiteInformationSchema(sqlite_standin), workers=4)}
+    for expected in load_catalog().schema:
+        table = imported[expected.name]
+        assert [c.name for c in table.columns] == [c.name for c in expected.columns]
+        assert [c.keys for c in table.columns] == [c.keys for c in expected.columns]
+        assert [c[3] for c in engine_view(table)] == [c[3] for c in engine_view(expected)]
+
+
+def test_duckdb_import_takes_keys_from_documentation():
+    # DuckDBExecutor declares no constraints, like BigQuery's public dataset
+    catalog = load_catalog()
+    imported = import_schema(InformationSchema(DuckDBExecutor(catalog=catalog)), catalog.schema, workers=4)
+    for table, expected in zip(imported, catalog.schema):
+        assert table.name == expected.name
+        assert [(c.name, c.data_type, c.keys, c.comment) for c in table.columns] == [
+            (c.name, c.data_type, c.keys, c.comment) for c in expected.columns
+        ]
@@ -0,0 +1,36 @@
+from schema_parser import iter_schema, parse_schema
+
+DOCUMENTATION = """MOLECULE_DICTIONARY:
+Non redundant list of compounds.
+
+KEYS  COLUMN_NAME  DATA_TYPE  NULLABLE  COMMENT
+PK  MOLREGNO  NUMBER(9,0)  NOT NULL  Internal Primary Key for the molecule
+PK
+  PREF_NAME  VARCHAR2(255)    Preferred name for the molecule
+FK  CHEBI PAR ID  NUMBER(9,0)    Truncated row
+"""
+
+
+def write_documentation(tmp_path):
+    file_path = tmp_path / "schema_documentation.txt"
+    file_path.write_text(DOCUMENTATION)
+    return str(file_path)
+
+
+def test_malformed_rows_reach_on_skip(tmp_path):
+    skipped = []
+    tables = list(iter_schema(write_documentation(tmp_path), lambda *args: skipped.append(args)))
+    assert [c.name for c in tables[0].columns] == ["MOLREGNO", "PREF_NAME"]
+    assert [(n, line, type(e)) for n, line, e in skipped] == [
+        (6, "PK", IndexError),
+        (8, "FK  CHEBI PAR ID  NUMBER(9,0)    Truncated row", ValueError),
+    ]
+
+
+def test_skips_are_reported_on_stderr(tmp_path, capsys):
+    file_path = write_documentation(tmp_path)
+    parse_schema(file_path)
+    assert capsys.readouterr().err.splitlines() == [
+        f"{file_path}:6: skipped line (IndexError): PK",
+        f"{file_path}:8: skipped line (ValueError): FK  CHEBI PAR ID  NUMBER(9,0)    Truncated row",
+    ]
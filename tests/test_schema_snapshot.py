@@ -0,0 +1,22 @@
+import os
+
+from schema_catalog import SchemaCatalog, load_catalog
+from schema_snapshot import load_snapshot
+
+SNAPSHOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schema.bin")
+
+
+def test_snapshot_round_trips_schema_json():
+    assert list(load_snapshot(SNAPSHOT)) == list(load_catalog().schema)
+
+
+def test_catalog_over_a_snapshot_decodes_tables_on_demand():
+    catalog = SchemaCatalog.from_file(SNAPSHOT)
+    decoded = catalog.schema._tables
+    assert not any(decoded)
+    reference = load_catalog()
+    for index in ("columns_by_table", "tables_by_column", "key_types", "fk_edges", "links", "column_names"):
+        assert getattr(catalog, index) == getattr(reference, index)
+    assert list(catalog.tables) == list(reference.tables)
+    assert catalog.table("activities") == reference.table("ACTIVITIES")
+    assert sum(table is not None for table in decoded) == 1
@@ -0,0 +1,15 @@
+from schema_catalog import SchemaCatalog, load_catalog
+from schema_store import SchemaStore
+
+
+def test_bundled_files_match_the_store():
+    # schema.json, columns.txt and schema.bin are exports of the bundled release
+    assert SchemaStore().check("bundled") == []
+
+
+def test_one_version_for_every_source():
+    version = SchemaStore().manifest_hash("bundled")
+    assert load_catalog().version == version
+    assert SchemaCatalog.from_file("schema.bin").version == version
+    assert SchemaCatalog(load_catalog().schema).version == version
+    assert SchemaStore().catalog("bundled").version == version
@@ -0,0 +1,61 @@
+import re
+
+from find_shortest_path import load_graph
+from join_planner import JoinPlan, JoinPlanner
+from schema_catalog import load_catalog
+from sql_compiler import compile_plan
+
+
+def column(name):
+    return name, "column"
+
+
+def table(name):
+    return name, "table"
+
+
+def selected_tables(query):
+    # {column: table it is read from}, through the FROM/JOIN aliases
+    aliases = dict((alias, name.upper()) for name, alias in re.findall(r"\.(\w+)` AS (t\d+)", query))
+    select = query.splitlines()[0].removeprefix("SELECT ")
+    return {name.upper(): aliases[alias] for alias, name in (c.split(".") for c in select.split(", "))}
+
+
+def test_multi_table_plan_runs(standin):
+    catalog = load_catalog()
+    terminals = ["ALOGP", "BLACK_BOX_WARNING", "MAX_PHASE", "STANDARD_VALUE"]
+    plan = JoinPlanner(load_graph(), catalog).plan(terminals)
+    query = compile_plan(plan, catalog)
+    assert query.count("\nJOIN ") == len(plan.tables) - 1
+    # The stand-in binds every name, so an unjoined table or bad alias fails here
+    assert list(standin.run(query).columns) == [c.lower() for c in plan.terminals]
+    for name, home in selected_tables(query).items():
+        assert home in plan.tables and name in catalog.columns_by_table[home]
+
+
+def test_shared_column_is_qualified(standin):
+    # MOLREGNO is in both tables; bare, DuckDB and BigQuery call it ambiguous
+    catalog = load_catalog()
+    plan = JoinPlan(
+        ("ALOGP", "MOLREGNO"),
+        ["COMPOUND_PROPERTIES", "MOLECULE_DICTIONARY"],
+        [
+            (column("ALOGP"), table("COMPOUND_PROPERTIES")),
+            (table("COMPOUND_PROPERTIES"), column("MOLREGNO")),
+            (column("MOLREGNO"), table("MOLECULE_DICTIONARY")),
+        ],
+    )
+    query = compile_plan(plan, catalog)
+    assert query.splitlines()[0] == "SELECT t1.alogp, t1.molregno"
+    assert "ON t1.molregno = t2.molregno" in query
+    assert len(standin.run(query).columns) == 2
+
+
+def test_terminal_without_a_home_table_is_left_to_the_llm():
+    # STANDARD_VALUE hangs off a table that does not hold it
+    plan = JoinPlan(
+        ("ALOGP", "STANDARD_VALUE"),
+        ["COMPOUND_PROPERTIES"],
+        [(column("ALOGP"), table("COMPOUND_PROPERTIES")), (table("COMPOUND_PROPERTIES"), column("STANDARD_VALUE"))],
+    )
+    assert compile_plan(plan, load_catalog()) is None
@@ -0,0 +1,17 @@
+import pytest
+
+from sql_validator import extract_sql
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        "```SELECT a FROM t LIMIT 1```",
+        "```sql\nSELECT a FROM t LIMIT 1\n```",
+        "```SQL \nSELECT a FROM t LIMIT 1```",
+        "Here you go:\n```\nSELECT a FROM t LIMIT 1\n```\nDone.",
+        "SELECT a FROM t LIMIT 1",
+    ],
+)
+def test_extract_sql_keeps_the_first_keyword(reply):
+    assert extract_sql(reply) == "SELECT a FROM t LIMIT 1"
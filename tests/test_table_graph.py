@@ -0,0 +1,27 @@
+import random
+
+import networkx as nx
+
+from schema_catalog import load_catalog
+from table_graph import load_table_graph
+
+
+def test_table_paths_take_the_fewest_joins():
+    catalog = load_catalog()
+    graph = load_table_graph()
+    lengths = dict(nx.all_pairs_shortest_path_length(graph.to_networkx()))
+    rng = random.Random(0)
+    for start, end in (tuple(rng.sample(catalog.column_names, 2)) for _ in range(300)):
+        sources, targets = graph.entry_tables(start), graph.entry_tables(end)
+        best = min(
+            (lengths[graph.nodes[s]].get(graph.nodes[t], float("inf")) for s in sources for t in targets),
+            default=float("inf"),
+        )
+        paths = graph.table_paths(start, end)
+        if best == float("inf"):
+            assert paths == []
+            continue
+        (path,) = paths
+        assert len(path) - 1 == best
+        assert path[0] in sources and path[-1] in targets
+        assert all(v in graph.neighbors_of(u) for u, v in zip(path, path[1:]))